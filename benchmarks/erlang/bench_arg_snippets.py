@@ -0,0 +1,120 @@
+"""
+Benchmark of memoization of code snippets generated for error arguments
+(see `generators.erlang.error_args.snippet_cache`).
+
+Error type modules of actual and synthetic definitions are rendered with and
+without the snippet cache. Besides timings, it checks that the rendered code
+is exactly the same in both cases and fails otherwise:
+
+    python -m benchmarks.erlang.bench_arg_snippets
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import List, Optional, Tuple
+
+from generators.erlang.constants import ERROR_DEFINITIONS_ROOT_DIR
+from generators.erlang.error_args.snippet_cache import snippet_cache
+from generators.erlang.error_definitions import OdError
+from generators.erlang.generators.error_types import render_error_type
+from generators.erlang.loaders.error_definitions_loader import load_error_definitions
+from generators.erlang.loaders.template_loader import load_templates
+
+from .corpus import build_corpus
+
+DEFAULT_SIZE: int = 10000
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+
+    template = load_templates().error
+    od_errors = _load_errors() + _load_synthetic_errors(args.size)
+
+    snippet_cache.enabled = False
+    uncached_time, uncached_modules = _render_all(od_errors, template)
+
+    snippet_cache.enabled = True
+    snippet_cache.clear()
+    cached_time, cached_modules = _render_all(od_errors, template)
+    stats = snippet_cache.get_stats()
+
+    print(f"Rendered {len(od_errors)} error type modules:")
+    print(f"    without snippet cache {uncached_time:>10.4f}s")
+    print(f"    with snippet cache    {cached_time:>10.4f}s")
+    print(f"    snippet cache hits: {stats.hits}, misses: {stats.misses}")
+
+    mismatched = [
+        od_error.name
+        for (_, od_error), uncached, cached in zip(
+            od_errors, uncached_modules, cached_modules
+        )
+        if uncached != cached
+    ]
+    if mismatched:
+        print(f"Output differs for {len(mismatched)} errors: {', '.join(mismatched)}")
+        sys.exit(1)
+
+    print("Output is identical")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.erlang.bench_arg_snippets",
+        description=(
+            "Benchmarks memoization of error argument snippets and checks it "
+            "does not change generated code."
+        ),
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=DEFAULT_SIZE,
+        metavar="N",
+        help=(
+            "number of synthetic errors rendered in addition to actual ones "
+            "(default: %(default)s)"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def _load_errors() -> List[Tuple[str, OdError]]:
+    return [
+        (group.name, od_error)
+        for group in load_error_definitions()
+        for od_error in group.errors
+    ]
+
+
+def _load_synthetic_errors(error_count: int) -> List[Tuple[str, OdError]]:
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench_arg_snippets_") as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            build_corpus(ERROR_DEFINITIONS_ROOT_DIR, error_count)
+            return _load_errors()
+        finally:
+            os.chdir(cwd)
+
+
+def _render_all(
+    od_errors: List[Tuple[str, OdError]], template: str
+) -> Tuple[float, List[str]]:
+    start = time.perf_counter()
+    modules = [
+        render_error_type(od_error, group_name, template)
+        for group_name, od_error in od_errors
+    ]
+    return time.perf_counter() - start, modules
+
+
+if __name__ == "__main__":
+    main()
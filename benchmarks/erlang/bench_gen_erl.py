@@ -0,0 +1,220 @@
+"""
+Benchmark of the Erlang generator on synthetic definition trees.
+
+Each phase of the generation (as done by `gen_erl.main`) is timed separately
+and results are saved as JSON, so that they can be compared between commits:
+
+    python -m benchmarks.erlang.bench_gen_erl --output new.json --compare old.json
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from generators.erlang.constants import ERROR_DEFINITIONS_ROOT_DIR, OUTPUT_DIR
+from generators.erlang.generators.error_types import generate_error_types
+from generators.erlang.generators.errors_headers import generate_errors_headers
+from generators.erlang.generators.od_error import (
+    generate_od_error_behaviour,
+    generate_version,
+)
+from generators.erlang.generators.utils import reset_generated_files
+from generators.erlang.loaders.error_definitions_loader import load_error_definitions
+from generators.erlang.loaders.template_loader import load_templates
+
+from .corpus import build_corpus
+
+DEFAULT_SIZES: List[int] = [1000, 10000, 100000]
+DEFAULT_OUTPUT_PATH: str = "generated/benchmarks/erlang.json"
+RESULTS_VERSION: int = 1
+
+PHASES: List[str] = [
+    "load_templates",
+    "load_error_definitions",
+    "generate_errors_headers",
+    "generate_od_error_behaviour",
+    "generate_error_types",
+]
+
+T = TypeVar("T")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+
+    results = {
+        "version": RESULTS_VERSION,
+        "revision": generate_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jobs": args.jobs,
+        "repeat": args.repeat,
+        "sizes": {
+            str(size): run_benchmark(size, repeat=args.repeat, jobs=args.jobs)
+            for size in args.sizes
+        },
+    }
+
+    save_results(results, args.output)
+    print_results(results)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), results)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.erlang.bench_gen_erl",
+        description="Benchmarks Erlang generator on synthetic error definitions.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        metavar="N",
+        help="numbers of errors in benchmarked definition trees (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of runs for each size (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of worker processes used by the generator (default: 1)",
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT_PATH,
+        help="file to save results to (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PREVIOUS_RESULTS",
+        help="results of previous run to compare with",
+    )
+    return parser.parse_args(argv)
+
+
+def run_benchmark(error_count: int, *, repeat: int, jobs: int) -> Dict[str, Any]:
+    """Times generation phases for synthetic tree of error_count errors.
+
+    The tree is built and the code generated in a temporary directory, as
+    paths used by the generator are relative to the working directory.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench_gen_erl_") as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            build_start = time.perf_counter()
+            build_corpus(ERROR_DEFINITIONS_ROOT_DIR, error_count)
+            build_time = time.perf_counter() - build_start
+
+            runs = [_run_phases(jobs=jobs) for _ in range(repeat)]
+        finally:
+            os.chdir(cwd)
+
+    phases = {}
+    for phase in [*PHASES, "total"]:
+        timings = [run[phase] for run in runs]
+        phases[phase] = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "runs": timings,
+        }
+
+    return {"corpus_build_time": build_time, "phases": phases}
+
+
+def save_results(results: Dict[str, Any], file_path: str) -> None:
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    for size, size_results in results["sizes"].items():
+        print(f"{size} errors:")
+        for phase, timings in size_results["phases"].items():
+            print(f"    {phase:<30} {timings['min']:>10.4f}s (min)")
+
+
+def print_comparison(old_results: Dict[str, Any], new_results: Dict[str, Any]) -> None:
+    """Prints relative change of min timings of phases present in both results."""
+    print(f"Compared with revision {old_results.get('revision')}:")
+    for size, size_results in new_results["sizes"].items():
+        old_phases = old_results["sizes"].get(size, {}).get("phases", {})
+        print(f"{size} errors:")
+        for phase, timings in size_results["phases"].items():
+            if phase not in old_phases:
+                continue
+
+            old_time = old_phases[phase]["min"]
+            new_time = timings["min"]
+            change = (new_time - old_time) / old_time * 100 if old_time else 0.0
+            print(
+                f"    {phase:<30} {old_time:>10.4f}s -> {new_time:>10.4f}s "
+                f"({change:+.1f}%)"
+            )
+
+
+def _run_phases(*, jobs: int) -> Dict[str, float]:
+    # Start each run from scratch - unchanged files would not be rewritten otherwise
+    shutil.rmtree(OUTPUT_DIR, ignore_errors=True)
+    reset_generated_files()
+
+    timings: Dict[str, float] = {}
+    templates = _timed(timings, "load_templates", load_templates)
+    error_groups = _timed(
+        timings,
+        "load_error_definitions",
+        lambda: load_error_definitions(jobs=jobs, use_cache=False),
+    )
+    _timed(
+        timings,
+        "generate_errors_headers",
+        lambda: generate_errors_headers(error_groups, templates),
+    )
+    _timed(
+        timings,
+        "generate_od_error_behaviour",
+        lambda: generate_od_error_behaviour(
+            templates.od_error, error_groups, generate_version()
+        ),
+    )
+    _timed(
+        timings,
+        "generate_error_types",
+        lambda: generate_error_types(error_groups, templates.error, jobs=jobs),
+    )
+    timings["total"] = sum(timings.values())
+
+    return timings
+
+
+def _timed(timings: Dict[str, float], phase: str, fun: Callable[[], T]) -> T:
+    start = time.perf_counter()
+    result = fun()
+    timings[phase] = time.perf_counter() - start
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Generator of micro-benchmark of local helpers used in optimized output profile
+(see `generators.erlang.generators.local_helpers`).
+
+Generated Erlang module compares, for typical arguments, calls of remote
+helpers with calls of their local copies compiled inline:
+
+    python -m benchmarks.erlang.bench_local_helpers
+
+It is to be compiled along with generated modules (and ctool), e.g.:
+
+    local_helpers_bench:run().
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import argparse
+import os
+from typing import List, NamedTuple, Optional
+
+from generators.erlang.constants import INDENT
+from generators.erlang.generators.local_helpers import (
+    LOCAL_HELPERS,
+    LocalHelper,
+    render_inline_attribute,
+)
+
+DEFAULT_OUTPUT_PATH: str = "generated/benchmarks/local_helpers_bench.erl"
+
+
+class BenchmarkCase(NamedTuple):
+    helper: str
+    arg: str
+
+
+BENCHMARK_CASES: List[BenchmarkCase] = [
+    BenchmarkCase("undefined_to_null", "undefined"),
+    BenchmarkCase("undefined_to_null", '<<"value">>'),
+    BenchmarkCase("null_to_undefined", "null"),
+    BenchmarkCase("null_to_undefined", '<<"value">>'),
+    BenchmarkCase("format_csv", '[<<"posix">>, <<"s3">>, <<"ceph">>]'),
+    BenchmarkCase("to_binary", '<<"/space/dir/file">>'),
+    BenchmarkCase("to_binary", "file"),
+]
+
+MODULE_TEMPLATE: str = """\
+%%%-------------------------------------------------------------------
+%%% This file has been automatically generated - DO NOT EDIT!!!
+%%%
+%%% @doc
+%%% Benchmark of calls of remote helpers and of local helpers compiled
+%%% inline (used by generated modules in optimized output profile).
+%%%
+%%% It is to be compiled along with generated modules (and ctool), e.g.:
+%%%     local_helpers_bench:run().
+%%% @end
+%%%-------------------------------------------------------------------
+-module(local_helpers_bench).
+
+-include("errors.hrl").
+
+%% API
+-export([run/0, run/1]).
+
+{compile_attributes}
+
+%% Loop calling helper given number of times (see Loops section)
+-type loop() :: fun((term(), non_neg_integer(), term()) -> term()).
+
+-define(DEFAULT_ITERATIONS, 1000000).
+
+
+%%%===================================================================
+%%% API
+%%%===================================================================
+
+
+-spec run() -> ok.
+run() ->
+    run(?DEFAULT_ITERATIONS).
+
+
+-spec run(pos_integer()) -> ok.
+run(Iterations) ->
+    io:format("~-60s ~15s ~15s~n", ["Call", "Remote [ns]", "Local [ns]"]),
+    lists:foreach(fun({{Name, RemoteLoop, LocalLoop, Arg}}) ->
+        RemoteTime = measure(RemoteLoop, Arg, Iterations),
+        LocalTime = measure(LocalLoop, Arg, Iterations),
+        io:format("~-60s ~15.1f ~15.1f~n", [Name, RemoteTime, LocalTime])
+    end, cases()).
+
+
+%%%===================================================================
+%%% Internal functions
+%%%===================================================================
+
+
+%% @private
+-spec cases() -> [{{string(), loop(), loop(), term()}}].
+cases() ->
+    [
+{cases}
+    ].
+
+
+%% @private
+-spec measure(loop(), term(), pos_integer()) -> float().
+measure(Loop, Arg, Iterations) ->
+    {{Time, _}} = timer:tc(fun() -> Loop(Arg, Iterations, undefined) end),
+    Time * 1000 / Iterations.
+
+
+%%%===================================================================
+%%% Loops
+%%%
+%%% Result of each call is passed to the next iteration so that the
+%%% compiler can not eliminate inlined calls.
+%%%===================================================================
+
+
+{loops}
+
+
+%%%===================================================================
+%%% Local helpers
+%%%===================================================================
+
+
+{helpers}
+"""
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(render_benchmark_module())
+
+    print(f"Benchmark module saved to {args.output}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate micro-benchmark of local helpers (Erlang module)."
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT_PATH,
+        help=f"Path of the generated module (default: {DEFAULT_OUTPUT_PATH})",
+    )
+    return parser.parse_args(argv)
+
+
+def render_benchmark_module() -> str:
+    helpers = {helper.name: helper for helper in LOCAL_HELPERS}
+
+    cases = ",\n".join(
+        f'{INDENT * 2}{{"{helpers[case.helper].remote_function}({_escape(case.arg)})", '
+        f"fun remote_{case.helper}/3, fun local_{case.helper}/3, {case.arg}}}"
+        for case in BENCHMARK_CASES
+    )
+
+    return MODULE_TEMPLATE.format(
+        compile_attributes=render_inline_attribute(LOCAL_HELPERS),
+        cases=cases,
+        loops="\n\n\n".join(
+            _render_loop(prefix, function, helper)
+            for helper in LOCAL_HELPERS
+            for prefix, function in [
+                ("remote", helper.remote_function),
+                ("local", helper.name),
+            ]
+        ),
+        helpers="\n\n\n".join(helper.definition for helper in LOCAL_HELPERS),
+    )
+
+
+def _render_loop(prefix: str, function: str, helper: LocalHelper) -> str:
+    loop = f"{prefix}_{helper.name}"
+    return (
+        f"%% @private\n"
+        f"-spec {loop}(term(), non_neg_integer(), term()) -> term().\n"
+        f"{loop}(_Arg, 0, Acc) ->\n"
+        f"{INDENT}Acc;\n"
+        f"{loop}(Arg, Iterations, _Acc) ->\n"
+        f"{INDENT}{loop}(Arg, Iterations - 1, {function}(Arg))."
+    )
+
+
+def _escape(arg: str) -> str:
+    return arg.replace("\\", "\\\\").replace('"', '\\"')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Builder of synthetic error definition trees used to benchmark the generator.
+
+Built definitions are deterministic (depend only on the number of errors) and
+mix all registered arg types, nullable and `print_if_null` args, deeply nested
+groups and `x-erl-*` overrides.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import os
+from typing import Any, Dict, List
+
+import yaml
+
+from generators.erlang.constants import HTTP_CODE_TO_MACRO, VALID_ERRNO
+from generators.erlang.error_args.loader import TypeLoader
+from generators.erlang.error_args.registry import TypeRegistry
+
+ERRORS_PER_GROUP: int = 50
+MAX_GROUP_DEPTH: int = 6
+MAX_ARGS: int = 4
+
+HTTP_CODES: List[int] = sorted(HTTP_CODE_TO_MACRO)
+ERRNOS: List[str] = sorted(VALID_ERRNO)
+
+
+def build_corpus(root_dir: str, error_count: int) -> None:
+    """Writes definitions of error_count synthetic errors into root_dir."""
+    TypeLoader.load_types()
+    type_names = TypeRegistry.get_type_names()
+
+    for index in range(error_count):
+        group_dir = os.path.join(root_dir, *get_group_path(index))
+        os.makedirs(group_dir, exist_ok=True)
+
+        file_path = os.path.join(group_dir, f"{get_error_name(index)}.yaml")
+        with open(file_path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(
+                build_definition(index, type_names), f, sort_keys=False, width=1000
+            )
+
+
+def get_group_path(index: int) -> List[str]:
+    group_index = index // ERRORS_PER_GROUP
+    depth = group_index % MAX_GROUP_DEPTH
+
+    return [
+        "bench",
+        *[f"level{level}" for level in range(depth)],
+        f"group{group_index}",
+    ]
+
+
+def get_error_name(index: int) -> str:
+    return f"bench_error_{index}"
+
+
+def build_definition(index: int, type_names: List[str]) -> Dict[str, Any]:
+    """Builds YAML definition of index-th synthetic error."""
+    name = get_error_name(index)
+    macro_name = f"ERR_{name.upper()}"
+
+    args = _build_args(index, type_names)
+    # Leave some args out of the description so that not all of them are printed
+    printed_args = [arg["name"] for arg_index, arg in enumerate(args) if arg_index != 2]
+
+    definition: Dict[str, Any] = {
+        "id": f"benchError{index}",
+        "args": args,
+        "description": " ".join(
+            [f"Benchmark error {index}", *[f"{{{arg}}}" for arg in printed_args]]
+        ),
+        "http_code": HTTP_CODES[index % len(HTTP_CODES)],
+    }
+    if index % 2 == 0:
+        definition["errno"] = ERRNOS[index % len(ERRNOS)]
+
+    if index % 20 == 7:
+        definition["x-erl-headers"] = {
+            "include": ["bench.hrl"],
+            "macros": [{"alias": "hint", "ref": "?BENCH_HINT"}],
+        }
+        definition["description"] += " {hint}"
+
+    if index % 20 == 13:
+        ignored_args = "".join(", _" for _ in args)
+        definition["x-erl-to_json"] = "\n".join(
+            [
+                f"to_json(?{macro_name}(ErrorCtx{ignored_args})) ->",
+                "    #{",
+                f'        <<"id">> => ?{macro_name}_ID,',
+                '        <<"ctx">> => od_error:ctx_to_json(ErrorCtx),',
+                f'        <<"description">> => <<"Benchmark error {index}.">>',
+                "    }.",
+            ]
+        )
+        undefined_args = "".join(", undefined" for _ in args)
+        definition["x-erl-from_json"] = "\n".join(
+            [
+                f'from_json(ErrorJson = #{{<<"id">> := ?{macro_name}_ID}}) ->',
+                '    ErrorCtxJson = maps:get(<<"ctx">>, ErrorJson, #{}),',
+                "    ErrorCtx = od_error:ctx_from_json(ErrorCtxJson),",
+                f"    ?{macro_name}(ErrorCtx{undefined_args}).",
+            ]
+        )
+
+    if index % 50 == 17:
+        definition["x-erl-to_errno"] = "\n".join(
+            [
+                "-spec to_errno(t()) -> {true, od_error:errno()}.",
+                "to_errno(_) ->",
+                "    {true, ?EAGAIN}.",
+            ]
+        )
+
+    return definition
+
+
+def _build_args(index: int, type_names: List[str]) -> List[Dict[str, Any]]:
+    args = []
+    for arg_index in range(index % (MAX_ARGS + 1)):
+        type_name = type_names[(index * MAX_ARGS + arg_index) % len(type_names)]
+        arg: Dict[str, Any] = {
+            "name": f"{type_name[0].lower()}{type_name[1:]}Arg{arg_index}",
+            "type": type_name,
+        }
+        if (index + arg_index) % 3 == 0:
+            arg["nullable"] = True
+            if (index + arg_index) % 2 == 0:
+                arg["print_if_null"] = "none"
+
+        args.append(arg)
+
+    return args
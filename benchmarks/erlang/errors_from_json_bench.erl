@@ -0,0 +1,92 @@
+%%%-------------------------------------------------------------------
+%%% @author Bartosz Walkowicz
+%%% @copyright (C) 2025 ACK CYFRONET AGH
+%%% This software is released under the MIT license
+%%% cited in 'LICENSE.txt'.
+%%% @end
+%%%-------------------------------------------------------------------
+%%% @doc
+%%% Benchmark of errors:from_json/1 for known, unknown and malformed payloads.
+%%% Each case is compared with the previous implementation (lookup in
+%%% ?ERROR_ID_TO_TYPE_MAPPING within try ... catch), kept here for reference.
+%%%
+%%% It is to be compiled along with generated modules (and ctool), e.g.:
+%%%     errors_from_json_bench:run().
+%%% @end
+%%%-------------------------------------------------------------------
+-module(errors_from_json_bench).
+-author("Bartosz Walkowicz").
+
+-include("error_attrs.hrl").
+
+%% API
+-export([run/0, run/1]).
+
+-define(DEFAULT_ITERATIONS, 100000).
+
+
+%%%===================================================================
+%%% API
+%%%===================================================================
+
+
+-spec run() -> ok.
+run() ->
+    run(?DEFAULT_ITERATIONS).
+
+
+-spec run(pos_integer()) -> ok.
+run(Iterations) ->
+    io:format("~-20s ~15s ~15s~n", ["Payload", "Current [ns]", "Previous [ns]"]),
+    lists:foreach(fun({Name, ErrorJson}) ->
+        CurrentTime = measure(fun errors:from_json/1, ErrorJson, Iterations),
+        PreviousTime = measure(fun previous_from_json/1, ErrorJson, Iterations),
+        io:format("~-20s ~15.1f ~15.1f~n", [Name, CurrentTime, PreviousTime])
+    end, payloads()).
+
+
+%%%===================================================================
+%%% Internal functions
+%%%===================================================================
+
+
+%% @private
+-spec payloads() -> [{string(), json_utils:json_map()}].
+payloads() ->
+    [
+        {"known", errors:to_json(?ERR_FORBIDDEN_WITH_HINT(<<"hint">>))},
+        {"known (no details)", errors:to_json(?ERR_BAD_BASIC_CREDENTIALS)},
+        {"unknown id", #{<<"id">> => <<"noSuchError">>, <<"description">> => <<"?">>}},
+        {"missing id", #{<<"description">> => <<"?">>}},
+        {"malformed details", #{<<"id">> => ?ERR_FORBIDDEN_WITH_HINT_ID}}
+    ].
+
+
+%% @private
+-spec measure(fun((json_utils:json_map()) -> errors:error()), json_utils:json_map(),
+    pos_integer()) -> float().
+measure(FromJsonFun, ErrorJson, Iterations) ->
+    {Time, ok} = timer:tc(fun() -> repeat(FromJsonFun, ErrorJson, Iterations) end),
+    Time * 1000 / Iterations.
+
+
+%% @private
+-spec repeat(fun((json_utils:json_map()) -> errors:error()), json_utils:json_map(),
+    non_neg_integer()) -> ok.
+repeat(_FromJsonFun, _ErrorJson, 0) ->
+    ok;
+repeat(FromJsonFun, ErrorJson, Iterations) ->
+    FromJsonFun(ErrorJson),
+    repeat(FromJsonFun, ErrorJson, Iterations - 1).
+
+
+%% @private
+-spec previous_from_json(json_utils:json_map()) -> errors:error().
+previous_from_json(ErrorJson) ->
+    try
+        ErrorId = maps:get(<<"id">>, ErrorJson),
+        ErrorType = maps:get(ErrorId, ?ERROR_ID_TO_TYPE_MAPPING),
+        ErrorType:from_json(ErrorJson)
+    catch _:_ ->
+        ?ERR_UNRECOGNIZED_ERROR(?err_ctx(), ErrorJson)
+    end.
@@ -0,0 +1,151 @@
+"""
+Benchmark of decoding error payloads with generated Python package (see
+`generators.python`) compared with ad-hoc decoding by dict lookups.
+
+Payloads of all errors (with sample args) are decoded in turns. Besides
+timings, it checks that every decoded error encodes back to exactly the same
+payload and fails otherwise:
+
+    python -m benchmarks.python.bench_from_json
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import argparse
+import importlib
+import itertools
+import sys
+import tempfile
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from generators.erlang.error_definitions import OdError
+from generators.erlang.loaders.error_definitions_loader import load_error_definitions
+from generators.python.arg_types import get_py_arg_type
+from generators.python.constants import PACKAGE_NAME
+from generators.python.gen_py import generate_package
+
+DEFAULT_PAYLOADS_COUNT: int = 1000000
+
+SAMPLE_CTX: Dict[str, Any] = {
+    "onedataErrorsRevision": "0123abcd",
+    "module": "sample_module",
+    "line": 42,
+    "timestamp": 1700000000000,
+    "service": "opw",
+    "serviceId": "providerId",
+    "serviceDomain": "provider.example.com",
+    "serviceReleaseVersion": "21.02.8",
+    "serviceBuildVersion": "0-g0123abcd",
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+
+    od_errors = [
+        od_error for group in load_error_definitions() for od_error in group.errors
+    ]
+    sample_payloads = [_build_sample_payload(od_error) for od_error in od_errors]
+    payloads = list(itertools.islice(itertools.cycle(sample_payloads), args.count))
+
+    with tempfile.TemporaryDirectory(prefix="bench_from_json_") as tmp_dir:
+        onedata_errors = _generate_and_import_package(tmp_dir)
+
+        mismatched = [
+            od_error.id
+            for od_error, payload in zip(od_errors, sample_payloads)
+            if onedata_errors.from_json(payload).to_json() != payload
+        ]
+        generated_time = _decode_all(onedata_errors.from_json, payloads)
+
+    ad_hoc_decode = _build_ad_hoc_decoder(od_errors)
+    ad_hoc_time = _decode_all(ad_hoc_decode, payloads)
+
+    print(f"Decoded {len(payloads)} payloads of {len(od_errors)} errors:")
+    print(f"    ad hoc (dict lookups)  {ad_hoc_time:>10.4f}s")
+    print(f"    generated package      {generated_time:>10.4f}s")
+
+    if mismatched:
+        print(f"Round trip fails for {len(mismatched)} errors: {', '.join(mismatched)}")
+        sys.exit(1)
+
+    print("All errors round trip")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.python.bench_from_json",
+        description=(
+            "Benchmarks decoding of error payloads with generated Python package "
+            "and checks that decoded errors encode back to the same payloads."
+        ),
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=DEFAULT_PAYLOADS_COUNT,
+        metavar="N",
+        help="number of payloads to decode (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+
+def _build_sample_payload(od_error: OdError) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"id": od_error.id, "ctx": SAMPLE_CTX}
+    if od_error.args:
+        payload["details"] = {
+            arg.name: get_py_arg_type(arg).sample_json for arg in od_error.args
+        }
+    payload["description"] = f"Sample description of {od_error.id}."
+    return payload
+
+
+def _generate_and_import_package(tmp_dir: str) -> ModuleType:
+    generate_package(load_error_definitions(), f"{tmp_dir}/{PACKAGE_NAME}")
+    sys.path.insert(0, tmp_dir)
+    try:
+        return importlib.import_module(PACKAGE_NAME)
+    finally:
+        sys.path.remove(tmp_dir)
+
+
+def _build_ad_hoc_decoder(od_errors: List[OdError]) -> Callable[[Any], Any]:
+    """Builds decoder working the way hand-written code does - id is matched
+    against known ones one by one and details are looked up in dicts."""
+    known_errors: List[Tuple[str, List[str]]] = [
+        (od_error.id, [arg.name for arg in od_error.args]) for od_error in od_errors
+    ]
+
+    def decode(error_json: Any) -> Any:
+        if error_json is None:
+            return None
+
+        error_id = error_json.get("id")
+        for known_id, detail_keys in known_errors:
+            if error_id == known_id:
+                details = error_json.get("details") or {}
+                return {
+                    "id": error_id,
+                    "ctx": error_json.get("ctx"),
+                    "description": error_json.get("description"),
+                    "details": {key: details.get(key) for key in detail_keys},
+                }
+
+        return {"id": error_id, "unrecognized": True, "error": error_json}
+
+    return decode
+
+
+def _decode_all(decode: Callable[[Any], Any], payloads: List[Any]) -> float:
+    start = time.perf_counter()
+    for payload in payloads:
+        decode(payload)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Command line interface shared by generators of non-Erlang targets."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import argparse
+import os
+import shutil
+from typing import Callable, List, Optional
+
+from ..erlang.error_definitions import OdErrorGroup
+from ..erlang.loaders.error_definitions_loader import load_error_definitions
+
+
+def run_generator(
+    *,
+    prog: str,
+    description: str,
+    output_dir: str,
+    generate: Callable[[List[OdErrorGroup]], None],
+    argv: Optional[List[str]] = None,
+) -> None:
+    """Loads error definitions according to command line arguments and
+    generates code from them into (wiped beforehand) output directory."""
+    args = parse_args(argv, prog=prog, description=description)
+
+    error_groups = load_error_definitions(
+        jobs=args.jobs, use_cache=args.use_cache, from_bundle=args.from_bundle
+    )
+    shutil.rmtree(output_dir, ignore_errors=True)
+    generate(error_groups)
+
+
+def parse_args(
+    argv: Optional[List[str]], *, prog: str, description: str
+) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    add_jobs_argument(
+        parser,
+        help_text="number of worker processes used to parse definitions (default: 1)",
+    )
+    add_no_cache_argument(parser)
+    parser.add_argument(
+        "--from-bundle",
+        metavar="BUNDLE_PATH",
+        help="generate code from definitions bundle instead of definitions directory",
+    )
+    return parser.parse_args(argv)
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser, *, help_text: str) -> None:
+    """Adds -j/--jobs argument (number of CPUs if given without value)."""
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=1,
+        const=os.cpu_count() or 1,
+        metavar="N",
+        help=help_text,
+    )
+
+
+def add_no_cache_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds --no-cache argument disabling cache of parsed definition files
+    (stored as 'use_cache')."""
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="do not use (nor update) cache of parsed definition files",
+    )
+
+
+def read_template(templates_dir: str, template_name: str) -> str:
+    with open(os.path.join(templates_dir, template_name), encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,34 @@
+"""Splitting of error descriptions rendered by generators of non-Erlang
+targets."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import string
+from typing import List, Optional, Union
+
+from ..erlang.error_args.base import ErrorArgType
+from ..erlang.error_definitions import OdError
+
+
+def split_description(od_error: OdError) -> Optional[List[Union[str, ErrorArgType]]]:
+    """Returns description split into literal parts and args printed in place
+    of placeholders (None if it can not be rendered outside of Erlang, e.g. it
+    refers to Erlang macros)."""
+    if od_error.description is None or od_error.to_json_impl:
+        return None
+
+    args = {arg.name: arg for arg in od_error.args}
+    parts: List[Union[str, ErrorArgType]] = []
+    for literal, field_name, _, _ in string.Formatter().parse(od_error.description):
+        if literal:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        if field_name not in args:
+            return None
+
+        parts.append(args[field_name])
+
+    return parts
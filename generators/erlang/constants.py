@@ -10,15 +10,27 @@ from typing import Dict, Final
 # Directory paths
 ERROR_DEFINITIONS_ROOT_DIR: Final[str] = "definitions"
 TEMPLATES_DIR: Final[str] = os.path.join(os.path.dirname(__file__), "templates")
+GENERATOR_SRC_DIR: Final[str] = os.path.dirname(__file__)
 
 # Output file paths
 OUTPUT_DIR: Final[str] = "generated/erlang"
 ERRORS_HRL_FILE_PATH: Final[str] = os.path.join(OUTPUT_DIR, "errors.hrl")
 ERROR_ATTRS_HRL_FILE_PATH: Final[str] = os.path.join(OUTPUT_DIR, "error_attrs.hrl")
+ERRORS_BASE_HRL_FILE_PATH: Final[str] = os.path.join(OUTPUT_DIR, "errors_base.hrl")
+# Headers of individual error groups (relative to OUTPUT_DIR, which is expected
+# to be on include path, as they are included by it)
+ERROR_GROUP_HRL_DIR: Final[str] = "errors"
 ERRORS_ERL_FILE_PATH: Final[str] = os.path.join(OUTPUT_DIR, "errors.erl")
+ERRORS_IMPL_FILE_PATH: Final[str] = os.path.join(OUTPUT_DIR, "od_errors_impl.erl")
 OD_ERROR_FILE_PATH: Final[str] = os.path.join(OUTPUT_DIR, "od_error.erl")
+ERRORS_BENCH_FILE_PATH: Final[str] = os.path.join(OUTPUT_DIR, "errors_bench.erl")
 ERROR_TYPES_DIR: Final[str] = os.path.join(OUTPUT_DIR, "types")
 
+# Cache file paths
+CACHE_DIR: Final[str] = "generated/.cache"
+MANIFEST_FILE_PATH: Final[str] = os.path.join(CACHE_DIR, "erlang_manifest.json")
+DEFINITIONS_CACHE_FILE_PATH: Final[str] = os.path.join(CACHE_DIR, "definitions.pickle")
+
 # Formatting
 INDENT: Final[str] = 4 * " "
 HORIZONTAL_COMMENT_LINE: Final[str] = "%%" + 68 * "-"
@@ -5,10 +5,16 @@ __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
 from abc import ABC
-from typing import ClassVar, List, NamedTuple, Optional
+from typing import ClassVar, List, NamedTuple, Optional, Sequence
 
+from .snippet_cache import (
+    PLACEHOLDER_ARG_NAME,
+    PLACEHOLDER_ERLANG_VARIABLE_NAME,
+    snippet_cache,
+)
 from .translation.context import JsonDecodingCtx, JsonEncodingCtx, PrintEncodingCtx
 from .translation.line import Line
+from .translation.peephole import optimize_lines
 from .translation.strategies import (
     CustomStrategy,
     DirectStrategy,
@@ -22,9 +28,29 @@ INDENT: str = 4 * " "
 
 
 class ErrorArgToJsonEncoding(NamedTuple):
+    """
+    Code encoding argument to JSON (and to print value, if requested).
+
+    Attributes:
+        tokens: Code binding json_var (and print_var, if it can not be bound
+            separately, e.g. in case expression handling null)
+        json_var: Variable (or expression) the JSON value is bound to
+        print_var: Variable (or expression) the print value is bound to
+        print_tokens: Code binding print_var separately (needed only by
+            description, so that it can be skipped along with it)
+    """
+
     tokens: List[str]
     json_var: str
     print_var: Optional[str]
+    print_tokens: List[str]
+
+
+class ErrorArgToJsonLines(NamedTuple):
+    lines: List[Line]
+    json_var: str
+    print_var: Optional[str]
+    print_lines: Sequence[Line] = ()
 
 
 class ErrorArgType(ABC):
@@ -35,6 +61,12 @@ class ErrorArgType(ABC):
     json_encoding_strategy: ClassVar[JsonEncodingStrategy] = DirectStrategy()
     print_encoding_strategy: ClassVar[PrintEncodingStrategy] = DirectStrategy()
     json_decoding_strategy: ClassVar[JsonDecodingStrategy] = DirectStrategy()
+    # Template of expression converting print value to binary (used to build
+    # description without formatting it at runtime), None if it is not known
+    # to be convertible
+    binary_print_template: ClassVar[Optional[str]] = None
+    # Headers defining macros or records used by sample_erlang_value
+    sample_includes: ClassVar[List[str]] = []
 
     def __init__(
         self, name: str, nullable: bool = False, print_if_null: Optional[str] = None
@@ -52,74 +84,249 @@ class ErrorArgType(ABC):
         """Returns Erlang variable name for this argument."""
         return self.name[0].upper() + self.name[1:]
 
+    def get_binary_print_expression(self, print_var: str) -> Optional[str]:
+        """Returns expression converting print value to binary (if possible)."""
+        if self.binary_print_template is None:
+            return None
+
+        if self.nullable and (
+            # Otherwise null is printed
+            not self.print_if_null
+            # print_if_null binary is not converted
+            or self.binary_print_template != "{print_var}"
+        ):
+            return None
+
+        return self.binary_print_template.format(print_var=print_var)
+
+    def sample_erlang_value(self) -> Optional[str]:
+        """Returns Erlang expression evaluating to sample value of this type
+        (used e.g. to build errors in generated benchmarks) or None if there
+        is none."""
+        return None
+
     def generate_to_json_encoding(
-        self, *, is_printed: bool = False, indent_level: int = 1
+        self, *, is_printed: bool = False, indent_level: int = 1, optimize: bool = True
     ) -> ErrorArgToJsonEncoding:
-        if self.nullable:
-            return self._generate_nullable_to_json_encoding(
-                is_printed=is_printed, indent_level=indent_level
+        if not snippet_cache.enabled:
+            return self.render_to_json_encoding(
+                is_printed=is_printed, indent_level=indent_level, optimize=optimize
             )
 
-        return self._generate_to_json_encoding(
-            is_printed=is_printed, indent_level=indent_level
+        key = (
+            "to_json",
+            type(self),
+            self.nullable,
+            self.print_if_null,
+            is_printed,
+            indent_level,
+            optimize,
+        )
+        snippet = snippet_cache.get_or_render(
+            key,
+            lambda: self._render_placeholder_to_json_encoding(
+                is_printed=is_printed, indent_level=indent_level, optimize=optimize
+            ),
+        )
+        return ErrorArgToJsonEncoding(
+            tokens=self._substitute_placeholder_tokens(snippet.tokens),
+            json_var=self._substitute_placeholder(snippet.json_var),
+            print_var=(
+                self._substitute_placeholder(snippet.print_var)
+                if snippet.print_var
+                else None
+            ),
+            print_tokens=self._substitute_placeholder_tokens(snippet.print_tokens),
         )
 
     def generate_from_json_decoding(
-        self, *, details_var: str, indent_level: int = 1
+        self, *, details_var: str, indent_level: int = 1, optimize: bool = True
     ) -> List[str]:
-        indent_0 = indent_level * INDENT
-        indent_1 = (indent_level + 1) * INDENT
-        indent_2 = (indent_level + 2) * INDENT
+        if not snippet_cache.enabled:
+            return self.render_from_json_decoding(
+                details_var=details_var, indent_level=indent_level, optimize=optimize
+            )
+
+        key = (
+            "from_json",
+            type(self),
+            self.nullable,
+            details_var,
+            indent_level,
+            optimize,
+        )
+        snippet = snippet_cache.get_or_render(
+            key,
+            lambda: _join_tokens(
+                self._create_placeholder().render_from_json_decoding(
+                    details_var=details_var,
+                    indent_level=indent_level,
+                    optimize=optimize,
+                )
+            ),
+        )
+        return self._substitute_placeholder_tokens(snippet)
 
+    def get_details_pattern_var(self) -> str:
+        """Returns variable the argument JSON is bound to when matched in
+        details map pattern."""
         erl_var = self.get_erlang_variable_name()
-        tokens = []
+        if isinstance(self.json_decoding_strategy, CustomStrategy):
+            return f"{erl_var}Json"
 
-        maps_get_tokens = ['maps:get(<<"', self.name, '">>, ', details_var, ")"]
+        return erl_var
+
+    def generate_from_matched_json_decoding(
+        self, *, indent_level: int = 1, optimize: bool = True
+    ) -> List[str]:
+        """Generate code decoding argument from JSON matched in details map
+        pattern (see get_details_pattern_var)."""
+        if not isinstance(self.json_decoding_strategy, CustomStrategy):
+            return []
+
+        if not snippet_cache.enabled:
+            return self.render_from_matched_json_decoding(
+                indent_level=indent_level, optimize=optimize
+            )
+
+        key = ("from_matched_json", type(self), indent_level, optimize)
+        snippet = snippet_cache.get_or_render(
+            key,
+            lambda: _join_tokens(
+                self._create_placeholder().render_from_matched_json_decoding(
+                    indent_level=indent_level, optimize=optimize
+                )
+            ),
+        )
+        return self._substitute_placeholder_tokens(snippet)
+
+    def _create_placeholder(self) -> "ErrorArgType":
+        """Returns argument of the same type and options but placeholder name."""
+        return type(self)(
+            name=PLACEHOLDER_ARG_NAME,
+            nullable=self.nullable,
+            print_if_null=self.print_if_null,
+        )
+
+    def _render_placeholder_to_json_encoding(
+        self, *, is_printed: bool, indent_level: int, optimize: bool
+    ) -> ErrorArgToJsonEncoding:
+        encoding = self._create_placeholder().render_to_json_encoding(
+            is_printed=is_printed, indent_level=indent_level, optimize=optimize
+        )
+        return encoding._replace(
+            tokens=_join_tokens(encoding.tokens),
+            print_tokens=_join_tokens(encoding.print_tokens),
+        )
+
+    def _substitute_placeholder(self, snippet: str) -> str:
+        return snippet.replace(
+            PLACEHOLDER_ERLANG_VARIABLE_NAME, self.get_erlang_variable_name()
+        ).replace(PLACEHOLDER_ARG_NAME, self.name)
+
+    def _substitute_placeholder_tokens(self, tokens: List[str]) -> List[str]:
+        return [self._substitute_placeholder(token) for token in tokens]
+
+    def render_to_json_encoding(
+        self, *, is_printed: bool = False, indent_level: int = 1, optimize: bool = True
+    ) -> ErrorArgToJsonEncoding:
+        """Renders code of generate_to_json_encoding (bypassing snippet cache)."""
         if self.nullable:
-            maps_get_tokens.insert(-1, ", null")
+            encoding = self._generate_nullable_to_json_encoding(
+                is_printed=is_printed, indent_level=indent_level
+            )
+        else:
+            encoding = self._generate_to_json_encoding(
+                is_printed=is_printed, indent_level=indent_level
+            )
 
-        if isinstance(self.json_decoding_strategy, DirectStrategy):
-            tokens.extend([indent_0, erl_var, " = "])
+        lines = encoding.lines
+        print_lines = list(encoding.print_lines)
+        if optimize:
+            live_vars = [var for var in (encoding.json_var, encoding.print_var) if var]
+            lines = optimize_lines(lines, live_vars)
+            print_lines = optimize_lines(print_lines, live_vars)
 
+        return ErrorArgToJsonEncoding(
+            tokens=self._format_lines(lines),
+            json_var=encoding.json_var,
+            print_var=encoding.print_var,
+            print_tokens=self._format_lines(print_lines),
+        )
+
+    def render_from_json_decoding(
+        self, *, details_var: str, indent_level: int = 1, optimize: bool = True
+    ) -> List[str]:
+        """Renders code of generate_from_json_decoding (bypassing snippet
+        cache)."""
+        erl_var = self.get_erlang_variable_name()
+        lines = []
+
+        maps_get_expr = f'maps:get(<<"{self.name}">>, {details_var})'
+        if self.nullable:
+            maps_get_expr = f'maps:get(<<"{self.name}">>, {details_var}, null)'
+
+        if isinstance(self.json_decoding_strategy, DirectStrategy):
             if self.nullable:
-                tokens.extend(["utils:null_to_undefined(", *maps_get_tokens, ")"])
+                expr = f"utils:null_to_undefined({maps_get_expr})"
             else:
-                tokens.extend(maps_get_tokens)
-
-            tokens.append(",\n")
+                expr = maps_get_expr
+            lines.append(Line(f"{erl_var} = {expr}", indent_level, ","))
 
         elif isinstance(self.json_decoding_strategy, CustomStrategy):
             json_var = f"{erl_var}Json"
 
             if self.nullable:
-                tokens.extend(
-                    [indent_0, erl_var, " = case ", *maps_get_tokens, " of\n"]
+                decoding_lines = self._generate_custom_json_decoding(
+                    json_var=json_var, indent_level=indent_level + 2
                 )
-                tokens.extend([indent_1, "null ->\n", indent_2, "undefined;\n"])
-                tokens.extend([indent_1, json_var, " ->\n"])
-                tokens.extend(
-                    self._generate_custom_json_decoding(
-                        json_var=json_var, indent_level=indent_level + 2
-                    )
+                decoding_lines[-1].ending = ""
+                lines.extend(
+                    [
+                        Line(f"{erl_var} = case {maps_get_expr} of", indent_level),
+                        Line("null ->", indent_level + 1),
+                        Line("undefined", indent_level + 2, ";"),
+                        Line(f"{json_var} ->", indent_level + 1),
+                        *decoding_lines,
+                        Line("end", indent_level, ","),
+                    ]
                 )
-                tokens[-1] = tokens[-1].rstrip(",\n")
-                tokens.extend(["\n", indent_0, "end,\n"])
             else:
-                tokens.extend([indent_0, json_var, " = ", *maps_get_tokens, ",\n"])
-                tokens.extend(
+                lines.append(Line(f"{json_var} = {maps_get_expr}", indent_level, ","))
+                lines.extend(
                     self._generate_custom_json_decoding(
                         json_var=json_var, assign_to=erl_var, indent_level=indent_level
                     )
                 )
 
-        return tokens
+        if optimize:
+            lines = optimize_lines(lines, [erl_var])
+
+        return self._format_lines(lines)
+
+    def render_from_matched_json_decoding(
+        self, *, indent_level: int, optimize: bool = True
+    ) -> List[str]:
+        """Renders code of generate_from_matched_json_decoding (bypassing
+        snippet cache)."""
+        erl_var = self.get_erlang_variable_name()
+        lines = self._generate_custom_json_decoding(
+            json_var=self.get_details_pattern_var(),
+            assign_to=erl_var,
+            indent_level=indent_level,
+        )
+
+        if optimize:
+            lines = optimize_lines(lines, [erl_var])
+
+        return self._format_lines(lines)
 
     def _generate_to_json_encoding(
         self, *, is_printed: bool = False, indent_level: int = 1
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         """Generate code for JSON encoding."""
 
-        tokens = []
+        lines = []
         erl_var = self.get_erlang_variable_name()
 
         # Prepare JSON encoding
@@ -133,10 +340,11 @@ class ErrorArgType(ABC):
             indent_level=indent_level,
         )
         json_result = self.json_encoding_strategy.prepare_json_encoding(json_ctx)
-        tokens.extend(self._format_lines(json_result.expression.build(json_ctx)))
+        lines.extend(json_result.expression.build(json_ctx))
 
         # Prepare print encoding if needed
         print_var = None
+        print_lines = []
         if is_printed:
             print_ctx = PrintEncodingCtx(
                 erl_var=erl_var,
@@ -151,18 +359,19 @@ class ErrorArgType(ABC):
             print_result = self.print_encoding_strategy.prepare_print_encoding(
                 print_ctx
             )
-            tokens.extend(self._format_lines(print_result.expression.build(print_ctx)))
+            print_lines = print_result.expression.build(print_ctx)
             print_var = print_result.target_var
 
-        return ErrorArgToJsonEncoding(
-            tokens=tokens,
+        return ErrorArgToJsonLines(
+            lines=lines,
             json_var=json_result.target_var,
             print_var=print_var,
+            print_lines=print_lines,
         )
 
     def _generate_nullable_to_json_encoding(
         self, *, is_printed: bool = False, indent_level: int = 1
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         if self.print_if_null and is_printed:
             return self._generate_nullable_print_if_null_encoding(
                 indent_level=indent_level
@@ -177,7 +386,7 @@ class ErrorArgType(ABC):
 
     def _generate_nullable_print_if_null_encoding(
         self, *, indent_level: int = 1
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         erl_var = self.get_erlang_variable_name()
         json_var = f"{erl_var}Json"
         print_var = f"{erl_var}Print"
@@ -193,7 +402,7 @@ class ErrorArgType(ABC):
             indent_level=indent_level + 2,
         )
         json_result = self.json_encoding_strategy.prepare_json_encoding(json_ctx)
-        json_tokens = self._format_lines(json_result.expression.build(json_ctx))
+        json_lines = json_result.expression.build(json_ctx)
         json_case_var = json_result.target_var or erl_var
 
         # Prepare print encoding
@@ -208,39 +417,40 @@ class ErrorArgType(ABC):
             indent_level=indent_level + 2,
         )
         print_result = self.print_encoding_strategy.prepare_print_encoding(print_ctx)
-        print_tokens = self._format_lines(print_result.expression.build(print_ctx))
+        print_lines = print_result.expression.build(print_ctx)
         print_case_var = print_result.target_var or json_case_var
 
-        tokens = self._generate_nullable_case_statement(
+        lines = self._generate_nullable_case_statement(
             indent_level=indent_level,
             json_var=json_var,
             print_var=print_var,
             erl_var=erl_var,
-            encoding_tokens=json_tokens + print_tokens,
+            encoding_lines=json_lines + print_lines,
             json_case_var=json_case_var,
             print_case_var=print_case_var,
         )
 
-        return ErrorArgToJsonEncoding(
-            tokens=tokens,
+        return ErrorArgToJsonLines(
+            lines=lines,
             json_var=json_var,
             print_var=print_var,
         )
 
     def _generate_nullable_direct_json_encoding(
         self, *, indent_level: int
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         erl_var = self.get_erlang_variable_name()
         json_var = f"{erl_var}Json"
 
-        indent = indent_level * INDENT
-        tokens = [f"{indent}{json_var} = utils:undefined_to_null({erl_var}),\n"]
+        lines = [
+            Line(f"{json_var} = utils:undefined_to_null({erl_var})", indent_level, ",")
+        ]
 
-        return ErrorArgToJsonEncoding(tokens=tokens, json_var=json_var, print_var=None)
+        return ErrorArgToJsonLines(lines=lines, json_var=json_var, print_var=None)
 
     def _generate_nullable_direct_json_and_print_from_json_encoding(
         self, *, indent_level: int
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         encoding = self._generate_nullable_direct_json_encoding(
             indent_level=indent_level
         )
@@ -248,7 +458,7 @@ class ErrorArgType(ABC):
 
     def _generate_nullable_direct_json_and_custom_print_encoding(
         self, *, indent_level: int = 1
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         erl_var = self.get_erlang_variable_name()
         json_var = f"{erl_var}Json"
         print_var = f"{erl_var}Print"
@@ -260,52 +470,53 @@ class ErrorArgType(ABC):
             indent_level=indent_level + 2,
         )
         print_result = self.print_encoding_strategy.prepare_print_encoding(print_ctx)
-        print_tokens = self._format_lines(print_result.expression.build(print_ctx))
+        print_lines = print_result.expression.build(print_ctx)
         print_case_var = print_result.target_var
 
-        tokens = self._generate_nullable_case_statement(
+        lines = self._generate_nullable_case_statement(
             indent_level=indent_level,
             json_var=json_var,
             print_var=print_var,
             erl_var=erl_var,
-            encoding_tokens=print_tokens,
+            encoding_lines=print_lines,
             json_case_var=erl_var,  # Direct strategy uses erl_var
             print_case_var=print_case_var,
         )
 
-        return ErrorArgToJsonEncoding(
-            tokens=tokens,
+        return ErrorArgToJsonLines(
+            lines=lines,
             json_var=json_var,
             print_var=print_var,
         )
 
     def _generate_nullable_custom_json_encoding(
         self, *, indent_level: int
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         erl_var = self.get_erlang_variable_name()
         json_var = f"{erl_var}Json"
 
         # Prepare JSON encoding
         json_ctx = JsonEncodingCtx(
             erl_var=erl_var,
-            assign_to=None,  # No need for temporary var - we're inside case
+            assign_to=f"{erl_var}JsonTmp",
             indent_level=indent_level + 2,
         )
         json_result = self.json_encoding_strategy.prepare_json_encoding(json_ctx)
-        json_tokens = self._format_lines(json_result.expression.build(json_ctx))
+        json_lines = json_result.expression.build(json_ctx)
 
-        tokens = self._generate_nullable_case_statement(
+        lines = self._generate_nullable_case_statement(
             indent_level=indent_level,
             json_var=json_var,
             erl_var=erl_var,
-            encoding_tokens=json_tokens,
+            encoding_lines=json_lines,
+            json_case_var=json_result.target_var,
         )
 
-        return ErrorArgToJsonEncoding(tokens=tokens, json_var=json_var, print_var=None)
+        return ErrorArgToJsonLines(lines=lines, json_var=json_var, print_var=None)
 
     def _generate_nullable_custom_json_and_print_from_json_encoding(
         self, *, indent_level: int
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         encoding = self._generate_nullable_custom_json_encoding(
             indent_level=indent_level
         )
@@ -313,7 +524,7 @@ class ErrorArgType(ABC):
 
     def _generate_nullable_custom_json_and_direct_print_encoding(
         self, *, indent_level: int
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         erl_var = self.get_erlang_variable_name()
         json_var = f"{erl_var}Json"
         print_var = f"{erl_var}Print"
@@ -325,27 +536,27 @@ class ErrorArgType(ABC):
             indent_level=indent_level + 2,
         )
         json_result = self.json_encoding_strategy.prepare_json_encoding(json_ctx)
-        json_tokens = self._format_lines(json_result.expression.build(json_ctx))
+        json_lines = json_result.expression.build(json_ctx)
 
-        tokens = self._generate_nullable_case_statement(
+        lines = self._generate_nullable_case_statement(
             indent_level=indent_level,
             json_var=json_var,
             print_var=print_var,
             erl_var=erl_var,
-            encoding_tokens=json_tokens,
+            encoding_lines=json_lines,
             json_case_var=json_result.target_var,
             print_case_var=erl_var,  # Direct strategy uses erl_var
         )
 
-        return ErrorArgToJsonEncoding(
-            tokens=tokens,
+        return ErrorArgToJsonLines(
+            lines=lines,
             json_var=json_var,
             print_var=print_var,
         )
 
     def _generate_nullable_custom_json_and_print_encoding(
         self, *, indent_level: int
-    ) -> ErrorArgToJsonEncoding:
+    ) -> ErrorArgToJsonLines:
         erl_var = self.get_erlang_variable_name()
         json_var = f"{erl_var}Json"
         print_var = f"{erl_var}Print"
@@ -357,7 +568,7 @@ class ErrorArgType(ABC):
             indent_level=indent_level + 2,
         )
         json_result = self.json_encoding_strategy.prepare_json_encoding(json_ctx)
-        json_tokens = self._format_lines(json_result.expression.build(json_ctx))
+        json_lines = json_result.expression.build(json_ctx)
 
         # Prepare print encoding
         print_ctx = PrintEncodingCtx(
@@ -367,20 +578,20 @@ class ErrorArgType(ABC):
             indent_level=indent_level + 2,
         )
         print_result = self.print_encoding_strategy.prepare_print_encoding(print_ctx)
-        print_tokens = self._format_lines(print_result.expression.build(print_ctx))
+        print_lines = print_result.expression.build(print_ctx)
 
-        tokens = self._generate_nullable_case_statement(
+        lines = self._generate_nullable_case_statement(
             indent_level=indent_level,
             json_var=json_var,
             print_var=print_var,
             erl_var=erl_var,
-            encoding_tokens=json_tokens + print_tokens,
+            encoding_lines=json_lines + print_lines,
             json_case_var=json_result.target_var,
             print_case_var=print_result.target_var,
         )
 
-        return ErrorArgToJsonEncoding(
-            tokens=tokens,
+        return ErrorArgToJsonLines(
+            lines=lines,
             json_var=json_var,
             print_var=print_var,
         )
@@ -393,40 +604,40 @@ class ErrorArgType(ABC):
         json_var: str,
         print_var: Optional[str] = None,
         indent_level: int,
-        encoding_tokens: List[str],
+        encoding_lines: List[Line],
         json_case_var: Optional[str] = None,
         print_case_var: Optional[str] = None,
-    ) -> List[str]:
-        indent_0 = indent_level * INDENT
-        indent_1 = (indent_level + 1) * INDENT
-        indent_2 = (indent_level + 2) * INDENT
-
-        tokens = []
-
+    ) -> List[Line]:
         if print_var:
-            tokens.append(f"{indent_0}{{{json_var}, {print_var}}}")
+            case_var = f"{{{json_var}, {print_var}}}"
         else:
-            tokens.append(f"{indent_0}{json_var}")
-
-        tokens.append(f" = case {erl_var} of\n")
-        tokens.append(f"{indent_1}undefined ->\n")
+            case_var = json_var
 
         if print_var and self.print_if_null:
             # When we need both JSON and print value, and print_if_null is specified
-            tokens.append(f'{indent_2}{{null, <<"{self.print_if_null}">>}};\n')
+            null_value = f'{{null, <<"{self.print_if_null}">>}}'
         else:
             # Default behavior - null for JSON, {null, null} for JSON and print
-            tokens.append(f"{indent_2}{'{null, null}' if print_var else 'null'};\n")
-
-        tokens.append(f"{indent_1}_ ->\n")
-        tokens.extend(encoding_tokens)
+            null_value = "{null, null}" if print_var else "null"
+
+        lines = [
+            Line(f"{case_var} = case {erl_var} of", indent_level),
+            Line("undefined ->", indent_level + 1),
+            Line(null_value, indent_level + 2, ";"),
+            Line("_ ->", indent_level + 1),
+            *encoding_lines,
+        ]
 
         if json_case_var and print_case_var:
-            tokens.append(f"{indent_2}{{{json_case_var}, {print_case_var}}}\n")
+            lines.append(
+                Line(f"{{{json_case_var}, {print_case_var}}}", indent_level + 2)
+            )
+        elif json_case_var:
+            lines.append(Line(json_case_var, indent_level + 2))
 
-        tokens.append(f"{indent_0}end,\n")
+        lines.append(Line("end", indent_level, ","))
 
-        return tokens
+        return lines
 
     _nullable_encoding_dispatch = {
         (DirectStrategy, None): _generate_nullable_direct_json_encoding,
@@ -459,7 +670,7 @@ class ErrorArgType(ABC):
 
     def _generate_custom_json_decoding(
         self, *, json_var: str, assign_to: Optional[str] = None, indent_level: int = 1
-    ) -> List[str]:
+    ) -> List[Line]:
         if not isinstance(self.json_decoding_strategy, CustomStrategy):
             raise ValueError("This should never happen")
 
@@ -467,7 +678,7 @@ class ErrorArgType(ABC):
             json_var=json_var, assign_to=assign_to, indent_level=indent_level
         )
         # pylint: disable=no-member
-        return self._format_lines(self.json_decoding_strategy.expression.build(ctx))
+        return self.json_decoding_strategy.expression.build(ctx)
 
     @staticmethod
     def _format_lines(lines: List[Line]) -> List[str]:
@@ -476,3 +687,8 @@ class ErrorArgType(ABC):
             f"{INDENT * line.indent_level}{line.content}{line.ending}\n"
             for line in lines
         ]
+
+
+def _join_tokens(tokens: List[str]) -> List[str]:
+    """Joins tokens (so that substitution in them is done only once)."""
+    return ["".join(tokens)] if tokens else []
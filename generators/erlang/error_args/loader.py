@@ -27,31 +27,54 @@ class TypeLoader:
         types_dir = Path(types.__file__).parent
 
         for module_info in pkgutil.iter_modules([str(types_dir)]):
-            module = importlib.import_module(
-                f"generators.erlang.error_args.types.{module_info.name}"
-            )
-
-            # Find all classes in module that inherit from ErrorArgType
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type)
-                    and issubclass(attr, ErrorArgType)
-                    and attr is not ErrorArgType
-                ):
-                    TypeRegistry.register(attr)
+            cls._load_module(module_info.name)
 
         cls._types_loaded = True
 
+    @classmethod
+    def load_type(cls, type_name: str) -> None:
+        """Load and register given error argument type (if not yet registered).
+
+        Only the module indexed for the type is imported. If the type is not
+        indexed (or index is out of date) all types are loaded.
+        """
+        if TypeRegistry.is_registered(type_name):
+            return
+
+        module_name = types.TYPE_MODULES.get(type_name)
+        if module_name:
+            cls._load_module(module_name)
+
+        if not TypeRegistry.is_registered(type_name):
+            cls.load_types()
+
     @classmethod
     def are_types_loaded(cls) -> bool:
         """Check if types have been loaded."""
         return cls._types_loaded
 
+    @staticmethod
+    def _load_module(module_name: str) -> None:
+        module = importlib.import_module(
+            f"generators.erlang.error_args.types.{module_name}"
+        )
+
+        # Find all classes defined in module that inherit from ErrorArgType
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (
+                isinstance(attr, type)
+                and issubclass(attr, ErrorArgType)
+                and attr is not ErrorArgType
+                and attr.__module__ == module.__name__
+                and not TypeRegistry.is_registered(attr.type_name())
+            ):
+                TypeRegistry.register(attr)
+
 
 def create_error_arg(arg_yaml: dict) -> ErrorArgType:
     """Create error argument from YAML definition."""
-    TypeLoader.load_types()
+    TypeLoader.load_type(arg_yaml["type"])
 
     return TypeRegistry.create(
         type_name=arg_yaml["type"],
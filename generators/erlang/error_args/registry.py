@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import Dict, Type
+from typing import Dict, List, Type
 
 from .base import ErrorArgType
 
@@ -23,6 +23,11 @@ class TypeRegistry:
 
         cls._types[type_name] = error_type
 
+    @classmethod
+    def is_registered(cls, type_name: str) -> bool:
+        """Check if error argument type of given name is registered."""
+        return type_name in cls._types
+
     @classmethod
     def get(cls, type_name: str) -> Type[ErrorArgType]:
         """Get error argument type by name."""
@@ -31,6 +36,11 @@ class TypeRegistry:
 
         return cls._types[type_name]
 
+    @classmethod
+    def get_type_names(cls) -> List[str]:
+        """Get names of all registered error argument types."""
+        return sorted(cls._types)
+
     @classmethod
     def create(cls, type_name: str, **kwargs) -> ErrorArgType:
         """Create new instance of error argument type."""
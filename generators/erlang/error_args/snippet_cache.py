@@ -0,0 +1,60 @@
+"""
+Cache of code snippets generated for error arguments.
+
+Code generated for arguments of the same type (and options) differs only in
+argument names, so it is rendered once for a placeholder name and then
+reused for other arguments by substituting the name.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+from typing import Any, Callable, Dict, Hashable, NamedTuple, TypeVar
+
+# Argument name (and corresponding Erlang variable name) snippets are rendered
+# for. It must not occur in generated code otherwise (and does not, as argument
+# names are camelCase words).
+PLACEHOLDER_ARG_NAME: str = "odArgPlaceholder0"
+PLACEHOLDER_ERLANG_VARIABLE_NAME: str = "OdArgPlaceholder0"
+
+T = TypeVar("T")
+
+
+class SnippetCacheStats(NamedTuple):
+    hits: int
+    misses: int
+
+
+class SnippetCache:
+    """Cache of snippets rendered for placeholder argument name."""
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self._snippets: Dict[Hashable, Any] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_render(self, key: Hashable, render: Callable[[], T]) -> T:
+        """Returns snippet cached under given key (rendering it if missing)."""
+        try:
+            snippet = self._snippets[key]
+        except KeyError:
+            self._misses += 1
+            snippet = self._snippets[key] = render()
+        else:
+            self._hits += 1
+
+        return snippet
+
+    def get_stats(self) -> SnippetCacheStats:
+        return SnippetCacheStats(hits=self._hits, misses=self._misses)
+
+    def clear(self) -> None:
+        """Removes cached snippets and resets stats."""
+        self._snippets.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+snippet_cache = SnippetCache()
@@ -0,0 +1,341 @@
+"""
+Peephole optimizer of code lines generated for error arguments.
+
+Code generated for an argument is composed of independently built snippets
+(value encoding, print encoding, null handling), which leaves redundant
+temporary variables in it, e.g.:
+
+    XJson = case X of
+        undefined ->
+            null;
+        _ ->
+            XJsonTmp = gri:serialize_type(X),
+            XJsonTmp
+    end,
+
+The optimizer rewrites such lines (until no rewrite applies):
+- copy propagation - variable bound to other variable is replaced with it,
+- variable used only once, in the very next statement, is replaced with
+  the expression it is bound to,
+- assignments of variables that are never used are removed (only if bound
+  to other variable or literal - other expressions, e.g. function calls, may
+  crash on invalid input and removing them would change how it is reported),
+- case clauses identical to the catch-all clause following them are removed
+  (along with the whole case if only the catch-all clause is left).
+
+Expressions are never duplicated nor removed by the optimizer (only moved
+to the place of their single use), so it does not alter which of them are
+evaluated.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import re
+from dataclasses import replace
+from typing import Collection, Iterator, List, NamedTuple, Optional, Tuple
+
+from .line import Line
+
+# Strings, quoted atoms and char literals are matched only to be skipped
+TOKEN_REGEX = re.compile(
+    r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|\$\\?.|\??[A-Za-z_][\w@]*'
+)
+BRACKET_REGEX = re.compile(
+    r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|\$\\?.|<<|>>|[()\[\]{}]'
+)
+VARIABLE_REGEX = re.compile(r"[A-Z][\w@]*")
+ATOMIC_LITERAL_REGEX = re.compile(r"[a-z][\w@]*|-?\d+")
+CALL_REGEX = re.compile(r"(?:[a-z][\w@]*:)?[a-z][\w@]*\(")
+ASSIGNMENT_REGEX = re.compile(r"([A-Z][\w@]*) = (.+)")
+CASE_REGEX = re.compile(r"(.*)case (.+) of")
+CATCH_ALL_CLAUSE: str = "_ ->"
+
+OPENING_BRACKETS = {"(", "[", "{", "<<"}
+CLOSING_BRACKETS = {")", "]", "}", ">>"}
+
+# Range of lines [start, end) making up a statement
+Statement = Tuple[int, int]
+
+
+class Clause(NamedTuple):
+    """
+    Clause of case expression or fun (or body of other multi-line expression).
+
+    Attributes:
+        head: Index of the clause head line ("Pattern ->") or None if the
+            body does not belong to any clause
+        body: Range of body lines
+    """
+
+    head: Optional[int]
+    body: Statement
+
+
+def optimize_lines(lines: List[Line], live_vars: Collection[str]) -> List[Line]:
+    """Returns optimized copy of lines.
+
+    Variables in live_vars are used by the code following the lines, so they
+    are left bound.
+    """
+    lines = [replace(line) for line in lines]
+
+    # Each rewrite removes at least one line, so this loop terminates
+    while _rewrite_once(lines, live_vars):
+        pass
+
+    return lines
+
+
+def _rewrite_once(lines: List[Line], live_vars: Collection[str]) -> bool:
+    for block in _iter_blocks(lines, 0, len(lines)):
+        for index, statement in enumerate(block):
+            if (
+                _propagate_assignment(lines, statement, block[index + 1 :], live_vars)
+                or _remove_dead_assignment(lines, statement, live_vars)
+                or _remove_redundant_case_clauses(lines, statement)
+            ):
+                return True
+
+    return False
+
+
+def _propagate_assignment(
+    lines: List[Line],
+    statement: Statement,
+    following_statements: List[Statement],
+    live_vars: Collection[str],
+) -> bool:
+    start, end = statement
+    match = ASSIGNMENT_REGEX.fullmatch(lines[start].content)
+    if end - start != 1 or not following_statements or not match:
+        return False
+
+    var, expr = match.groups()
+    if var in live_vars:
+        return False
+
+    following_start = following_statements[0][0]
+    following_end = following_statements[-1][1]
+    uses = [
+        index
+        for index, line in enumerate(lines)
+        if index != start
+        for token in _get_variables(line.content)
+        if token == var
+    ]
+    if not uses or not all(following_start <= index < following_end for index in uses):
+        return False
+
+    if VARIABLE_REGEX.fullmatch(expr):
+        # Copy propagation - unless variable is shadowed by a clause pattern
+        if any(
+            _is_clause_head(line) and expr in _get_variables(line.content)
+            for line in lines[following_start:following_end]
+        ):
+            return False
+    elif (
+        len(uses) != 1
+        or uses[0] != following_start
+        or not _is_self_contained(expr)
+        # Expression can not be substituted into pattern
+        or var in _get_variables(_get_pattern(lines[following_start].content))
+    ):
+        return False
+
+    for index in set(uses):
+        lines[index].content = _replace_variable(lines[index].content, var, expr)
+    del lines[start]
+
+    return True
+
+
+def _remove_dead_assignment(
+    lines: List[Line], statement: Statement, live_vars: Collection[str]
+) -> bool:
+    start, end = statement
+    match = ASSIGNMENT_REGEX.fullmatch(lines[start].content)
+
+    # Assignment not followed by comma is the value of enclosing expression
+    if (
+        end - start != 1
+        or not match
+        or lines[start].ending != ","
+        or match.group(1) in live_vars
+    ):
+        return False
+
+    var, expr = match.groups()
+    # Evaluation of other expressions may fail
+    if not VARIABLE_REGEX.fullmatch(expr) and not ATOMIC_LITERAL_REGEX.fullmatch(expr):
+        return False
+
+    if any(
+        var in _get_variables(line.content)
+        for index, line in enumerate(lines)
+        if index != start
+    ):
+        return False
+
+    del lines[start]
+    return True
+
+
+def _remove_redundant_case_clauses(lines: List[Line], statement: Statement) -> bool:
+    start, end = statement
+    match = CASE_REGEX.fullmatch(lines[start].content)
+    if end - start < 3 or not match:
+        return False
+
+    clauses = _split_clauses(lines, statement)
+    for clause, next_clause in zip(clauses, clauses[1:]):
+        if (
+            clause.head is not None
+            and next_clause.head is not None
+            and lines[next_clause.head].content == CATCH_ALL_CLAUSE
+            # Otherwise variables bound by the pattern may be used in body
+            and not _get_variables(lines[clause.head].content)
+            and _is_same_code(
+                lines[slice(*clause.body)], lines[slice(*next_clause.body)]
+            )
+        ):
+            del lines[clause.head : clause.body[1]]
+            return True
+
+    prefix, subject = match.groups()
+    if (
+        len(clauses) == 1
+        and clauses[0].head is not None
+        and lines[clauses[0].head].content == CATCH_ALL_CLAUSE
+        and clauses[0].body[1] - clauses[0].body[0] == 1
+        # Otherwise evaluation of the subject would be skipped
+        and VARIABLE_REGEX.fullmatch(subject)
+    ):
+        body_line = lines[clauses[0].body[0]]
+        lines[start:end] = [
+            Line(
+                content=f"{prefix}{body_line.content}",
+                indent_level=lines[start].indent_level,
+                ending=lines[end - 1].ending,
+            )
+        ]
+        return True
+
+    return False
+
+
+def _iter_blocks(lines: List[Line], start: int, end: int) -> Iterator[List[Statement]]:
+    """Yields statements of block of lines [start, end) and of nested blocks."""
+    block = _split_statements(lines, start, end)
+    yield block
+
+    for statement in block:
+        if statement[1] - statement[0] > 1:
+            for clause in _split_clauses(lines, statement):
+                yield from _iter_blocks(lines, *clause.body)
+
+
+def _split_statements(lines: List[Line], start: int, end: int) -> List[Statement]:
+    statements = []
+
+    index = start
+    while index < end:
+        statement_end = index + 1
+        while (
+            statement_end < end
+            and lines[statement_end].indent_level > lines[index].indent_level
+        ):
+            statement_end += 1
+
+        if index + 1 < statement_end < end:
+            # Include closing line (e.g. "end,")
+            statement_end += 1
+
+        statements.append((index, statement_end))
+        index = statement_end
+
+    return statements
+
+
+def _split_clauses(lines: List[Line], statement: Statement) -> List[Clause]:
+    """Splits lines between the first and closing line of multi-line statement
+    into clauses."""
+    start, end = statement
+    body_start, body_end = start + 1, end - 1
+    clause_indent_level = lines[start].indent_level + 1
+
+    if body_start >= body_end or not _is_clause_head(lines[body_start]):
+        return [Clause(head=None, body=(body_start, body_end))]
+
+    heads = [
+        index
+        for index in range(body_start, body_end)
+        if lines[index].indent_level == clause_indent_level
+        and _is_clause_head(lines[index])
+    ]
+    return [
+        Clause(head=head, body=(head + 1, next_head))
+        for head, next_head in zip(heads, heads[1:] + [body_end])
+    ]
+
+
+def _is_clause_head(line: Line) -> bool:
+    return line.content.endswith("->") and not line.ending
+
+
+def _is_same_code(lines: List[Line], other_lines: List[Line]) -> bool:
+    """Checks if lines are the same (disregarding ending of the last line)."""
+    return (
+        len(lines) == len(other_lines)
+        and all(
+            (line.content, line.indent_level) == (other.content, other.indent_level)
+            for line, other in zip(lines, other_lines)
+        )
+        and all(
+            line.ending == other.ending
+            for line, other in zip(lines[:-1], other_lines[:-1])
+        )
+    )
+
+
+def _is_self_contained(expr: str) -> bool:
+    """Checks if expression can be substituted for a variable as it is
+    (variable, literal, function call or bracketed term)."""
+    if VARIABLE_REGEX.fullmatch(expr) or ATOMIC_LITERAL_REGEX.fullmatch(expr):
+        return True
+
+    if not CALL_REGEX.match(expr) and not expr.startswith(("{", "[", "#{", "<<")):
+        return False
+
+    depth = 0
+    for match in BRACKET_REGEX.finditer(expr):
+        token = match.group()
+        if token in OPENING_BRACKETS:
+            depth += 1
+        elif token in CLOSING_BRACKETS:
+            depth -= 1
+            if depth == 0:
+                return match.end() == len(expr)
+
+    return False
+
+
+def _get_pattern(content: str) -> str:
+    """Returns pattern of the match expression (if the line starts with one)."""
+    pattern, separator, _ = content.partition(" = ")
+    return pattern if separator else ""
+
+
+def _get_variables(content: str) -> List[str]:
+    return [
+        token
+        for token in TOKEN_REGEX.findall(content)
+        if VARIABLE_REGEX.fullmatch(token)
+    ]
+
+
+def _replace_variable(content: str, var: str, expr: str) -> str:
+    return TOKEN_REGEX.sub(
+        lambda match: expr if match.group() == var else match.group(), content
+    )
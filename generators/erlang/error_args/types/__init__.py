@@ -3,3 +3,36 @@
 __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+from typing import Dict
+
+# Index of modules defining error argument types (type name -> module name),
+# so that only modules of types actually used in definitions are imported.
+# Types missing from the index are still found (by scanning all modules),
+# but each new type should be added here.
+TYPE_MODULES: Dict[str, str] = {
+    "AaiService": "aai_service",
+    "AaiSubject": "aai_subject",
+    "AtmDataType": "atm_data_type",
+    "AtmDataTypes": "atm_data_types",
+    "AtmStoreTypes": "atm_store_types",
+    "AtmTaskArgumentValueBuilderType": "atm_task_argument_value_builder_type",
+    "AtmTaskArgumentValueBuilderTypes": "atm_task_argument_value_builder_types",
+    "AtmWorkflowSchemaIds": "atm_workflow_schemas",
+    "Atom": "atom",
+    "Binaries": "binaries",
+    "Binary": "binary",
+    "DnsServers": "dns_servers",
+    "GriEntityType": "gri_entity_type",
+    "Integer": "integer",
+    "InviteTokenType": "invite_token_type",
+    "Json": "json",
+    "MetricConfig": "tsc_metric_config",
+    "OnedataError": "onedata_error",
+    "Path": "path",
+    "ProviderSupportStage": "provider_support_stage",
+    "StorageSupportStage": "storage_support_stage",
+    "TokenType": "token_type",
+    "TscLayout": "tsc_layout",
+    "UnverifiedCaveat": "unverified_caveat",
+}
@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from ..base import ErrorArgType
 from ..translation.expressions import FunCallExpression
@@ -21,6 +21,7 @@ class AtmDataType(ErrorArgType):
     """Automation data type."""
 
     fmt_control_sequence: ClassVar[str] = "~ts"
+    binary_print_template: ClassVar[Optional[str]] = "{print_var}"
     json_encoding_strategy: ClassVar[JsonEncodingStrategy] = CustomStrategy(
         FunCallExpression("atm_data_type", "type_to_json", ["{erl_var}"])
     )
@@ -28,3 +29,6 @@ class AtmDataType(ErrorArgType):
     json_decoding_strategy: ClassVar[JsonDecodingStrategy] = CustomStrategy(
         FunCallExpression("atm_data_type", "type_from_json", ["{json_var}"])
     )
+
+    def sample_erlang_value(self) -> str:
+        return "atm_string_type"
@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from ..base import ErrorArgType
 from ..translation.expressions import FunCallExpression
@@ -21,6 +21,7 @@ class AtmTaskArgumentValueBuilderType(ErrorArgType):
     """Automation task argument value builder type."""
 
     fmt_control_sequence: ClassVar[str] = "~ts"
+    binary_print_template: ClassVar[Optional[str]] = "{print_var}"
     json_encoding_strategy: ClassVar[JsonEncodingStrategy] = CustomStrategy(
         FunCallExpression(
             "atm_task_argument_value_builder", "type_to_json", ["{erl_var}"]
@@ -32,3 +33,6 @@ class AtmTaskArgumentValueBuilderType(ErrorArgType):
             "atm_task_argument_value_builder", "type_from_json", ["{json_var}"]
         )
     )
+
+    def sample_erlang_value(self) -> str:
+        return "const"
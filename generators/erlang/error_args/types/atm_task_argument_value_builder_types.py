@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from ..base import ErrorArgType
 from ..translation.expressions import ListMapFunRefExpression
@@ -21,6 +21,7 @@ class AtmTaskArgumentValueBuilderTypes(ErrorArgType):
     """List of automation task argument value builder types."""
 
     fmt_control_sequence: ClassVar[str] = "~ts"
+    binary_print_template: ClassVar[Optional[str]] = "{print_var}"
     json_encoding_strategy: ClassVar[JsonEncodingStrategy] = CustomStrategy(
         ListMapFunRefExpression(
             module="atm_task_argument_value_builder",
@@ -36,3 +37,6 @@ class AtmTaskArgumentValueBuilderTypes(ErrorArgType):
             input_template="{json_var}",
         )
     )
+
+    def sample_erlang_value(self) -> str:
+        return "[iterated_item, const]"
@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from ..base import ErrorArgType
 from ..translation.expressions import ListMapExpression, SimpleExpression
@@ -21,6 +21,7 @@ class DnsServers(ErrorArgType):
     """List of DNS servers."""
 
     fmt_control_sequence: ClassVar[str] = "~ts"
+    binary_print_template: ClassVar[Optional[str]] = "{print_var}"
     DNS_DEFAULTS: ClassVar[str] = '<<"system defaults">>'
 
     json_encoding_strategy: ClassVar[JsonEncodingStrategy] = CustomStrategy(
@@ -50,3 +51,6 @@ class DnsServers(ErrorArgType):
             input_template="{json_var}",
         )
     )
+
+    def sample_erlang_value(self) -> str:
+        return "[default, {8, 8, 8, 8}]"
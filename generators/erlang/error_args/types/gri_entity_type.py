@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from ..base import ErrorArgType
 from ..translation.expressions import FunCallExpression
@@ -21,6 +21,7 @@ class GriEntityType(ErrorArgType):
     """GRI entity type."""
 
     fmt_control_sequence: ClassVar[str] = "~ts"
+    binary_print_template: ClassVar[Optional[str]] = "{print_var}"
     json_encoding_strategy: ClassVar[JsonEncodingStrategy] = CustomStrategy(
         FunCallExpression("gri", "serialize_type", ["{erl_var}"])
     )
@@ -28,3 +29,6 @@ class GriEntityType(ErrorArgType):
     json_decoding_strategy: ClassVar[JsonDecodingStrategy] = CustomStrategy(
         FunCallExpression("gri", "deserialize_type", ["{json_var}"])
     )
+
+    def sample_erlang_value(self) -> str:
+        return "od_user"
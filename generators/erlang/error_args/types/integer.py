@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from ..base import ErrorArgType
 
@@ -13,3 +13,7 @@ class Integer(ErrorArgType):
     """Integer type."""
 
     fmt_control_sequence: ClassVar[str] = "~B"
+    binary_print_template: ClassVar[Optional[str]] = "(integer_to_binary({print_var}))"
+
+    def sample_erlang_value(self) -> str:
+        return "42"
@@ -25,3 +25,6 @@ class InviteTokenType(ErrorArgType):
     json_decoding_strategy: ClassVar[JsonDecodingStrategy] = CustomStrategy(
         FunCallExpression("token_type", "invite_type_from_str", ["{json_var}"]),
     )
+
+    def sample_erlang_value(self) -> str:
+        return "any"
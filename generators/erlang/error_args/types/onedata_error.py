@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from ..base import ErrorArgType
 from ..translation.expressions import FunCallExpression
@@ -20,6 +20,7 @@ class OnedataError(ErrorArgType):
     """Onedata error type."""
 
     fmt_control_sequence: ClassVar[str] = "~ts"
+    binary_print_template: ClassVar[Optional[str]] = "{print_var}"
     json_encoding_strategy: ClassVar[JsonEncodingStrategy] = CustomStrategy(
         FunCallExpression("errors", "to_json", ["{erl_var}"])
     )
@@ -29,3 +30,10 @@ class OnedataError(ErrorArgType):
     json_decoding_strategy: ClassVar[JsonDecodingStrategy] = CustomStrategy(
         FunCallExpression("errors", "from_json", ["{json_var}"])
     )
+
+    def sample_erlang_value(self) -> str:
+        # Unrecognized error is the only one defined regardless of definitions
+        return (
+            '?ERR_UNRECOGNIZED_ERROR(#{<<"id">> => <<"sampleError">>, '
+            '<<"description">> => <<"Sample error.">>})'
+        )
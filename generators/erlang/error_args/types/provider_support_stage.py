@@ -25,3 +25,6 @@ class ProviderSupportStage(ErrorArgType):
     json_decoding_strategy: ClassVar[JsonDecodingStrategy] = CustomStrategy(
         FunCallExpression("support_stage", "deserialize", ["provider", "{json_var}"])
     )
+
+    def sample_erlang_value(self) -> str:
+        return "active"
@@ -25,3 +25,6 @@ class StorageSupportStage(ErrorArgType):
     json_decoding_strategy: ClassVar[JsonDecodingStrategy] = CustomStrategy(
         FunCallExpression("support_stage", "deserialize", ["storage", "{json_var}"])
     )
+
+    def sample_erlang_value(self) -> str:
+        return "active"
@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, List
 
 from ..base import ErrorArgType
 from ..translation.expressions import FunCallExpression
@@ -29,3 +29,7 @@ class TokenType(ErrorArgType):
     json_decoding_strategy: ClassVar[JsonDecodingStrategy] = CustomStrategy(
         FunCallExpression("token_type", "from_json", ["{json_var}"])
     )
+    sample_includes: ClassVar[List[str]] = ["aai/aai.hrl"]
+
+    def sample_erlang_value(self) -> str:
+        return "?IDENTITY_TOKEN"
@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from ..base import ErrorArgType
 from ..translation.expressions import CodeLine, CodeLines
@@ -15,6 +15,7 @@ class TscLayout(ErrorArgType):
     """Time series collection layout type."""
 
     fmt_control_sequence: ClassVar[str] = "~ts"
+    binary_print_template: ClassVar[Optional[str]] = "{print_var}"
     print_encoding_strategy: ClassVar[PrintEncodingStrategy] = CustomStrategy(
         CodeLines(
             [
@@ -30,3 +31,6 @@ class TscLayout(ErrorArgType):
             ]
         )
     )
+
+    def sample_erlang_value(self) -> str:
+        return '#{<<"timeSeries">> => [<<"metric1">>, <<"metric2">>]}'
@@ -4,7 +4,7 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from typing import ClassVar
+from typing import ClassVar, List, Optional
 
 from ..base import ErrorArgType
 from ..translation.expressions import FunCallExpression
@@ -20,6 +20,7 @@ class MetricConfig(ErrorArgType):
     """Metric config type."""
 
     fmt_control_sequence: ClassVar[str] = "~ts"
+    binary_print_template: ClassVar[Optional[str]] = "{print_var}"
     json_encoding_strategy: ClassVar[JsonEncodingStrategy] = CustomStrategy(
         FunCallExpression("jsonable_record", "to_json", ["{erl_var}", "metric_config"])
     )
@@ -31,3 +32,7 @@ class MetricConfig(ErrorArgType):
             "jsonable_record", "from_json", ["{json_var}", "metric_config"]
         )
     )
+    sample_includes: ClassVar[List[str]] = ["time_series/common.hrl"]
+
+    def sample_erlang_value(self) -> str:
+        return "#metric_config{resolution = 60, retention = 1440, aggregator = sum}"
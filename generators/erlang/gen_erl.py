@@ -4,28 +4,292 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
+import argparse
+import json
 import os
 import shutil
+from typing import List, Optional
 
-from .constants import OUTPUT_DIR
-from .generators.error_types import generate_error_types
-from .generators.errors_headers import generate_errors_headers
-from .generators.errors_interface import generate_errors_interface_module
-from .generators.od_error import generate_od_error_behaviour
+from ..common.cli import add_jobs_argument, add_no_cache_argument
+from .constants import CACHE_DIR, OUTPUT_DIR
+from .generators.local_helpers import OUTPUT_PROFILES
+from .generators.od_error import REVISION_MODES, generate_version
+from .generators.options import GenerationOptions
+from .generators.outputs import generate_outputs
+from .generators.utils import get_generated_files, hash_file, reset_generated_files
+from .loaders.definitions_bundle import save_definitions_bundle
 from .loaders.error_definitions_loader import load_error_definitions
 from .loaders.template_loader import load_templates
+from .manifest import (
+    Manifest,
+    collect_input_hashes,
+    is_up_to_date,
+    load_manifest,
+    remove_orphaned_outputs,
+    save_manifest,
+)
+from .profiling import PHASES, Profiler, measure
+from .watch import DEFAULT_POLL_INTERVAL, watch
 
 
-def main():
-    clean_output_dir()
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    profiler = Profiler(args.profile) if args.timings or args.profile else None
+    options = GenerationOptions(
+        inline_descriptions=args.inline_descriptions,
+        match_details_in_head=args.match_details_in_head,
+        monolith=args.monolith,
+        peephole=args.peephole,
+        output_profile=args.output_profile,
+        revision=args.revision,
+        bench=args.bench,
+    )
 
-    templates = load_templates()
-    error_groups = load_error_definitions()
+    if args.compile_definitions:
+        compile_definitions(
+            args.compile_definitions,
+            jobs=args.jobs,
+            use_cache=args.use_cache,
+            profiler=profiler,
+        )
+    elif args.incremental:
+        generate_incrementally(
+            jobs=args.jobs,
+            use_cache=args.use_cache,
+            from_bundle=args.from_bundle,
+            profiler=profiler,
+            options=options,
+        )
+    else:
+        clean_output_dir()
+        generate(
+            jobs=args.jobs,
+            use_cache=args.use_cache,
+            from_bundle=args.from_bundle,
+            profiler=profiler,
+            options=options,
+        )
 
-    generate_errors_headers(error_groups, templates)
-    generate_od_error_behaviour(templates.od_error, error_groups)
-    generate_errors_interface_module(templates.errors_erl)
-    generate_error_types(error_groups, templates.error)
+    if profiler and args.timings:
+        profiler.print_report()
+
+    if args.watch and not args.compile_definitions:
+        watch(
+            poll_interval=args.poll_interval,
+            use_cache=args.use_cache,
+            options=options,
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m generators.erlang.gen_erl",
+        description="Generates Erlang code from onedata error definitions.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "do not wipe output directory - rewrite only files whose content "
+            "changed and remove only those that are no longer generated"
+        ),
+    )
+    add_jobs_argument(
+        parser,
+        help_text=(
+            "number of worker processes to use (1 - work serially, which is "
+            "the default; if N is omitted - number of CPUs)"
+        ),
+    )
+    add_no_cache_argument(parser)
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "after generation keep running and regenerate affected outputs "
+            "whenever definitions or templates change"
+        ),
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        metavar="SECONDS",
+        help="how often to check for changes in watch mode (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--compile-definitions",
+        metavar="BUNDLE_PATH",
+        help=(
+            "instead of generating code, compile validated error definitions "
+            "into a single bundle file"
+        ),
+    )
+    parser.add_argument(
+        "--from-bundle",
+        metavar="BUNDLE_PATH",
+        help=(
+            "generate code from definitions bundle (see --compile-definitions) "
+            "instead of definitions directory"
+        ),
+    )
+
+    parser.add_argument(
+        "--inline-descriptions",
+        action="store_true",
+        help=(
+            "build error descriptions by binary construction instead of "
+            "formatting them at runtime (wherever possible)"
+        ),
+    )
+    parser.add_argument(
+        "--match-details-in-head",
+        action="store_true",
+        help=(
+            "decode required error details by matching them in a single map "
+            "pattern in from_json function head"
+        ),
+    )
+    parser.add_argument(
+        "--monolith",
+        action="store_true",
+        help=(
+            "implement callbacks of all errors in a single od_errors_impl module "
+            "(modules per error only define error types)"
+        ),
+    )
+    parser.add_argument(
+        "--no-peephole",
+        dest="peephole",
+        action="store_false",
+        help=(
+            "do not optimize code generated for error arguments (remove "
+            "redundant temporary variables and case clauses)"
+        ),
+    )
+    parser.add_argument(
+        "--output-profile",
+        choices=OUTPUT_PROFILES,
+        default="default",
+        help=(
+            "in 'optimized' profile calls of small remote helpers (e.g. "
+            "utils:undefined_to_null/1) are replaced with calls of local "
+            "helpers compiled inline into each module (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--revision",
+        choices=REVISION_MODES,
+        default="git",
+        help=(
+            "revision embedded in od_error.erl - hash of current git commit "
+            "(default) or of definitions, templates and generator sources, "
+            "which changes only when generated code may change"
+        ),
+    )
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help=(
+            "generate also errors_bench.erl module measuring throughput and "
+            "allocations of callbacks of every error type (for sample args)"
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help=(
+            "report wall time, CPU time and peak RSS of each generation phase "
+            "and the slowest errors to render"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PHASES,
+        metavar="PHASE",
+        help=(
+            "profile given generation phase with cProfile and dump its stats to "
+            f"'{CACHE_DIR}/PHASE.pstats' (only the main process is profiled, so "
+            f"use it without --jobs); one of: {', '.join(PHASES)}"
+        ),
+    )
+
+    args = parser.parse_args(argv)
+    if args.from_bundle and args.watch:
+        parser.error("--watch can not be used with --from-bundle")
+
+    return args
+
+
+def generate(
+    *,
+    jobs: int = 1,
+    use_cache: bool = True,
+    from_bundle: Optional[str] = None,
+    profiler: Optional[Profiler] = None,
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    with measure(profiler, "load_templates"):
+        templates = load_templates()
+    error_groups = load_error_definitions(
+        jobs=jobs, use_cache=use_cache, from_bundle=from_bundle, profiler=profiler
+    )
+    generate_outputs(
+        templates, error_groups, jobs=jobs, profiler=profiler, options=options
+    )
+
+
+def generate_incrementally(
+    *,
+    jobs: int = 1,
+    use_cache: bool = True,
+    from_bundle: Optional[str] = None,
+    profiler: Optional[Profiler] = None,
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    """Regenerate only outputs affected by changes since previous run."""
+    # Options alter generated code and so does git revision (if embedded in
+    # od_error.erl), so they are inputs too. Content revision is derived from
+    # other inputs
+    inputs = {
+        **collect_input_hashes(),
+        "<options>": json.dumps(options._asdict(), sort_keys=True),
+    }
+    if options.revision == "git":
+        inputs["<revision>"] = generate_version()
+    if from_bundle:
+        inputs[os.path.normpath(from_bundle)] = hash_file(from_bundle)
+
+    manifest = load_manifest()
+    if manifest and is_up_to_date(manifest, inputs):
+        return
+
+    reset_generated_files()
+    generate(
+        jobs=jobs,
+        use_cache=use_cache,
+        from_bundle=from_bundle,
+        profiler=profiler,
+        options=options,
+    )
+
+    outputs = get_generated_files()
+    remove_orphaned_outputs(outputs)
+    save_manifest(Manifest(inputs=inputs, outputs=outputs))
+
+
+def compile_definitions(
+    bundle_path: str,
+    *,
+    jobs: int = 1,
+    use_cache: bool = True,
+    profiler: Optional[Profiler] = None,
+) -> None:
+    """Compile error definitions into bundle file."""
+    error_groups = load_error_definitions(
+        jobs=jobs, use_cache=use_cache, profiler=profiler
+    )
+    save_definitions_bundle(error_groups, bundle_path)
 
 
 def clean_output_dir() -> None:
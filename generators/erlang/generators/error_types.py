@@ -4,13 +4,19 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
+import functools
+import json
 import os
 import re
-from typing import Dict, List, NamedTuple, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from ..constants import ERROR_TYPES_DIR, HTTP_CODE_TO_MACRO, INDENT
 from ..error_definitions import OdError, OdErrorGroup
-from .utils import write_to_file
+from ..profiling import Profiler, measure
+from .errors_headers import get_error_group_hrl_include_path
+from .local_helpers import localize_helpers
+from .options import GenerationOptions
+from .utils import render_in_parallel, write_to_file
 
 
 class FormatPlaceholders(NamedTuple):
@@ -19,42 +25,123 @@ class FormatPlaceholders(NamedTuple):
     placeholders: List[str]
     fmt_vars: Dict[str, str]
     control_sequences: Dict[str, str]
+    binary_exprs: Dict[str, str]
+
+
+class ErrorCallbacks(NamedTuple):
+    """Code of od_error callbacks implemented for an error."""
+
+    to_json: str
+    to_json_with_opts: str
+    to_json_iodata: str
+    from_json: str
+    to_http_code: str
+    to_errno: str
+
+
+def generate_error_types(
+    error_groups: List[OdErrorGroup],
+    template: str,
+    jobs: int = 1,
+    profiler: Optional[Profiler] = None,
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    """Generate individual error type modules for each error group.
+
+    With jobs > 1 modules are rendered in parallel by a pool of that many
+    worker processes and written afterwards. The output does not depend on
+    jobs count.
+    """
+    od_errors = [od_error for group in error_groups for od_error in group.errors]
+    group_names = [group.name for group in error_groups for _ in group.errors]
+
+    with measure(profiler, "render_error_types"):
+        rendered = render_in_parallel(
+            functools.partial(render_error_type, template=template, options=options),
+            od_errors,
+            group_names,
+            jobs,
+            profiler,
+        )
 
+    with measure(profiler, "write_error_types"):
+        for group_name, od_error, erl_content in zip(group_names, od_errors, rendered):
+            write_to_file(get_error_type_file_path(group_name, od_error), erl_content)
+
+
+def generate_error_type(
+    od_error: OdError,
+    group_name: str,
+    template: str,
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    """Generate single error type module."""
+    file_path = get_error_type_file_path(group_name, od_error)
+    write_to_file(file_path, render_error_type(od_error, group_name, template, options))
+
+
+def get_error_type_file_path(group_name: str, od_error: OdError) -> str:
+    return os.path.join(ERROR_TYPES_DIR, group_name, f"{od_error.type}.erl")
+
+
+def render_error_type(
+    od_error: OdError,
+    group_name: str,
+    template: str,
+    options: GenerationOptions = GenerationOptions(),
+) -> str:
+    """Render error type module.
+
+    Only header of error's group is included (along with errors_base.hrl and
+    custom headers of error) so that the module is not recompiled whenever
+    an error of other group changes.
+    """
+    includes = "\n".join(
+        f'-include("{hrl}").'
+        for hrl in [
+            get_error_group_hrl_include_path(group_name),
+            *od_error.ctx.includes,
+        ]
+    )
+    callbacks = render_error_callbacks(od_error, options)
 
-def generate_error_types(error_groups: List[OdErrorGroup], template: str) -> None:
-    """Generate individual error type modules for each error group."""
-    for group in error_groups:
-        group_dir = os.path.join(ERROR_TYPES_DIR, group.name)
-        os.makedirs(group_dir, exist_ok=True)
-
-        for od_error in group.errors:
-            _generate_error_type(od_error, group_dir, template)
-
-
-def _generate_error_type(od_error: OdError, output_dir: str, template: str) -> None:
-    includes = "\n".join(f'-include("{hrl}").' for hrl in od_error.ctx.includes)
-
-    erl_content = template.format(
+    return template.format(
         includes=includes,
         error_type=od_error.type,
-        to_json=_generate_to_json_callback(od_error),
-        from_json=_generate_from_json_callback(od_error),
-        to_http_code=_generate_to_http_code_callback(od_error),
-        to_errno=_generate_to_errno_callback(od_error),
+        **localize_helpers(callbacks._asdict(), options),
     )
 
-    file_path = os.path.join(output_dir, f"{od_error.type}.erl")
-    write_to_file(file_path, erl_content)
 
+def render_error_callbacks(
+    od_error: OdError, options: GenerationOptions = GenerationOptions()
+) -> ErrorCallbacks:
+    """Render od_error callbacks of error.
+
+    In monolith mode callbacks of all errors are implemented by one module,
+    so every clause matches only given error and there are no specs.
+    """
+    return ErrorCallbacks(
+        to_json=_generate_to_json_callback(od_error, options),
+        to_json_with_opts=_generate_to_json_with_opts_callback(od_error, options),
+        to_json_iodata=_generate_to_json_iodata_callback(od_error, options),
+        from_json=_generate_from_json_callback(od_error, options),
+        to_http_code=_generate_to_http_code_callback(od_error, options),
+        to_errno=_generate_to_errno_callback(od_error, options),
+    )
 
-def _generate_to_json_callback(od_error: OdError) -> str:
+
+def _generate_to_json_callback(od_error: OdError, options: GenerationOptions) -> str:
     if od_error.to_json_impl:
-        return od_error.to_json_impl.strip()
+        return _get_custom_impl(od_error.to_json_impl, "to_json", od_error, options)
 
     fmt_info = _collect_format_placeholders(od_error)
-    encoding_tokens, details_tokens = _generate_encoding_and_details(od_error, fmt_info)
+    encoding_tokens, details_tokens = _generate_encoding_and_details(
+        od_error, fmt_info, options
+    )
 
-    description_tokens = _generate_description_tokens(od_error.description, fmt_info)
+    description_tokens = _generate_description_tokens(
+        od_error.description, fmt_info, inline=options.inline_descriptions
+    )
 
     return "".join(
         [
@@ -71,22 +158,201 @@ def _generate_to_json_callback(od_error: OdError) -> str:
     )
 
 
+def _generate_to_json_with_opts_callback(
+    od_error: OdError, options: GenerationOptions
+) -> str:
+    """Generate to_json/2 callback skipping optional fields if requested.
+
+    Fields disabled in options are not computed at all (the custom to_json
+    implementations are the exception - they are called and the fields are
+    removed from their result afterwards).
+    """
+    if od_error.to_json_impl:
+        return "".join(
+            [
+                f"to_json({_match_any(od_error, options, 'Error')}, Opts) ->\n",
+                f"{INDENT}od_error:apply_to_json_opts(to_json(Error), Opts).",
+            ]
+        )
+
+    fmt_info = _collect_format_placeholders(od_error)
+    print_encoding_tokens: List[str] = []
+    encoding_tokens, details_tokens = _generate_encoding_and_details(
+        od_error, fmt_info, options, print_encoding_tokens
+    )
+
+    description_tokens = _generate_description_tokens(
+        od_error.description, fmt_info, inline=options.inline_descriptions
+    )
+    # Description (and print encodings it needs) is nested 2 levels deeper
+    # than in to_json/1
+    description = (
+        "".join(description_tokens).rstrip("\n").replace("\n", f"\n{2*INDENT}")
+    )
+    print_encoding = "".join(
+        f"{2*INDENT}{line}" if line.strip() else line
+        for line in "".join(print_encoding_tokens).splitlines(keepends=True)
+    )
+    if details_tokens:
+        # Details are the last field of ErrorJson - replace trailing comma
+        details_tokens = [",\n", *details_tokens[:-1], f"\n{2*INDENT}}}"]
+
+    return "".join(
+        [
+            f"to_json(?{od_error.get_new_macro()}, Opts) ->\n",
+            *encoding_tokens,
+            f"{INDENT}ErrorJson = #{{\n",
+            f'{2*INDENT}<<"id">> => ?{od_error.get_id_macro()}',
+            *details_tokens,
+            f"\n{INDENT}}},\n",
+            f"{INDENT}ErrorJsonWithCtx = case maps:get(ctx, Opts, true) of\n",
+            f"{2*INDENT}true ->\n",
+            f'{3*INDENT}ErrorJson#{{<<"ctx">> => od_error:ctx_to_json(ErrorCtx)}};\n',
+            f"{2*INDENT}false ->\n",
+            f"{3*INDENT}ErrorJson\n",
+            f"{INDENT}end,\n",
+            f"{INDENT}case maps:get(description, Opts, true) of\n",
+            f"{2*INDENT}true ->\n",
+            print_encoding,
+            f"{3*INDENT}ErrorJsonWithCtx#{{\n",
+            f'{4*INDENT}<<"description">> => {description}\n',
+            f"{3*INDENT}}};\n",
+            f"{2*INDENT}false ->\n",
+            f"{3*INDENT}ErrorJsonWithCtx\n",
+            f"{INDENT}end.",
+        ]
+    )
+
+
+def _generate_to_json_iodata_callback(
+    od_error: OdError, options: GenerationOptions
+) -> str:
+    """Generate to_json_iodata/1 callback writing error JSON directly.
+
+    Keys, id and literal parts of description are escaped at generation
+    time - only dynamic values are encoded at runtime. The result decodes to
+    exactly what to_json/1 returns (for custom to_json implementations it is
+    simply encoded).
+    """
+    if od_error.to_json_impl:
+        return "".join(
+            [
+                f"to_json_iodata({_match_any(od_error, options, 'Error')}) ->\n",
+                f"{INDENT}json_utils:encode(to_json(Error)).",
+            ]
+        )
+
+    fmt_info = _collect_format_placeholders(od_error)
+    encoding_tokens, _ = _generate_encoding_and_details(od_error, fmt_info, options)
+
+    # Alternating JSON fragments (even indices) and Erlang expressions
+    # evaluating to iodata (odd indices)
+    segments = [
+        f'{{"id":{json.dumps(od_error.id)},"ctx":',
+        "od_error:ctx_to_json_iodata(ErrorCtx)",
+    ]
+    if od_error.args:
+        separator = ',"details":{'
+        for arg in od_error.args:
+            arg_encoding = arg.generate_to_json_encoding(
+                is_printed=arg.name in fmt_info.placeholders,
+                optimize=options.peephole,
+            )
+            segments.append(f"{separator}{json.dumps(arg.name)}:")
+            segments.append(f"json_utils:encode({arg_encoding.json_var})")
+            separator = ","
+        segments.append('},"description":')
+    else:
+        segments.append(',"description":')
+
+    # Literal parts of description are pre-escaped regardless of
+    # inline_descriptions - the description is not formatted as a whole here
+    description_segments = _generate_description_iodata_segments(
+        od_error.description, fmt_info, inline=True
+    )
+    segments[-1] += description_segments[0]
+    segments.extend(description_segments[1:])
+    segments[-1] += "}"
+
+    elements = [
+        _build_json_fragment_literal(segment) if index % 2 == 0 else segment
+        for index, segment in enumerate(segments)
+        if index % 2 == 1 or segment
+    ]
+    return "".join(
+        [
+            f"to_json_iodata(?{od_error.get_new_macro()}) ->\n",
+            *encoding_tokens,
+            f"{INDENT}[\n",
+            *[f"{2*INDENT}{element},\n" for element in elements[:-1]],
+            f"{2*INDENT}{elements[-1]}\n",
+            f"{INDENT}].",
+        ]
+    )
+
+
+def _generate_description_iodata_segments(
+    description: str, fmt_info: FormatPlaceholders, *, inline: bool = False
+) -> List[str]:
+    """Generate description JSON string as alternating JSON fragments and
+    Erlang expressions (starting and ending with fragment)."""
+    if not fmt_info.placeholders:
+        return [json.dumps(description)]
+
+    if inline:
+        parts, normalize_at_runtime = _split_inline_description(description, fmt_info)
+        if not normalize_at_runtime:
+            segments = []
+            for index, part in enumerate(parts):
+                if index % 2 == 0:
+                    # Strip quotes - the fragment is a part of larger string
+                    segments.append(json.dumps(part)[1:-1])
+                else:
+                    segments.append(f"od_error:json_escape({part})")
+            return [f'"{segments[0]}', *segments[1:-1], f'{segments[-1]}"']
+
+    description_tokens = _generate_description_tokens(
+        description, fmt_info, inline=inline
+    )
+    description_expr = "".join(description_tokens).rstrip("\n")
+    return ["", f"json_utils:encode({description_expr})", ""]
+
+
+def _build_json_fragment_literal(fragment: str) -> str:
+    # JSON fragments are pure ASCII (json.dumps escapes other characters)
+    escaped_fragment = fragment.replace("\\", "\\\\").replace('"', '\\"')
+    return f'<<"{escaped_fragment}">>'
+
+
 def _collect_format_placeholders(od_error: OdError) -> FormatPlaceholders:
     fmt_placeholders = re.findall(r"\{(\w+)\}", od_error.description)
     fmt_vars: Dict[str, str] = {}
     control_sequences: Dict[str, str] = {}
+    binary_exprs: Dict[str, str] = {}
 
     for macro in od_error.ctx.macros:
         if macro.alias in fmt_placeholders:
             fmt_vars[macro.alias] = macro.ref
             control_sequences[macro.alias] = macro.fmt_control_sequence
 
-    return FormatPlaceholders(fmt_placeholders, fmt_vars, control_sequences)
+    return FormatPlaceholders(
+        fmt_placeholders, fmt_vars, control_sequences, binary_exprs
+    )
 
 
 def _generate_encoding_and_details(
-    od_error: OdError, fmt_info: FormatPlaceholders
+    od_error: OdError,
+    fmt_info: FormatPlaceholders,
+    options: GenerationOptions,
+    print_encoding_tokens: Optional[List[str]] = None,
 ) -> Tuple[List[str], List[str]]:
+    """Generate tokens encoding args and building details of error JSON.
+
+    If print_encoding_tokens list is given, bindings of print variables used
+    only by description are put in it instead of encoding tokens (wherever
+    they are separable - print encodings of nullable args are built in the
+    same case expression as their JSON encodings).
+    """
     encoding_tokens: List[str] = []
     details_tokens: List[str] = []
 
@@ -96,12 +362,16 @@ def _generate_encoding_and_details(
     details_tokens.append(f'{2*INDENT}<<"details">> => #{{\n')
 
     for arg in od_error.args:
+        is_printed = arg.name in fmt_info.placeholders
         arg_encoding = arg.generate_to_json_encoding(
-            is_printed=arg.name in fmt_info.placeholders
+            is_printed=is_printed, optimize=options.peephole
         )
 
-        if arg_encoding.tokens:
-            encoding_tokens.extend(arg_encoding.tokens)
+        encoding_tokens.extend(arg_encoding.tokens)
+        if print_encoding_tokens is not None:
+            print_encoding_tokens.extend(arg_encoding.print_tokens)
+        else:
+            encoding_tokens.extend(arg_encoding.print_tokens)
 
         details_tokens.extend(
             [3 * INDENT, f'<<"{arg.name}">> => {arg_encoding.json_var}', ",\n"]
@@ -111,6 +381,10 @@ def _generate_encoding_and_details(
             fmt_info.fmt_vars[arg.name] = arg_encoding.print_var
             fmt_info.control_sequences[arg.name] = arg.fmt_control_sequence
 
+            binary_expr = arg.get_binary_print_expression(arg_encoding.print_var)
+            if binary_expr:
+                fmt_info.binary_exprs[arg.name] = binary_expr
+
     if encoding_tokens:
         encoding_tokens.append("\n")
 
@@ -120,9 +394,11 @@ def _generate_encoding_and_details(
 
 
 def _generate_description_tokens(
-    description: str,
-    fmt_info: FormatPlaceholders,
+    description: str, fmt_info: FormatPlaceholders, *, inline: bool = False
 ) -> List[str]:
+    if inline and fmt_info.placeholders:
+        return _generate_inline_description_tokens(description, fmt_info)
+
     if fmt_info.placeholders:
         fmt_str = (
             description.replace("\n", "\\n")
@@ -145,14 +421,83 @@ def _generate_description_tokens(
     return [f'<<"{description}">>\n']
 
 
-def _generate_from_json_callback(od_error: OdError) -> str:
+def _generate_inline_description_tokens(
+    description: str, fmt_info: FormatPlaceholders
+) -> List[str]:
+    """Generate description built by binary construction.
+
+    Literal parts are embedded as they are and holes are converted to binaries
+    according to their types (or formatted on their own if type is not known
+    to be convertible). Trailing periods are normalized (as done by
+    od_error:format_description/2) at generation time, unless description
+    ends with a hole whose value may end with a period.
+    """
+    parts, normalize_at_runtime = _split_inline_description(description, fmt_info)
+
+    segments = []
+    for index, part in enumerate(parts):
+        if index % 2 == 0:
+            if part:
+                segments.append(_build_binary_literal_segment(part))
+        else:
+            segments.append(f"{part}/binary")
+
+    tokens = [
+        "<<\n",
+        *[f"{3*INDENT}{segment},\n" for segment in segments[:-1]],
+        f"{3*INDENT}{segments[-1]}\n",
+        f"{2*INDENT}>>",
+    ]
+    if normalize_at_runtime:
+        tokens[0] = f"od_error:normalize_trailing_period({tokens[0]}"
+        tokens[-1] += ")"
+
+    tokens[-1] += "\n"
+    return tokens
+
+
+def _split_inline_description(
+    description: str, fmt_info: FormatPlaceholders
+) -> Tuple[List[str], bool]:
+    """Split description into literal parts (even indices) and expressions
+    evaluating to binaries substituted for holes (odd indices).
+
+    Returns also whether trailing period must be normalized at runtime (in
+    which case the last literal part is empty).
+    """
+    parts = re.split(r"\{(\w+)\}", description)
+    trailing_literal = parts[-1].rstrip(".")
+    parts[-1] = f"{trailing_literal}." if trailing_literal else ""
+
+    for index in range(1, len(parts), 2):
+        placeholder = parts[index]
+        if placeholder in fmt_info.binary_exprs:
+            parts[index] = fmt_info.binary_exprs[placeholder]
+        else:
+            control_sequence = fmt_info.control_sequences[placeholder]
+            fmt_var = fmt_info.fmt_vars[placeholder]
+            parts[index] = f'(str_utils:format_bin("{control_sequence}", [{fmt_var}]))'
+
+    return parts, not trailing_literal
+
+
+def _build_binary_literal_segment(text: str) -> str:
+    escaped_text = text.replace("\n", "\\n").replace('"', '\\"')
+    # Binary segments are by default latin1 - non-ASCII text must be marked
+    return f'"{escaped_text}"' if text.isascii() else f'"{escaped_text}"/utf8'
+
+
+def _generate_from_json_callback(od_error: OdError, options: GenerationOptions) -> str:
     if od_error.from_json_impl:
-        return od_error.from_json_impl.strip()
+        return _get_custom_impl(od_error.from_json_impl, "from_json", od_error, options)
+
+    if options.match_details_in_head and any(not arg.nullable for arg in od_error.args):
+        return _generate_from_json_matching_details(od_error, options)
 
-    return _generate_default_from_json(od_error)
+    return _generate_default_from_json(od_error, options)
 
 
-def _generate_default_from_json(od_error: OdError) -> str:
+def _generate_default_from_json(od_error: OdError, options: GenerationOptions) -> str:
     tokens = [
         "from_json(OdErrorJson = ",
         f'#{{<<"id">> := ?{od_error.get_id_macro()}}}',
@@ -163,14 +508,63 @@ def _generate_default_from_json(od_error: OdError) -> str:
 
     if od_error.args:
         tokens.append("\n")
-        tokens.extend(_generate_args_decoding(od_error))
+        tokens.extend(_generate_args_decoding(od_error, options))
+
+    tokens.append(f"{INDENT}?{od_error.get_new_macro()}.")
+
+    return "".join(tokens)
+
+
+def _generate_from_json_matching_details(
+    od_error: OdError, options: GenerationOptions
+) -> str:
+    """Generate from_json matching required details in function head.
+
+    Only nullable args (which may be missing) are looked up in details.
+    """
+    details_var = "DetailsJson"
+    details_binding = (
+        f"{details_var} = " if any(arg.nullable for arg in od_error.args) else ""
+    )
+    details_patterns = ",\n".join(
+        f'{2*INDENT}<<"{arg.name}">> := {arg.get_details_pattern_var()}'
+        for arg in od_error.args
+        if not arg.nullable
+    )
+
+    tokens = [
+        "from_json(OdErrorJson = #{\n",
+        f'{INDENT}<<"id">> := ?{od_error.get_id_macro()},\n',
+        f'{INDENT}<<"details">> := {details_binding}#{{\n',
+        details_patterns,
+        f"\n{INDENT}}}\n",
+        "}) ->\n",
+        f'{INDENT}ErrorCtxJson = maps:get(<<"ctx">>, OdErrorJson, #{{}}),\n',
+        f"{INDENT}ErrorCtx = od_error:ctx_from_json(ErrorCtxJson),\n",
+    ]
+
+    decoding_tokens = []
+    for arg in od_error.args:
+        if arg.nullable:
+            decoding_tokens.extend(
+                arg.generate_from_json_decoding(
+                    details_var=details_var, optimize=options.peephole
+                )
+            )
+        else:
+            decoding_tokens.extend(
+                arg.generate_from_matched_json_decoding(optimize=options.peephole)
+            )
+
+    if decoding_tokens:
+        tokens.extend(["\n", *decoding_tokens, "\n"])
 
     tokens.append(f"{INDENT}?{od_error.get_new_macro()}.")
 
     return "".join(tokens)
 
 
-def _generate_args_decoding(od_error: OdError) -> List[str]:
+def _generate_args_decoding(od_error: OdError, options: GenerationOptions) -> List[str]:
     """Generate tokens for decoding error arguments from JSON."""
     details_var = "DetailsJson"
     tokens = [f'{INDENT}{details_var} = maps:get(<<"details">>, OdErrorJson']
@@ -180,41 +574,139 @@ def _generate_args_decoding(od_error: OdError) -> List[str]:
     tokens.append("),\n\n")
 
     for arg in od_error.args:
-        tokens.extend(arg.generate_from_json_decoding(details_var=details_var))
+        tokens.extend(
+            arg.generate_from_json_decoding(
+                details_var=details_var, optimize=options.peephole
+            )
+        )
 
     tokens.append("\n")
     return tokens
 
 
-def _generate_to_http_code_callback(od_error: OdError) -> str:
+def _generate_to_http_code_callback(
+    od_error: OdError, options: GenerationOptions
+) -> str:
     http_code = od_error.http_code
 
     if isinstance(http_code, int):
         http_code_macro = HTTP_CODE_TO_MACRO[http_code]
         return "".join(
             [
-                f"-spec to_http_code(t()) -> {http_code_macro}.\n",
-                "to_http_code(_) ->\n",
+                _build_spec(f"to_http_code(t()) -> {http_code_macro}", options),
+                f"to_http_code({_match_any(od_error, options)}) ->\n",
                 f"{INDENT}{http_code_macro}.",
             ]
         )
 
-    return http_code
+    if not options.monolith:
+        return http_code
+
+    return _get_custom_impl(http_code, "to_http_code", od_error, options)
 
 
-def _generate_to_errno_callback(od_error: OdError) -> str:
+def _generate_to_errno_callback(od_error: OdError, options: GenerationOptions) -> str:
     if od_error.to_errno_impl:
-        return od_error.to_errno_impl.strip()
+        return _get_custom_impl(od_error.to_errno_impl, "to_errno", od_error, options)
 
     if od_error.errno:
         return "".join(
             [
-                "-spec to_errno(t()) -> {true, od_error:errno()}.\n",
-                "to_errno(_) ->\n",
+                _build_spec("to_errno(t()) -> {true, od_error:errno()}", options),
+                f"to_errno({_match_any(od_error, options)}) ->\n",
                 f"{INDENT}{{true, ?{od_error.errno}}}.",
             ]
         )
 
     return "".join(
-        ["-spec to_errno(t()) -> false.\n", "to_errno(_) ->\n", f"{INDENT}false."]
+        [
+            _build_spec("to_errno(t()) -> false", options),
+            f"to_errno({_match_any(od_error, options)}) ->\n",
+            f"{INDENT}false.",
+        ]
     )
+
+
+def _match_any(
+    od_error: OdError, options: GenerationOptions, var: Optional[str] = None
+) -> str:
+    """Returns pattern matching any instance of error (in module dedicated to
+    the error simply anything matches)."""
+    if not options.monolith:
+        return var or "_"
+
+    pattern = f"?ERR(?{od_error.get_type_macro()})"
+    return f"{var} = {pattern}" if var else pattern
+
+
+def _build_spec(spec: str, options: GenerationOptions) -> str:
+    # Types of individual errors can not be used in module implementing all
+    # of them (specs of merged functions are defined by its template)
+    return "" if options.monolith else f"-spec {spec}.\n"
+
+
+def render_custom_impl_helpers(od_error: OdError) -> List[str]:
+    """Render private functions implementing custom callbacks of error in
+    monolith mode (called by clauses merged into callbacks, see
+    _get_custom_impl).
+
+    Custom clauses are copied as they are (only renamed), so that their heads
+    (e.g. `to_errno(_)`) can not shadow clauses of other errors. Specs and
+    comments preceding them are skipped as types of error are not known in
+    module implementing all of them.
+    """
+    custom_impls = [
+        ("to_json", od_error.to_json_impl),
+        ("from_json", od_error.from_json_impl),
+        (
+            "to_http_code",
+            od_error.http_code if isinstance(od_error.http_code, str) else None,
+        ),
+        ("to_errno", od_error.to_errno_impl),
+    ]
+
+    helpers = []
+    for function_name, impl in custom_impls:
+        if not impl:
+            continue
+
+        clause_head_regex = re.compile(rf"^{function_name}\(", re.MULTILINE)
+        function_start = clause_head_regex.search(impl)
+        if function_start is None:
+            raise ValueError(f"No {function_name} clause found in:\n{impl}")
+
+        helper_name = _get_custom_impl_helper_name(function_name, od_error)
+        clauses = clause_head_regex.sub(
+            f"{helper_name}(", impl[function_start.start() :].strip()
+        )
+        helpers.append(f"%% @private\n{clauses}")
+
+    return helpers
+
+
+def _get_custom_impl(
+    impl: str, function_name: str, od_error: OdError, options: GenerationOptions
+) -> str:
+    """Returns custom callback implementation.
+
+    In monolith mode clauses of all errors are merged into one function, so
+    instead of the implementation a clause matching only given error and
+    calling private function implementing it is returned (see
+    render_custom_impl_helpers).
+    """
+    if not options.monolith:
+        return impl.strip()
+
+    helper_name = _get_custom_impl_helper_name(function_name, od_error)
+    if function_name == "from_json":
+        var = "OdErrorJson"
+        pattern = f'{var} = #{{<<"id">> := ?{od_error.get_id_macro()}}}'
+    else:
+        var = "Error"
+        pattern = _match_any(od_error, options, var)
+
+    return f"{function_name}({pattern}) ->\n{INDENT}{helper_name}({var})."
+
+
+def _get_custom_impl_helper_name(function_name: str, od_error: OdError) -> str:
+    return f"{function_name}_{od_error.name}"
@@ -0,0 +1,68 @@
+"""Generator for errors_bench.erl benchmark module."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+from typing import List, Optional
+
+from ..constants import ERRORS_BENCH_FILE_PATH, INDENT
+from ..error_definitions import OdError, OdErrorGroup
+from .errors_interface import ERRORS_IMPL_MODULE
+from .options import GenerationOptions
+from .utils import write_to_file
+
+
+def generate_errors_bench_module(
+    template: str,
+    error_groups: List[OdErrorGroup],
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    """Generate errors_bench.erl module measuring callbacks of every error
+    (called for error built from sample values of its args).
+
+    Errors with args of types not providing sample values are skipped.
+    """
+    od_errors = []
+    samples = []
+    for group in error_groups:
+        for od_error in group.errors:
+            sample = _generate_sample_error(od_error)
+            if sample is not None:
+                od_errors.append(od_error)
+                samples.append(sample)
+
+    # Includes of all errors and of sample values (without duplicates)
+    includes = dict.fromkeys(
+        [hrl for od_error in od_errors for hrl in od_error.ctx.includes]
+        + [
+            hrl
+            for od_error in od_errors
+            for arg in od_error.args
+            for hrl in arg.sample_includes
+        ]
+    )
+
+    erl_content = template.format(
+        includes="\n".join(f'-include("{hrl}").' for hrl in includes),
+        dispatched_type="_" if options.monolith else "Type",
+        impl_module=ERRORS_IMPL_MODULE if options.monolith else "Type",
+        samples=",\n".join(f"{INDENT * 2}{sample}" for sample in samples),
+    )
+    write_to_file(ERRORS_BENCH_FILE_PATH, erl_content)
+
+
+def _generate_sample_error(od_error: OdError) -> Optional[str]:
+    error_type_macro = f"?{od_error.get_type_macro()}"
+    if not od_error.args:
+        return f"?ERR({error_type_macro})"
+
+    sample_values = []
+    for arg in od_error.args:
+        sample_value = arg.sample_erlang_value()
+        if sample_value is None:
+            return None
+        sample_values.append(sample_value)
+
+    args = ", ".join(sample_values)
+    return f"?ERR({error_type_macro}, {{{args}}})"
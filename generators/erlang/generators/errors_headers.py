@@ -1,16 +1,20 @@
-"""Generator for errors.hrl file."""
+"""Generator for errors.hrl and related header files."""
 
 __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
+import os
+import re
 from typing import List
 
 from ..constants import (
     ERROR_ATTRS_HRL_FILE_PATH,
+    ERROR_GROUP_HRL_DIR,
+    ERRORS_BASE_HRL_FILE_PATH,
     ERRORS_HRL_FILE_PATH,
-    HORIZONTAL_COMMENT_LINE,
     INDENT,
+    OUTPUT_DIR,
 )
 from ..error_definitions import OdError, OdErrorGroup
 from ..loaders.template_loader import Templates
@@ -20,40 +24,79 @@ from .utils import write_to_file
 def generate_errors_headers(
     error_groups: List[OdErrorGroup], templates: Templates
 ) -> None:
-    generate_error_attrs_hrl(error_groups, templates.error_attrs_hrl)
+    """Generate headers of error groups along with headers including them.
+
+    Header of a group changes only when errors of that group change, so that
+    modules including only headers of groups they use (along with
+    errors_base.hrl) are not affected by changes in other groups. Neither are
+    modules including errors.hrl (which includes headers of all groups) unless
+    a group is added or removed. error_attrs.hrl, defining mapping of all
+    error ids to types, changes whenever any error does and is not included
+    by errors.hrl.
+    """
+    generate_errors_base_hrl(templates.errors_base_hrl)
+    for error_group in error_groups:
+        generate_error_group_hrl(error_group, templates.error_group_hrl)
     generate_errors_hrl(error_groups, templates.errors_hrl)
+    generate_error_attrs_hrl(error_groups, templates.error_attrs_hrl)
 
 
-def generate_error_attrs_hrl(error_groups: List[OdErrorGroup], template: str) -> None:
-    macros = _generate_error_attrs_id_and_type_macros(error_groups)
-    id_to_type_mapping = _build_error_attrs_id_to_type_mapping(error_groups)
-    attrs_content = template.format(
-        macros=macros, id_to_type_mapping=id_to_type_mapping
+def generate_errors_base_hrl(template: str) -> None:
+    write_to_file(ERRORS_BASE_HRL_FILE_PATH, template.format())
+
+
+def generate_errors_hrl(error_groups: List[OdErrorGroup], template: str) -> None:
+    hrl_content = template.format(
+        group_includes=build_error_group_includes(error_groups)
     )
-    write_to_file(ERROR_ATTRS_HRL_FILE_PATH, attrs_content)
+    write_to_file(ERRORS_HRL_FILE_PATH, hrl_content)
 
 
-def _generate_error_attrs_id_and_type_macros(
-    error_groups: List[OdErrorGroup],
-) -> str:
+def generate_error_group_hrl(error_group: OdErrorGroup, template: str) -> None:
     lines = []
-    for error_group in error_groups:
-        lines.extend(_generate_errors_hrl_group_header(error_group))
+    for od_error in error_group.errors:
+        lines.extend(
+            [
+                _build_error_id_macro_definition(od_error),
+                _build_error_type_macro_definition(od_error),
+                _build_error_match_macro_definition(od_error),
+                _build_error_new_macro_definition(od_error),
+                "",
+            ]
+        )
+
+    hrl_content = template.format(
+        group_name=error_group.name,
+        guard=_build_error_group_hrl_guard(error_group),
+        macros="\n".join(lines),
+    )
+    write_to_file(
+        os.path.join(OUTPUT_DIR, get_error_group_hrl_include_path(error_group.name)),
+        hrl_content,
+    )
+
+
+def get_error_group_hrl_include_path(group_name: str) -> str:
+    return f"{ERROR_GROUP_HRL_DIR}/{group_name}.hrl"
+
+
+def build_error_group_includes(error_groups: List[OdErrorGroup]) -> str:
+    return "\n".join(
+        f'-include("{get_error_group_hrl_include_path(error_group.name)}").'
+        for error_group in error_groups
+    )
 
-        for od_error in error_group.errors:
-            lines.extend(
-                [
-                    _build_error_id_macro_definition(od_error),
-                    _build_error_type_macro_definition(od_error),
-                    "",
-                ]
-            )
 
-        lines.append("")
+def _build_error_group_hrl_guard(error_group: OdErrorGroup) -> str:
+    group_name = re.sub(r"\W", "_", error_group.name).upper()
+    return f"ERRORS_{group_name}_HRL"
 
-    # delete last empty line
-    del lines[-1]
-    return "\n".join(lines).strip()
+
+def generate_error_attrs_hrl(error_groups: List[OdErrorGroup], template: str) -> None:
+    attrs_content = template.format(
+        id_to_type_mapping=_build_error_attrs_id_to_type_mapping(error_groups),
+    )
+    write_to_file(ERROR_ATTRS_HRL_FILE_PATH, attrs_content)
 
 
 def _build_error_id_macro_definition(od_error: OdError) -> str:
@@ -78,32 +121,6 @@ def _generate_error_id_to_type_mapping(od_error: OdError) -> str:
     return f"{INDENT}?{od_error.get_id_macro()} => ?{od_error.get_type_macro()}"
 
 
-def generate_errors_hrl(error_groups: List[OdErrorGroup], template: str) -> None:
-    lines = _generate_errors_hrl_group_lines(error_groups)
-    hrl_content = template.format(macros="\n".join(lines))
-    write_to_file(ERRORS_HRL_FILE_PATH, hrl_content)
-
-
-def _generate_errors_hrl_group_lines(error_groups: List[OdErrorGroup]) -> List[str]:
-    lines = []
-    for error_group in error_groups:
-        lines.extend(_generate_errors_hrl_group_header(error_group))
-        for od_error in error_group.errors:
-            lines.extend(
-                [
-                    _build_error_match_macro_definition(od_error),
-                    _build_error_new_macro_definition(od_error),
-                    "",
-                ]
-            )
-
-        lines.append("")
-
-    # delete last empty line
-    del lines[-1]
-    return lines
-
-
 def _build_error_match_macro_definition(od_error: OdError) -> str:
     error_type_macro = f"?{od_error.get_type_macro()}"
     match_macro = od_error.get_match_macro()
@@ -128,11 +145,3 @@ def _build_error_new_macro_definition(od_error: OdError) -> str:
         error_expansion = f"?ERR({error_type_macro}, undefined, ErrorCtx)"
 
     return f"-define({new_macro}, {error_expansion})."
-
-
-def _generate_errors_hrl_group_header(error_group: OdErrorGroup) -> List[str]:
-    return [
-        HORIZONTAL_COMMENT_LINE,
-        f"%% {error_group.name} errors",
-        HORIZONTAL_COMMENT_LINE,
-    ]
@@ -0,0 +1,114 @@
+"""Generator for od_errors_impl.erl module (monolith mode)."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import functools
+from typing import Dict, List, Optional
+
+from ..constants import ERRORS_IMPL_FILE_PATH
+from ..error_definitions import OdError, OdErrorGroup
+from ..loaders.template_loader import Templates
+from ..profiling import Profiler, measure
+from .error_types import (
+    ErrorCallbacks,
+    get_error_type_file_path,
+    render_custom_impl_helpers,
+    render_error_callbacks,
+)
+from .local_helpers import localize_helpers
+from .options import GenerationOptions
+from .utils import render_in_parallel, write_to_file
+
+CUSTOM_IMPLS_HEADER: str = """
+
+%%%===================================================================
+%%% Custom callback implementations
+%%%===================================================================
+
+
+"""
+
+
+def generate_errors_impl_module(
+    error_groups: List[OdErrorGroup],
+    templates: Templates,
+    jobs: int = 1,
+    profiler: Optional[Profiler] = None,
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    """Generate od_errors_impl.erl module implementing callbacks of all errors
+    and error type modules defining only error types.
+
+    With jobs > 1 callbacks are rendered in parallel (see generate_error_types).
+    """
+    od_errors = [od_error for group in error_groups for od_error in group.errors]
+    group_names = [group.name for group in error_groups for _ in group.errors]
+
+    with measure(profiler, "render_error_types"):
+        callbacks = render_in_parallel(
+            functools.partial(_render_error_callbacks, options=options),
+            od_errors,
+            group_names,
+            jobs,
+            profiler,
+        )
+        erl_content = render_errors_impl_module(
+            od_errors, callbacks, templates.errors_impl, options
+        )
+
+    with measure(profiler, "write_error_types"):
+        write_to_file(ERRORS_IMPL_FILE_PATH, erl_content)
+        for group_name, od_error in zip(group_names, od_errors):
+            write_to_file(
+                get_error_type_file_path(group_name, od_error),
+                templates.error_type.format(error_type=od_error.type),
+            )
+
+
+def render_errors_impl_module(
+    od_errors: List[OdError],
+    callbacks: List[ErrorCallbacks],
+    template: str,
+    options: GenerationOptions = GenerationOptions(),
+) -> str:
+    """Render module merging callbacks of all errors into single functions."""
+    # Includes of all errors (in order of appearance, without duplicates)
+    includes = dict.fromkeys(
+        hrl for od_error in od_errors for hrl in od_error.ctx.includes
+    )
+
+    merged_callbacks: Dict[str, str] = {
+        callback_name: _merge_clauses(
+            [getattr(error_callbacks, callback_name) for error_callbacks in callbacks]
+        )
+        for callback_name in ErrorCallbacks._fields
+    }
+    custom_impl_helpers = [
+        helper
+        for od_error in od_errors
+        for helper in render_custom_impl_helpers(od_error)
+    ]
+    merged_callbacks["custom_impls"] = (
+        CUSTOM_IMPLS_HEADER + "\n\n\n".join(custom_impl_helpers) + "\n"
+        if custom_impl_helpers
+        else ""
+    )
+
+    return template.format(
+        includes="\n".join(f'-include("{hrl}").' for hrl in includes),
+        **localize_helpers(merged_callbacks, options),
+    )
+
+
+def _render_error_callbacks(
+    od_error: OdError, _group_name: str, options: GenerationOptions
+) -> ErrorCallbacks:
+    # Callbacks do not depend on group (unlike error type modules)
+    return render_error_callbacks(od_error, options)
+
+
+def _merge_clauses(functions: List[str]) -> str:
+    """Merges functions (each ending with period) into one function."""
+    return ";\n\n".join(function.rstrip()[:-1] for function in functions) + "."
@@ -4,11 +4,84 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
-from ..constants import ERRORS_ERL_FILE_PATH
+from typing import List
+
+from ..constants import ERRORS_ERL_FILE_PATH, HTTP_CODE_TO_MACRO
+from ..error_definitions import OdError, OdErrorGroup
+from .options import GenerationOptions
 from .utils import write_to_file
 
+# Module implementing callbacks of all errors in monolith mode
+ERRORS_IMPL_MODULE: str = "od_errors_impl"
+
+MONOLITH_INTERNAL_FUNCTIONS: str = """
+
+%% @private
+-spec get_impl_module(module()) -> module().
+% TODO VFS-12637 - remove below cases after below errors are generated in new format
+get_impl_module(?ERROR_ALREADY_EXISTS_TYPE) -> ?ERROR_ALREADY_EXISTS_TYPE;
+get_impl_module(?ERROR_NOT_FOUND_TYPE) -> ?ERROR_NOT_FOUND_TYPE;
+get_impl_module(?ERROR_NOT_SUPPORTED_TYPE) -> ?ERROR_NOT_SUPPORTED_TYPE;
+get_impl_module(?ERROR_TIMEOUT_TYPE) -> ?ERROR_TIMEOUT_TYPE;
+get_impl_module(_) -> {impl_module}.
+"""
+
+
+def generate_errors_interface_module(
+    template: str,
+    error_groups: List[OdErrorGroup],
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    """Generate errors.erl interface module from template.
+
+    Callbacks are dispatched to error type modules or, in monolith mode,
+    to the module implementing them for all errors.
+    """
+    od_errors = [od_error for group in error_groups for od_error in group.errors]
 
-def generate_errors_interface_module(template: str) -> None:
-    """Generate errors.erl interface module from template."""
-    erl_content = template.format()
+    erl_content = template.format(
+        dispatched_type="_" if options.monolith else "Type",
+        impl_module=ERRORS_IMPL_MODULE if options.monolith else "Type",
+        from_json_impl_module=(
+            "get_impl_module(ErrorType)" if options.monolith else "ErrorType"
+        ),
+        internal_functions=(
+            MONOLITH_INTERNAL_FUNCTIONS.format(impl_module=ERRORS_IMPL_MODULE)
+            if options.monolith
+            else ""
+        ),
+        id_to_type_clauses=_generate_id_to_type_clauses(od_errors),
+        to_http_code_clauses=_generate_to_http_code_clauses(od_errors),
+        to_errno_clauses=_generate_to_errno_clauses(od_errors),
+    )
     write_to_file(ERRORS_ERL_FILE_PATH, erl_content)
+
+
+def _generate_id_to_type_clauses(od_errors: List[OdError]) -> str:
+    return "\n".join(
+        f"id_to_type(?{od_error.get_id_macro()}) -> "
+        f"{{ok, ?{od_error.get_type_macro()}}};"
+        for od_error in od_errors
+    )
+
+
+def _generate_to_http_code_clauses(od_errors: List[OdError]) -> str:
+    """Generate clauses for errors with static http code (others are delegated
+    to their modules)."""
+    return "\n".join(
+        f"to_http_code(?ERR(?{od_error.get_type_macro()})) -> "
+        f"{HTTP_CODE_TO_MACRO[od_error.http_code]};"
+        for od_error in od_errors
+        if isinstance(od_error.http_code, int)
+    )
+
+
+def _generate_to_errno_clauses(od_errors: List[OdError]) -> str:
+    """Generate clauses for errors with static errno (others are delegated
+    to their modules)."""
+    return "\n".join(
+        f"to_errno(?ERR(?{od_error.get_type_macro()})) -> "
+        + (f"{{true, ?{od_error.errno}}};" if od_error.errno else "false;")
+        for od_error in od_errors
+        if not od_error.to_errno_impl
+    )
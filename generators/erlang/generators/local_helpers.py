@@ -0,0 +1,148 @@
+"""
+Local helpers used instead of remote (cross-module) ones in optimized output
+profile.
+
+Remote calls go through export table and can not be inlined by the compiler,
+so in optimized profile calls of frequently used small helpers are replaced
+with calls of their private copies (handling the common case locally and, if
+needed, falling back to remote call otherwise) compiled inline into each
+module. Larger helpers (e.g. od_error:ctx_to_json/1) are not copied - neither
+their duplicates in every module nor a local wrapper calling them would pay
+off.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import re
+import textwrap
+from typing import Dict, List, NamedTuple
+
+from ..constants import INDENT
+from .options import GenerationOptions
+
+OUTPUT_PROFILES: List[str] = ["default", "optimized"]
+
+
+class LocalHelper(NamedTuple):
+    """
+    Local function replacing calls of remote one.
+
+    Attributes:
+        remote_function: Remote function replaced (e.g. "utils:undefined_to_null")
+        name: Name of the local function
+        arity: Arity of both functions
+        definition: Erlang code of the local function
+    """
+
+    remote_function: str
+    name: str
+    arity: int
+    definition: str
+
+    def get_call_regex(self) -> "re.Pattern[str]":
+        return re.compile(rf"(?<![\w@]){re.escape(self.remote_function)}\(")
+
+
+LOCAL_HELPERS: List[LocalHelper] = [
+    LocalHelper(
+        remote_function="utils:undefined_to_null",
+        name="undefined_to_null",
+        arity=1,
+        definition="""\
+%% @private
+-spec undefined_to_null(undefined | Value) -> null | Value.
+undefined_to_null(undefined) -> null;
+undefined_to_null(Value) -> Value.""",
+    ),
+    LocalHelper(
+        remote_function="utils:null_to_undefined",
+        name="null_to_undefined",
+        arity=1,
+        definition="""\
+%% @private
+-spec null_to_undefined(null | Value) -> undefined | Value.
+null_to_undefined(null) -> undefined;
+null_to_undefined(Value) -> Value.""",
+    ),
+    LocalHelper(
+        remote_function="od_error:format_csv",
+        name="format_csv",
+        arity=1,
+        definition="""\
+%% @private
+-spec format_csv([term()]) -> binary().
+format_csv(Values) -> str_utils:join_as_binaries(Values, <<", ">>).""",
+    ),
+    LocalHelper(
+        remote_function="str_utils:to_binary",
+        name="to_binary",
+        arity=1,
+        definition="""\
+%% @private
+-spec to_binary(term()) -> binary().
+to_binary(Bin) when is_binary(Bin) -> Bin;
+to_binary(Term) -> str_utils:to_binary(Term).""",
+    ),
+]
+
+INTERNAL_FUNCTIONS_HEADER: str = """
+
+%%%===================================================================
+%%% Internal functions
+%%%===================================================================
+
+
+"""
+
+
+def localize_helpers(
+    functions: Dict[str, str], options: GenerationOptions
+) -> Dict[str, str]:
+    """Returns module functions along with 'compile_attributes' and
+    'internal_functions' module sections.
+
+    In optimized profile calls of remote helpers in functions are replaced
+    with calls of local helpers (defined in internal functions and compiled
+    inline), otherwise functions are returned as they are and the sections
+    are empty.
+    """
+    if options.output_profile != "optimized":
+        return {**functions, "compile_attributes": "", "internal_functions": ""}
+
+    used_helpers = []
+    functions = dict(functions)
+    for helper in LOCAL_HELPERS:
+        call_regex = helper.get_call_regex()
+        calls_count = 0
+        for name, code in functions.items():
+            functions[name], count = call_regex.subn(f"{helper.name}(", code)
+            calls_count += count
+
+        if calls_count:
+            used_helpers.append(helper)
+
+    if not used_helpers:
+        return {**functions, "compile_attributes": "", "internal_functions": ""}
+
+    return {
+        **functions,
+        "compile_attributes": f"\n{render_inline_attribute(used_helpers)}\n",
+        "internal_functions": (
+            INTERNAL_FUNCTIONS_HEADER
+            + "\n\n\n".join(helper.definition for helper in used_helpers)
+            + "\n"
+        ),
+    }
+
+
+def render_inline_attribute(helpers: List[LocalHelper]) -> str:
+    """Renders attribute instructing compiler to inline given helpers."""
+    inlined = textwrap.fill(
+        ", ".join(f"{helper.name}/{helper.arity}" for helper in helpers),
+        width=80,
+        initial_indent=INDENT,
+        subsequent_indent=INDENT,
+    )
+    return f"-compile({{inline, [\n{inlined}\n]}})."
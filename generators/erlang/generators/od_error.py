@@ -4,12 +4,20 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
+import json
+import os
 import subprocess
 from typing import Dict, List, Tuple, TypedDict
 
-from ..constants import INDENT, OD_ERROR_FILE_PATH
+from ..constants import GENERATOR_SRC_DIR, INDENT, OD_ERROR_FILE_PATH
 from ..error_definitions import OdError, OdErrorGroup
-from .utils import write_to_file
+from ..loaders.definitions_bundle import serialize_error_groups
+from ..loaders.template_loader import Templates
+from .options import GenerationOptions
+from .utils import hash_bytes, hash_file, write_to_file
+
+REVISION_MODES: List[str] = ["git", "content"]
+VERSION_LENGTH: int = 8
 
 
 class GroupTree(TypedDict):
@@ -18,7 +26,7 @@ class GroupTree(TypedDict):
 
 
 def generate_od_error_behaviour(
-    template: str, error_groups: List[OdErrorGroup]
+    template: str, error_groups: List[OdErrorGroup], version: str
 ) -> None:
     """Generate od_error.erl behaviour file from template."""
     error_group_type_specs, error_group_type_exports = _generate_error_group_type_specs(
@@ -26,7 +34,7 @@ def generate_od_error_behaviour(
     )
 
     content = template.format(
-        version=generate_version(),
+        version=version,
         error_group_type_specs="\n\n".join(error_group_type_specs),
         error_group_type_exports=f",\n{INDENT}".join(error_group_type_exports),
     )
@@ -103,6 +111,46 @@ def generate_version() -> str:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
         )
-        return result.stdout.strip()[:8]
+        return result.stdout.strip()[:VERSION_LENGTH]
     except (subprocess.CalledProcessError, subprocess.SubprocessError):
         return "unknown"
+
+
+def generate_content_version(
+    templates: Templates,
+    error_groups: List[OdErrorGroup],
+    options: GenerationOptions,
+) -> str:
+    """Generate version string based on hash of loaded definitions, templates,
+    generator sources (including argument types) and options.
+
+    Unlike commit hash it changes only when generated code may change.
+    """
+    content = json.dumps(
+        {
+            "definitions": serialize_error_groups(error_groups),
+            "templates": templates._asdict(),
+            "sources": _collect_generator_source_hashes(),
+            "options": options._asdict(),
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return hash_bytes(content.encode("utf-8"))[:VERSION_LENGTH]
+
+
+def _collect_generator_source_hashes() -> Dict[str, str]:
+    # Paths are relative to generator package, so that hash does not depend
+    # on working directory
+    source_hashes = {}
+    for parent_dir_path, dir_names, file_names in os.walk(GENERATOR_SRC_DIR):
+        dir_names[:] = [d for d in dir_names if d != "__pycache__"]
+
+        for file_name in file_names:
+            if file_name.endswith(".py"):
+                path = os.path.join(parent_dir_path, file_name)
+                rel_path = os.path.relpath(path, GENERATOR_SRC_DIR)
+                source_hashes[rel_path.replace(os.sep, "/")] = hash_file(path)
+
+    return source_hashes
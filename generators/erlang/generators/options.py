@@ -0,0 +1,39 @@
+"""Options altering generated code."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+from typing import NamedTuple
+
+
+class GenerationOptions(NamedTuple):
+    """
+    Options altering generated code (but not its behaviour).
+
+    Attributes:
+        inline_descriptions: Build error descriptions by binary construction
+            instead of formatting them at runtime (wherever possible)
+        match_details_in_head: Match required details of errors in from_json
+            function head instead of looking them up one by one
+        monolith: Implement callbacks of all errors in a single module instead
+            of a module per error (modules per error only define types)
+        peephole: Optimize code generated for error arguments (see
+            error_args.translation.peephole)
+        output_profile: "default" or "optimized" - in the latter calls of
+            remote helpers are replaced with calls of local ones compiled
+            inline (see local_helpers)
+        revision: How to compute revision embedded in od_error.erl - "git"
+            (current commit) or "content" (hash of everything the generated
+            code depends on)
+        bench: Generate also errors_bench.erl module benchmarking callbacks
+            of every error type
+    """
+
+    inline_descriptions: bool = False
+    match_details_in_head: bool = False
+    monolith: bool = False
+    peephole: bool = True
+    output_profile: str = "default"
+    revision: str = "git"
+    bench: bool = False
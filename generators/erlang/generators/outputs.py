@@ -0,0 +1,64 @@
+"""Generation of all outputs from loaded templates and error definitions."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+from typing import List, Optional
+
+from ..error_definitions import OdErrorGroup
+from ..loaders.template_loader import Templates
+from ..profiling import Profiler, measure
+from .error_types import generate_error_types
+from .errors_bench import generate_errors_bench_module
+from .errors_headers import generate_errors_headers
+from .errors_impl import generate_errors_impl_module
+from .errors_interface import generate_errors_interface_module
+from .od_error import (
+    generate_content_version,
+    generate_od_error_behaviour,
+    generate_version,
+)
+from .options import GenerationOptions
+
+
+def generate_outputs(
+    templates: Templates,
+    error_groups: List[OdErrorGroup],
+    *,
+    jobs: int = 1,
+    profiler: Optional[Profiler] = None,
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    generate_shared_outputs(templates, error_groups, profiler=profiler, options=options)
+    if options.monolith:
+        generate_errors_impl_module(
+            error_groups, templates, jobs=jobs, profiler=profiler, options=options
+        )
+    else:
+        generate_error_types(
+            error_groups, templates.error, jobs=jobs, profiler=profiler, options=options
+        )
+
+
+def generate_shared_outputs(
+    templates: Templates,
+    error_groups: List[OdErrorGroup],
+    *,
+    profiler: Optional[Profiler] = None,
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    """Generate files common for all errors (that is all but error type modules)."""
+    with measure(profiler, "generate_errors_headers"):
+        generate_errors_headers(error_groups, templates)
+    with measure(profiler, "generate_od_error_behaviour"):
+        if options.revision == "content":
+            version = generate_content_version(templates, error_groups, options)
+        else:
+            version = generate_version()
+        generate_od_error_behaviour(templates.od_error, error_groups, version)
+    with measure(profiler, "generate_errors_interface_module"):
+        generate_errors_interface_module(templates.errors_erl, error_groups, options)
+    if options.bench:
+        with measure(profiler, "generate_errors_bench_module"):
+            generate_errors_bench_module(templates.errors_bench, error_groups, options)
@@ -4,8 +4,109 @@ __author__ = "Bartosz Walkowicz"
 __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
+import hashlib
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from ..error_definitions import OdError
+from ..profiling import Profiler
+
+T = TypeVar("T")
+
+# Content hashes of all files written (or found up to date) during current run
+_generated_files: Dict[str, str] = {}
+
 
 def write_to_file(file_path: str, content: str) -> None:
-    """Write content to file with UTF-8 encoding."""
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    """Write content to file with UTF-8 encoding.
+
+    The file is left untouched (along with its mtime) if it already holds
+    exactly the same content.
+    """
+    data = content.encode("utf-8")
+    _generated_files[os.path.normpath(file_path)] = hash_bytes(data)
+
+    if _read_file_bytes(file_path) == data:
+        return
+
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(file_path, "wb") as f:
+        f.write(data)
+
+
+def get_generated_files() -> Dict[str, str]:
+    """Returns paths and content hashes of files generated during current run."""
+    return dict(_generated_files)
+
+
+def reset_generated_files() -> None:
+    _generated_files.clear()
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(file_path: str) -> str:
+    with open(file_path, "rb") as f:
+        return hash_bytes(f.read())
+
+
+def render_in_parallel(
+    render: Callable[[OdError, str], T],
+    od_errors: List[OdError],
+    group_names: List[str],
+    jobs: int = 1,
+    profiler: Optional[Profiler] = None,
+) -> List[T]:
+    """Calls render(od_error, group_name) for each error and returns results
+    in order of errors.
+
+    With jobs > 1 errors are rendered by a pool of that many worker processes
+    (render must be picklable then). Render time of each error is recorded
+    in profiler, if set.
+    """
+    if jobs > 1 and len(od_errors) > 1:
+        chunk_size = max(1, len(od_errors) // (4 * jobs))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            rendered = list(
+                executor.map(
+                    _render_timed,
+                    itertools.repeat(render),
+                    od_errors,
+                    group_names,
+                    chunksize=chunk_size,
+                )
+            )
+    else:
+        rendered = [
+            _render_timed(render, od_error, group_name)
+            for od_error, group_name in zip(od_errors, group_names)
+        ]
+
+    if profiler:
+        for group_name, od_error, (_, render_time) in zip(
+            group_names, od_errors, rendered
+        ):
+            profiler.record_render_time(group_name, od_error, render_time)
+
+    return [result for result, _ in rendered]
+
+
+def _render_timed(
+    render: Callable[[OdError, str], T], od_error: OdError, group_name: str
+) -> Tuple[T, float]:
+    start = time.perf_counter()
+    result = render(od_error, group_name)
+    return result, time.perf_counter() - start
+
+
+def _read_file_bytes(file_path: str) -> Optional[bytes]:
+    try:
+        with open(file_path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
@@ -0,0 +1,100 @@
+"""
+Module responsible for compiling error definitions into a single bundle file
+and loading them back from it.
+
+The bundle holds already validated definitions, so that generating from it
+requires neither walking definitions directory nor parsing YAML files.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import json
+import os
+from typing import Any, Dict, List
+
+from ..error_args.base import ErrorArgType
+from ..error_args.loader import create_error_arg
+from ..error_definitions import MacroRef, OdError, OdErrorCtx, OdErrorGroup
+
+BUNDLE_VERSION: int = 1
+
+
+def save_definitions_bundle(error_groups: List[OdErrorGroup], file_path: str) -> None:
+    """Serializes error groups into bundle file (as compact JSON)."""
+    data = {
+        "version": BUNDLE_VERSION,
+        "groups": serialize_error_groups(error_groups),
+    }
+
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_definitions_bundle(file_path: str) -> List[OdErrorGroup]:
+    """Loads error groups from bundle file created by `save_definitions_bundle`."""
+    with open(file_path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    version = data.get("version") if isinstance(data, dict) else None
+    if version != BUNDLE_VERSION:
+        raise ValueError(
+            f"Unsupported definitions bundle version '{version}' in {file_path}. "
+            f"Expected: {BUNDLE_VERSION} (recompile the bundle)"
+        )
+
+    return [
+        OdErrorGroup(
+            name=group["name"],
+            errors=[_deserialize_error(error_data) for error_data in group["errors"]],
+        )
+        for group in data["groups"]
+    ]
+
+
+def serialize_error_groups(error_groups: List[OdErrorGroup]) -> List[Dict[str, Any]]:
+    """Serializes error groups into JSON compatible form."""
+    return [
+        {
+            "name": group.name,
+            "errors": [_serialize_error(od_error) for od_error in group.errors],
+        }
+        for group in error_groups
+    ]
+
+
+def _serialize_error(od_error: OdError) -> Dict[str, Any]:
+    return {
+        **od_error._asdict(),
+        "args": [_serialize_arg(arg) for arg in od_error.args],
+        "ctx": {
+            "includes": od_error.ctx.includes,
+            "macros": [macro._asdict() for macro in od_error.ctx.macros],
+        },
+    }
+
+
+def _serialize_arg(arg: ErrorArgType) -> Dict[str, Any]:
+    return {
+        "type": arg.type_name(),
+        "name": arg.name,
+        "nullable": arg.nullable,
+        "print_if_null": arg.print_if_null,
+    }
+
+
+def _deserialize_error(error_data: Dict[str, Any]) -> OdError:
+    ctx_data = error_data["ctx"]
+
+    return OdError(
+        **{
+            **error_data,
+            "args": [create_error_arg(arg_data) for arg_data in error_data["args"]],
+            "ctx": OdErrorCtx(
+                includes=ctx_data["includes"],
+                macros=[MacroRef(**macro_data) for macro_data in ctx_data["macros"]],
+            ),
+        }
+    )
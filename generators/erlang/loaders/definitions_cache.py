@@ -0,0 +1,126 @@
+"""Module responsible for caching parsed error definitions between runs."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, NamedTuple, Optional
+
+from ..constants import DEFINITIONS_CACHE_FILE_PATH
+
+CACHE_VERSION: int = 1
+
+
+class CacheEntry(NamedTuple):
+    """
+    Parsed content of a definition file along with data identifying its version.
+
+    Attributes:
+        mtime_ns: Modification time of the file at the time it was parsed
+        size: Size of the file at the time it was parsed
+        content_hash: SHA-256 of the file content
+        data: Parsed content of the file
+    """
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    data: Any
+
+
+class DefinitionsCache:
+    """
+    On-disk cache of parsed definition files keyed by path, mtime, size and
+    content hash.
+
+    If mtime and size of a file did not change its cached content is used
+    right away. Otherwise the file content is hashed and compared with the
+    cached one, so that e.g. fresh checkouts (new mtimes, same content)
+    still hit the cache.
+    """
+
+    def __init__(self, parser_id: str, entries: Dict[str, CacheEntry]) -> None:
+        self.parser_id = parser_id
+        self._entries = entries
+        self._used_entries: Dict[str, CacheEntry] = {}
+        self._modified = False
+
+    @classmethod
+    def load(cls, parser_id: str) -> "DefinitionsCache":
+        """Loads cache saved by previous run (empty one if there is none).
+
+        Cache created with different parser is discarded as parsed data could differ.
+        """
+        try:
+            with open(DEFINITIONS_CACHE_FILE_PATH, "rb") as f:
+                content = pickle.load(f)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Cache is only an optimization - start with empty one if it is
+            # missing or unreadable for whatever reason
+            return cls(parser_id, {})
+
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != CACHE_VERSION
+            or content.get("parser_id") != parser_id
+        ):
+            return cls(parser_id, {})
+
+        return cls(parser_id, content["entries"])
+
+    def get(self, file_path: str) -> Optional[Any]:
+        """Returns cached parsed content of the file if it is still valid."""
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+
+        stat = os.stat(file_path)
+        if (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+            if _hash_file(file_path) != entry.content_hash:
+                return None
+
+            entry = entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            self._modified = True
+
+        self._used_entries[file_path] = entry
+        return entry.data
+
+    def put(self, file_path: str, data: Any) -> None:
+        stat = os.stat(file_path)
+        self._used_entries[file_path] = CacheEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=_hash_file(file_path),
+            data=data,
+        )
+        self._modified = True
+
+    def save(self) -> None:
+        """Saves entries used in current run (if anything changed)."""
+        if not self._modified and self._used_entries.keys() == self._entries.keys():
+            return
+
+        os.makedirs(os.path.dirname(DEFINITIONS_CACHE_FILE_PATH), exist_ok=True)
+        tmp_file_path = f"{DEFINITIONS_CACHE_FILE_PATH}.tmp"
+        with open(tmp_file_path, "wb") as f:
+            pickle.dump(
+                {
+                    "version": CACHE_VERSION,
+                    "parser_id": self.parser_id,
+                    "entries": self._used_entries,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_file_path, DEFINITIONS_CACHE_FILE_PATH)
+
+        self._entries = dict(self._used_entries)
+        self._modified = False
+
+
+def _hash_file(file_path: str) -> str:
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
@@ -5,40 +5,149 @@ __copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
 __license__ = "This software is released under the MIT license cited in LICENSE.txt"
 
 import os
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
 
 import yaml
 
 from ..constants import ERROR_DEFINITIONS_ROOT_DIR, VALID_ERRNO
 from ..error_args.loader import create_error_arg
 from ..error_definitions import MacroRef, OdError, OdErrorCtx, OdErrorGroup
+from ..profiling import Profiler, measure
+from .definitions_bundle import load_definitions_bundle
+from .definitions_cache import DefinitionsCache
+
+# libyaml based loader is much faster - fall back to pure Python one if it is
+# unavailable (PyYAML built without libyaml bindings)
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_PARSER_ID: str = f"{YamlLoader.__name__}-{yaml.__version__}"
+
+
+def load_error_definitions(
+    jobs: int = 1,
+    use_cache: bool = False,
+    from_bundle: Optional[str] = None,
+    profiler: Optional[Profiler] = None,
+) -> List[OdErrorGroup]:
+    """Loads all error definitions groups from definitions directory.
+
+    With jobs > 1 definition files are parsed in parallel by a pool of that
+    many worker processes. The result is the same regardless of jobs count.
+    With use_cache, parsed content of definition files is cached on disk and
+    files that did not change since previous run are not parsed again.
+    With from_bundle, definitions are loaded from given bundle file (see
+    `definitions_bundle`) instead and the other options are irrelevant.
+    """
+    if from_bundle:
+        with measure(profiler, "load_definitions_bundle"):
+            return load_definitions_bundle(from_bundle)
+
+    return build_error_groups(
+        load_error_definitions_by_path(
+            jobs=jobs, use_cache=use_cache, profiler=profiler
+        )
+    )
 
 
-def load_error_definitions() -> List[OdErrorGroup]:
-    """Loads all error definitions groups from definitions directory."""
-    error_groups = [
-        _create_error_group(parent_dir_path, sorted(file_names))
-        for parent_dir_path, _, file_names in os.walk(ERROR_DEFINITIONS_ROOT_DIR)
-        if file_names
-    ]
-    return sorted(error_groups, key=lambda x: x.name)
+def load_error_definitions_by_path(
+    jobs: int = 1, use_cache: bool = False, profiler: Optional[Profiler] = None
+) -> Dict[str, Optional[OdError]]:
+    """Loads all error definitions (None for deprecated ones) keyed by file path."""
+    with measure(profiler, "list_error_definitions"):
+        file_paths = list_error_definition_files()
+
+    with measure(profiler, "read_yaml_files"):
+        yaml_definitions = _read_yaml_files(file_paths, jobs=jobs, use_cache=use_cache)
+
+    with measure(profiler, "create_error_definitions"):
+        return {
+            path: _create_error_definition(path, yaml_data)
+            for path, yaml_data in zip(file_paths, yaml_definitions)
+        }
+
+
+def load_error_definition(yaml_definition_path: str) -> Optional[OdError]:
+    """Loads single error definition (None if it is deprecated)."""
+    yaml_data = _read_yaml_file(yaml_definition_path)
+    return _create_error_definition(yaml_definition_path, yaml_data)
+
+
+def list_error_definition_files() -> List[str]:
+    """Lists all definition files (ordered by group and file name)."""
+    return _sort_by_group(
+        [
+            os.path.join(parent_dir_path, file_name)
+            for parent_dir_path, _, file_names in os.walk(ERROR_DEFINITIONS_ROOT_DIR)
+            for file_name in file_names
+        ]
+    )
 
 
-def _create_error_group(parent_dir_path: str, file_names: List[str]) -> OdErrorGroup:
-    od_errors = []
-    for file_name in file_names:
-        od_error = _load_error_definition(os.path.join(parent_dir_path, file_name))
+def build_error_groups(
+    od_errors_by_path: Dict[str, Optional[OdError]],
+) -> List[OdErrorGroup]:
+    """Groups errors by directories their definitions are located in."""
+    groups: Dict[str, List[OdError]] = {}
+    for path in _sort_by_group(od_errors_by_path):
+        od_errors = groups.setdefault(get_group_name(path), [])
+        od_error = od_errors_by_path[path]
         if od_error:
             od_errors.append(od_error)
 
-    return OdErrorGroup(
-        name=os.path.relpath(parent_dir_path, ERROR_DEFINITIONS_ROOT_DIR),
-        errors=od_errors,
+    return [OdErrorGroup(name=name, errors=errors) for name, errors in groups.items()]
+
+
+def get_group_name(yaml_definition_path: str) -> str:
+    """Returns name of the group error defined in given file belongs to."""
+    return os.path.relpath(
+        os.path.dirname(yaml_definition_path), ERROR_DEFINITIONS_ROOT_DIR
     )
 
 
-def _load_error_definition(yaml_definition_path: str) -> Optional[OdError]:
-    yaml_data = _read_yaml_file(yaml_definition_path)
+def _sort_by_group(file_paths: Iterable[str]) -> List[str]:
+    return sorted(
+        file_paths, key=lambda path: (get_group_name(path), os.path.basename(path))
+    )
+
+
+def _read_yaml_files(
+    file_paths: List[str], *, jobs: int, use_cache: bool
+) -> List[Dict]:
+    cache = DefinitionsCache.load(YAML_PARSER_ID) if use_cache else None
+
+    yaml_definitions = [cache.get(path) if cache else None for path in file_paths]
+    missing_paths = [
+        path for path, data in zip(file_paths, yaml_definitions) if data is None
+    ]
+
+    if jobs > 1 and len(missing_paths) > 1:
+        chunk_size = max(1, len(missing_paths) // (4 * jobs))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # map preserves order of inputs so the result is deterministic
+            parsed = list(
+                executor.map(_read_yaml_file, missing_paths, chunksize=chunk_size)
+            )
+    else:
+        parsed = [_read_yaml_file(path) for path in missing_paths]
+
+    result = []
+    parsed_iter = iter(parsed)
+    for path, data in zip(file_paths, yaml_definitions):
+        if data is None:
+            data = next(parsed_iter)
+            if cache:
+                cache.put(path, data)
+        result.append(data)
+
+    if cache:
+        cache.save()
+
+    return result
+
+
+def _create_error_definition(
+    yaml_definition_path: str, yaml_data: Dict
+) -> Optional[OdError]:
     error_name = _extract_error_name(yaml_definition_path)
     args = [create_error_arg(arg) for arg in yaml_data.get("args", [])]
 
@@ -71,7 +180,7 @@ def _load_error_definition(yaml_definition_path: str) -> Optional[OdError]:
 
 def _read_yaml_file(file_path: str) -> Dict:
     with open(file_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
 def _extract_error_name(file_path: str) -> str:
@@ -12,19 +12,29 @@ from ..constants import TEMPLATES_DIR
 
 class Templates(NamedTuple):
     errors_hrl: str
+    errors_base_hrl: str
+    error_group_hrl: str
     error_attrs_hrl: str
     errors_erl: str
     od_error: str
     error: str
+    error_type: str
+    errors_impl: str
+    errors_bench: str
 
 
 def load_templates() -> Templates:
     return Templates(
         errors_hrl=_read_template("errors.hrl.template"),
+        errors_base_hrl=_read_template("errors_base.hrl.template"),
+        error_group_hrl=_read_template("error_group.hrl.template"),
         error_attrs_hrl=_read_template("error_attrs.hrl.template"),
         errors_erl=_read_template("errors.erl.template"),
         od_error=_read_template("od_error.erl.template"),
         error=_read_template("error.erl.template"),
+        error_type=_read_template("error_type.erl.template"),
+        errors_impl=_read_template("errors_impl.erl.template"),
+        errors_bench=_read_template("errors_bench.erl.template"),
     )
 
 
@@ -0,0 +1,119 @@
+"""
+Manifest of generator inputs and outputs used for incremental regeneration.
+It allows to skip generation altogether when nothing changed and to remove
+only those outputs that are no longer produced.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import json
+import os
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .constants import (
+    ERROR_DEFINITIONS_ROOT_DIR,
+    GENERATOR_SRC_DIR,
+    MANIFEST_FILE_PATH,
+    OUTPUT_DIR,
+    TEMPLATES_DIR,
+)
+from .generators.utils import hash_file
+
+MANIFEST_VERSION: int = 1
+
+# Directories (and extensions of files within them) the generated code depends on
+INPUT_SOURCES: List[Tuple[str, str]] = [
+    (ERROR_DEFINITIONS_ROOT_DIR, ".yaml"),
+    (TEMPLATES_DIR, ".template"),
+    (GENERATOR_SRC_DIR, ".py"),
+]
+
+
+class Manifest(NamedTuple):
+    """
+    Content hashes of generator inputs and outputs.
+
+    Attributes:
+        inputs: Mapping of input file path to its content hash
+        outputs: Mapping of generated file path to its content hash
+    """
+
+    inputs: Dict[str, str]
+    outputs: Dict[str, str]
+
+
+def collect_input_hashes() -> Dict[str, str]:
+    """Hashes all files the generated code depends on."""
+    return {
+        path: hash_file(path)
+        for root_dir, extension in INPUT_SOURCES
+        for path in _walk_files(root_dir, extension)
+    }
+
+
+def load_manifest() -> Optional[Manifest]:
+    """Loads manifest saved by previous run (if any and still readable)."""
+    try:
+        with open(MANIFEST_FILE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("version") != MANIFEST_VERSION:
+        return None
+
+    return Manifest(inputs=data["inputs"], outputs=data["outputs"])
+
+
+def save_manifest(manifest: Manifest) -> None:
+    os.makedirs(os.path.dirname(MANIFEST_FILE_PATH), exist_ok=True)
+    with open(MANIFEST_FILE_PATH, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": MANIFEST_VERSION, **manifest._asdict()},
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def is_up_to_date(manifest: Manifest, inputs: Dict[str, str]) -> bool:
+    """Checks if outputs recorded in manifest are still valid for given inputs."""
+    if manifest.inputs != inputs:
+        return False
+
+    for path, content_hash in manifest.outputs.items():
+        if not os.path.isfile(path) or hash_file(path) != content_hash:
+            return False
+
+    return True
+
+
+def remove_orphaned_outputs(outputs: Dict[str, str]) -> List[str]:
+    """Removes files from output directory that were not generated in current run."""
+    removed = []
+    for path in list(_walk_files(OUTPUT_DIR)):
+        if path not in outputs:
+            os.remove(path)
+            removed.append(path)
+
+    _remove_empty_dirs(OUTPUT_DIR)
+    return removed
+
+
+def _walk_files(root_dir: str, extension: str = "") -> Iterator[str]:
+    for parent_dir_path, dir_names, file_names in os.walk(root_dir):
+        dir_names[:] = sorted(d for d in dir_names if d != "__pycache__")
+
+        for file_name in sorted(file_names):
+            if file_name.endswith(extension):
+                yield os.path.normpath(
+                    os.path.relpath(os.path.join(parent_dir_path, file_name))
+                )
+
+
+def _remove_empty_dirs(root_dir: str) -> None:
+    for parent_dir_path, _, _ in os.walk(root_dir, topdown=False):
+        if parent_dir_path != root_dir and not os.listdir(parent_dir_path):
+            os.rmdir(parent_dir_path)
@@ -0,0 +1,202 @@
+"""
+Instrumentation of the generator. Measures wall time, CPU time and peak RSS
+of generation phases and render time of individual error type modules and,
+optionally, profiles chosen phase with cProfile.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import contextlib
+import cProfile
+import os
+import pstats
+import sys
+import time
+from typing import ContextManager, Iterator, List, NamedTuple, Optional
+
+from .constants import CACHE_DIR, ERROR_DEFINITIONS_ROOT_DIR
+from .error_args.base import ErrorArgType
+from .error_args.snippet_cache import snippet_cache
+from .error_definitions import OdError
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore
+
+PHASES: List[str] = [
+    "load_templates",
+    "load_definitions_bundle",
+    "list_error_definitions",
+    "read_yaml_files",
+    "create_error_definitions",
+    "generate_errors_headers",
+    "generate_od_error_behaviour",
+    "generate_errors_interface_module",
+    "generate_errors_bench_module",
+    "render_error_types",
+    "write_error_types",
+]
+SLOWEST_ERRORS_COUNT: int = 10
+PROFILE_STATS_COUNT: int = 25
+
+
+class PhaseStats(NamedTuple):
+    """
+    Resources used by a single generation phase.
+
+    Attributes:
+        name: Phase name
+        wall_time: Elapsed real time in seconds
+        cpu_time: CPU time (user + system, including finished worker
+            processes) in seconds
+        peak_rss: Peak resident set size of the generator process (as of the
+            end of the phase) in bytes or None if it can not be measured
+    """
+
+    name: str
+    wall_time: float
+    cpu_time: float
+    peak_rss: Optional[int]
+
+
+class ErrorRenderTime(NamedTuple):
+    """
+    Time it took to render module of a single error.
+
+    Attributes:
+        definition_path: Path of the YAML file the error is defined in
+        arg_types: Types of error arguments
+        render_time: Render time in seconds
+    """
+
+    definition_path: str
+    arg_types: List[str]
+    render_time: float
+
+
+class Profiler:
+    """Collects resource usage of generation phases.
+
+    If profiled_phase is given, that phase is additionally run under cProfile
+    and its stats are dumped to file (only the main process is profiled).
+    """
+
+    def __init__(self, profiled_phase: Optional[str] = None) -> None:
+        self.profiled_phase = profiled_phase
+        self.phases: List[PhaseStats] = []
+        self.render_times: List[ErrorRenderTime] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measures resources used by the code executed within the context."""
+        profile = cProfile.Profile() if name == self.profiled_phase else None
+
+        wall_start = time.perf_counter()
+        cpu_start = _get_cpu_time()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            self.phases.append(
+                PhaseStats(
+                    name=name,
+                    wall_time=time.perf_counter() - wall_start,
+                    cpu_time=_get_cpu_time() - cpu_start,
+                    peak_rss=_get_peak_rss(),
+                )
+            )
+            if profile:
+                self._dump_profile(name, profile)
+
+    def record_render_time(
+        self, group_name: str, od_error: OdError, render_time: float
+    ) -> None:
+        self.render_times.append(
+            ErrorRenderTime(
+                definition_path=os.path.join(
+                    ERROR_DEFINITIONS_ROOT_DIR, group_name, f"{od_error.name}.yaml"
+                ),
+                arg_types=[_describe_arg_type(arg) for arg in od_error.args],
+                render_time=render_time,
+            )
+        )
+
+    def print_report(self) -> None:
+        print(f"{'Phase':<34} {'Wall [s]':>10} {'CPU [s]':>10} {'Peak RSS [MiB]':>15}")
+        for stats in self.phases:
+            print(
+                f"{stats.name:<34} {stats.wall_time:>10.4f} {stats.cpu_time:>10.4f} "
+                f"{_format_rss(stats.peak_rss):>15}"
+            )
+        print(
+            f"{'total':<34} {sum(stats.wall_time for stats in self.phases):>10.4f} "
+            f"{sum(stats.cpu_time for stats in self.phases):>10.4f}"
+        )
+
+        cache_stats = snippet_cache.get_stats()
+        if cache_stats.hits or cache_stats.misses:
+            # Stats of worker processes (when run with --jobs) are not included
+            print(
+                f"\nArg snippet cache: {cache_stats.hits} hits, "
+                f"{cache_stats.misses} misses"
+            )
+
+        if self.render_times:
+            print(f"\nSlowest errors to render (of {len(self.render_times)}):")
+            slowest = sorted(
+                self.render_times, key=lambda entry: entry.render_time, reverse=True
+            )
+            for entry in slowest[:SLOWEST_ERRORS_COUNT]:
+                arg_types = ", ".join(entry.arg_types) or "no args"
+                print(
+                    f"{entry.render_time * 1000:>10.3f} ms  "
+                    f"{entry.definition_path} ({arg_types})"
+                )
+
+    def _dump_profile(self, name: str, profile: cProfile.Profile) -> None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        stats_file_path = os.path.join(CACHE_DIR, f"{name}.pstats")
+        profile.dump_stats(stats_file_path)
+
+        print(f"Profile of phase '{name}' saved to '{stats_file_path}'")
+        stats = pstats.Stats(profile, stream=sys.stdout)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_STATS_COUNT)
+
+
+def measure(profiler: Optional[Profiler], name: str) -> ContextManager[None]:
+    """Measures given phase if profiler is set, does nothing otherwise."""
+    if profiler:
+        return profiler.phase(name)
+
+    return contextlib.nullcontext()
+
+
+def _get_cpu_time() -> float:
+    # os.times() is much less precise than process_time() - use it only for
+    # (finished) worker processes
+    times = os.times()
+    return time.process_time() + times.children_user + times.children_system
+
+
+def _get_peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is expressed in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _format_rss(rss: Optional[int]) -> str:
+    return "n/a" if rss is None else f"{rss / 2**20:.1f}"
+
+
+def _describe_arg_type(arg: ErrorArgType) -> str:
+    type_name = arg.type_name()
+    return f"{type_name} (nullable)" if arg.nullable else type_name
@@ -0,0 +1,258 @@
+"""
+Watch mode of the generator. Keeps loaded templates and error definitions
+in memory and, on changes in definitions or templates, regenerates only
+the affected outputs.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+import yaml
+
+from .constants import ERROR_DEFINITIONS_ROOT_DIR, TEMPLATES_DIR
+from .error_definitions import OdError, OdErrorGroup
+from .generators.error_types import (
+    generate_error_type,
+    generate_error_types,
+    get_error_type_file_path,
+)
+from .generators.errors_impl import generate_errors_impl_module
+from .generators.options import GenerationOptions
+from .generators.outputs import generate_shared_outputs
+from .loaders.error_definitions_loader import (
+    build_error_groups,
+    get_group_name,
+    list_error_definition_files,
+    load_error_definition,
+    load_error_definitions_by_path,
+)
+from .loaders.template_loader import Templates, load_templates
+
+DEFAULT_POLL_INTERVAL: float = 0.5
+
+# Templates of outputs generated per error (or, in monolith mode, of module
+# implementing all errors)
+PER_ERROR_TEMPLATES: Set[str] = {"error", "error_type", "errors_impl"}
+
+
+class ErrorSignature(NamedTuple):
+    """Everything shared outputs (headers, od_error.erl, errors.erl and
+    errors_bench.erl) depend on."""
+
+    name: str
+    type: str
+    id: str
+    arg_names: List[str]
+    # Sample args of errors_bench.erl depend on arg types
+    arg_type_names: List[str]
+    includes: List[str]
+    http_code: Union[str, int]
+    errno: Optional[str]
+    has_default_to_errno: bool
+
+
+SharedOutputsSignature = List[Tuple[str, List[ErrorSignature]]]
+
+
+class Watcher:
+    """Polls definitions and templates for changes and regenerates affected outputs."""
+
+    def __init__(
+        self,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_cache: bool = True,
+        options: GenerationOptions = GenerationOptions(),
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.options = options
+        self.templates = load_templates()
+        self.od_errors_by_path = load_error_definitions_by_path(use_cache=use_cache)
+        self.error_groups = build_error_groups(self.od_errors_by_path)
+        self.file_mtimes = _scan_watched_files()
+
+    def run(self) -> None:
+        """Watch for changes until interrupted."""
+        print(
+            f"Watching '{ERROR_DEFINITIONS_ROOT_DIR}' and '{TEMPLATES_DIR}' "
+            "for changes (press Ctrl+C to stop)..."
+        )
+        try:
+            while True:
+                time.sleep(self.poll_interval)
+                self.poll()
+        except KeyboardInterrupt:
+            pass
+
+    def poll(self) -> None:
+        """Check for changes and regenerate affected outputs if there are any."""
+        file_mtimes = _scan_watched_files()
+        changed_paths = {
+            path
+            for path in file_mtimes.keys() | self.file_mtimes.keys()
+            if file_mtimes.get(path) != self.file_mtimes.get(path)
+        }
+        self.file_mtimes = file_mtimes
+
+        if changed_paths:
+            self._handle_changes(changed_paths)
+
+    def _handle_changes(self, changed_paths: Set[str]) -> None:
+        templates_changed = any(
+            path.startswith(TEMPLATES_DIR) for path in changed_paths
+        )
+        definitions_changed = sorted(
+            path for path in changed_paths if not path.startswith(TEMPLATES_DIR)
+        )
+
+        old_templates = self.templates
+        if templates_changed:
+            self.templates = load_templates()
+
+        old_signature = _get_shared_outputs_signature(self.error_groups)
+        updated_paths = [
+            path for path in definitions_changed if self._reload_definition(path)
+        ]
+        self.error_groups = build_error_groups(self.od_errors_by_path)
+
+        if (
+            _shared_templates_changed(old_templates, self.templates)
+            or _get_shared_outputs_signature(self.error_groups) != old_signature
+        ):
+            generate_shared_outputs(
+                self.templates, self.error_groups, options=self.options
+            )
+            print("Regenerated shared outputs")
+
+        if self.options.monolith:
+            # All callbacks are implemented by one module - any change in
+            # definitions affects it
+            if (
+                definitions_changed
+                or old_templates.errors_impl != self.templates.errors_impl
+                or old_templates.error_type != self.templates.error_type
+            ):
+                generate_errors_impl_module(
+                    self.error_groups, self.templates, options=self.options
+                )
+                print("Regenerated errors implementation module")
+            return
+
+        if old_templates.error != self.templates.error:
+            generate_error_types(
+                self.error_groups, self.templates.error, options=self.options
+            )
+            print("Regenerated all error type modules")
+            return
+
+        for path in updated_paths:
+            od_error = self.od_errors_by_path.get(path)
+            if od_error:
+                group_name = get_group_name(path)
+                generate_error_type(
+                    od_error, group_name, self.templates.error, self.options
+                )
+                print(f"Regenerated error type module for '{path}'")
+
+    def _reload_definition(self, path: str) -> bool:
+        """Reloads definition from given path, returns True if error was loaded."""
+        old_od_error = self.od_errors_by_path.get(path)
+
+        new_od_error: Optional[OdError] = None
+        if os.path.exists(path):
+            try:
+                new_od_error = load_error_definition(path)
+            # Invalid YAML, missing or malformed fields, unknown arg types, ...
+            except (
+                yaml.YAMLError,
+                OSError,
+                KeyError,
+                ValueError,
+                TypeError,
+                AttributeError,
+            ) as e:
+                # Keep previous version until the definition is fixed
+                print(f"Failed to load '{path}':\n{e}")
+                return False
+
+            self.od_errors_by_path[path] = new_od_error
+        else:
+            self.od_errors_by_path.pop(path, None)
+
+        if old_od_error and new_od_error is None:
+            _remove_file(get_error_type_file_path(get_group_name(path), old_od_error))
+            print(f"Removed error type module for '{path}'")
+
+        return new_od_error is not None
+
+
+def watch(
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    use_cache: bool = True,
+    options: GenerationOptions = GenerationOptions(),
+) -> None:
+    Watcher(poll_interval=poll_interval, use_cache=use_cache, options=options).run()
+
+
+def _scan_watched_files() -> Dict[str, int]:
+    file_paths = list_error_definition_files() + [
+        os.path.join(TEMPLATES_DIR, file_name)
+        for file_name in sorted(os.listdir(TEMPLATES_DIR))
+    ]
+    file_mtimes = {}
+    for path in file_paths:
+        try:
+            file_mtimes[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            # Removed in the meantime
+            pass
+
+    return file_mtimes
+
+
+def _get_shared_outputs_signature(
+    error_groups: List[OdErrorGroup],
+) -> SharedOutputsSignature:
+    return [
+        (
+            group.name,
+            [
+                ErrorSignature(
+                    name=od_error.name,
+                    type=od_error.type,
+                    id=od_error.id,
+                    arg_names=od_error.get_args_as_erlang_variable_names(),
+                    arg_type_names=[arg.type_name() for arg in od_error.args],
+                    includes=od_error.ctx.includes,
+                    http_code=od_error.http_code,
+                    errno=od_error.errno,
+                    has_default_to_errno=od_error.to_errno_impl is None,
+                )
+                for od_error in group.errors
+            ],
+        )
+        for group in error_groups
+    ]
+
+
+def _shared_templates_changed(
+    old_templates: Templates, new_templates: Templates
+) -> bool:
+    return any(
+        getattr(old_templates, field) != getattr(new_templates, field)
+        for field in Templates._fields
+        if field not in PER_ERROR_TEMPLATES
+    )
+
+
+def _remove_file(file_path: str) -> None:
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
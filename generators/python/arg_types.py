@@ -0,0 +1,79 @@
+"""
+Python representation of error argument types.
+
+Values of arguments are kept in their JSON form, so for each type only the
+way its value is printed in error description (and a sample value used in
+benchmarks) has to be known.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+from typing import Any, Dict, NamedTuple
+
+from ..erlang.error_args.base import ErrorArgType
+
+
+class PyArgType(NamedTuple):
+    """
+    Attributes:
+        print_function: Function of the runtime base module converting JSON
+            value of the argument to text printed in error description
+        sample_json: Sample JSON value of the argument
+    """
+
+    print_function: str
+    sample_json: Any
+
+
+PY_ARG_TYPES: Dict[str, PyArgType] = {
+    "AaiService": PyArgType("print_json", {"type": "op_worker", "id": "providerId"}),
+    "AaiSubject": PyArgType("print_json", {"type": "user", "id": "userId"}),
+    "AtmDataType": PyArgType("print_value", "string"),
+    "AtmDataTypes": PyArgType("print_csv", ["string", "number"]),
+    "AtmStoreTypes": PyArgType("print_csv", ["singleValue", "list"]),
+    "AtmTaskArgumentValueBuilderType": PyArgType("print_value", "const"),
+    "AtmTaskArgumentValueBuilderTypes": PyArgType(
+        "print_csv", ["iteratedItem", "const"]
+    ),
+    "AtmWorkflowSchemaIds": PyArgType(
+        "print_csv", ["workflowSchemaId1", "workflowSchemaId2"]
+    ),
+    "Atom": PyArgType("print_value", "sample"),
+    "Binaries": PyArgType("print_csv", ["value1", "value2"]),
+    "Binary": PyArgType("print_value", "value"),
+    "DnsServers": PyArgType("print_csv", ["system defaults", "8.8.8.8"]),
+    "GriEntityType": PyArgType("print_value", "user"),
+    "Integer": PyArgType("print_value", 42),
+    "InviteTokenType": PyArgType("print_value", "any"),
+    "Json": PyArgType("print_json", {"key": "value"}),
+    "MetricConfig": PyArgType(
+        "print_json", {"resolution": 60, "retention": 1440, "aggregator": "sum"}
+    ),
+    "OnedataError": PyArgType(
+        "print_error", {"id": "sampleError", "description": "Sample error."}
+    ),
+    "Path": PyArgType("print_value", "/space/dir/file"),
+    "ProviderSupportStage": PyArgType("print_value", "active"),
+    "StorageSupportStage": PyArgType("print_value", "active"),
+    "TokenType": PyArgType("print_json", {"identityToken": {}}),
+    "TscLayout": PyArgType("print_tsc_layout", {"timeSeries": ["metric1", "metric2"]}),
+    "UnverifiedCaveat": PyArgType(
+        "print_json", {"type": "time", "validUntil": 1700000000}
+    ),
+}
+
+
+def get_py_arg_type(arg: ErrorArgType) -> PyArgType:
+    """Returns Python representation of type of given argument.
+
+    Types printed in Erlang by dedicated functions (e.g. token types, caveats)
+    are printed as JSON - descriptions rendered for them in Python are only
+    an approximation of Erlang ones.
+    """
+    type_name = arg.type_name()
+    if type_name not in PY_ARG_TYPES:
+        raise ValueError(f"No Python representation of argument type: {type_name}")
+
+    return PY_ARG_TYPES[type_name]
@@ -0,0 +1,200 @@
+"""Rendering of Python classes of errors."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import builtins
+import json
+import keyword
+import re
+from typing import List, Optional
+
+from ..common.descriptions import split_description
+from ..erlang.error_args.base import ErrorArgType
+from ..erlang.error_definitions import OdError
+from .arg_types import get_py_arg_type
+from .constants import INDENT
+
+# Names of attributes and methods of error classes
+RESERVED_ATTRIBUTE_NAMES = {"ctx", "description", "details", "to_json"}
+
+
+def get_class_name(od_error: OdError) -> str:
+    """Returns name of the class of error (e.g. 'LimitReached')."""
+    class_name = "".join(part.capitalize() for part in od_error.name.split("_"))
+    if keyword.iskeyword(class_name) or hasattr(builtins, class_name):
+        return f"{class_name}_"
+
+    return class_name
+
+
+def get_attribute_name(arg: ErrorArgType) -> str:
+    """Returns name of the attribute holding argument (e.g. 'resource_description')."""
+    attribute_name = re.sub(r"(?<!^)(?=[A-Z])", "_", arg.name).lower()
+    if keyword.iskeyword(attribute_name) or attribute_name in RESERVED_ATTRIBUTE_NAMES:
+        return f"{attribute_name}_"
+
+    return attribute_name
+
+
+def has_raw_details(od_error: OdError) -> bool:
+    """Checks if details of error are decoded by custom Erlang code (and so
+    are not known to correspond to its args)."""
+    return od_error.from_json_impl is not None
+
+
+def render_error_class(od_error: OdError, group_name: str) -> str:
+    class_name = get_class_name(od_error)
+    http_code = od_error.http_code if isinstance(od_error.http_code, int) else None
+    errno = json.dumps(od_error.errno) if od_error.errno else None
+
+    if has_raw_details(od_error):
+        base_class = "OnedataErrorWithRawDetails"
+        body = [f"{INDENT}__slots__ = ()"]
+    else:
+        base_class = "OnedataError"
+        attribute_names = [get_attribute_name(arg) for arg in od_error.args]
+        body = [f"{INDENT}__slots__ = {_render_tuple(attribute_names)}"]
+
+    body.extend(
+        [
+            "",
+            f'{INDENT}ID = "{od_error.id}"',
+            f"{INDENT}HTTP_CODE = {http_code}",
+            f"{INDENT}ERRNO = {errno}",
+        ]
+    )
+
+    if not has_raw_details(od_error):
+        body.append(f"{INDENT}FIELDS = {_render_tuple(attribute_names)}")
+        body.extend(_render_init(od_error))
+        body.extend(_render_from_json(od_error))
+        if od_error.args:
+            body.extend(_render_details_to_json(od_error))
+
+    description_expr = _render_description_expression(od_error)
+    if description_expr:
+        body.extend(
+            [
+                "",
+                f"{INDENT}def _format_description(self) -> Optional[str]:",
+                f"{2 * INDENT}return {description_expr}",
+            ]
+        )
+
+    return "\n".join(
+        [
+            "",
+            "",
+            f"class {class_name}({base_class}):",
+            f'{INDENT}"""{od_error.id} error ({group_name})."""',
+            "",
+            *body,
+        ]
+    )
+
+
+def _render_init(od_error: OdError) -> List[str]:
+    params = [f"{get_attribute_name(arg)}: Any" for arg in od_error.args]
+    lines = [
+        "",
+        f"{INDENT}def __init__(",
+        f"{2 * INDENT}self,",
+        *(f"{2 * INDENT}{param}," for param in params),
+        f"{2 * INDENT}*,",
+        f"{2 * INDENT}ctx: Optional[JsonMap] = None,",
+        f"{2 * INDENT}description: Optional[str] = None,",
+        f"{INDENT}) -> None:",
+    ]
+    lines.extend(
+        f"{2 * INDENT}self.{name} = {name}"
+        for name in map(get_attribute_name, od_error.args)
+    )
+    lines.extend(
+        [
+            f"{2 * INDENT}self.ctx = ctx",
+            f"{2 * INDENT}self._description = description",
+        ]
+    )
+    return lines
+
+
+def _render_from_json(od_error: OdError) -> List[str]:
+    lines = [
+        "",
+        f"{INDENT}@classmethod",
+        f"{INDENT}def _from_json(cls, error_json: JsonMap) -> OnedataError:",
+    ]
+    if od_error.args:
+        lines.append(f'{2 * INDENT}details = error_json["details"]')
+
+    lines.append(f"{2 * INDENT}return cls(")
+    for arg in od_error.args:
+        if arg.nullable:
+            lines.append(f'{3 * INDENT}details.get("{arg.name}"),')
+        else:
+            lines.append(f'{3 * INDENT}details["{arg.name}"],')
+
+    lines.extend(
+        [
+            f'{3 * INDENT}ctx=error_json.get("ctx"),',
+            f'{3 * INDENT}description=error_json.get("description"),',
+            f"{2 * INDENT})",
+        ]
+    )
+    return lines
+
+
+def _render_details_to_json(od_error: OdError) -> List[str]:
+    return [
+        "",
+        f"{INDENT}def _details_to_json(self) -> Optional[JsonMap]:",
+        f"{2 * INDENT}return {{",
+        *(
+            f'{3 * INDENT}"{arg.name}": self.{get_attribute_name(arg)},'
+            for arg in od_error.args
+        ),
+        f"{2 * INDENT}}}",
+    ]
+
+
+def _render_description_expression(od_error: OdError) -> Optional[str]:
+    """Returns expression rendering description (None if it can not be
+    rendered outside of Erlang, e.g. it refers to Erlang macros)."""
+    description_parts = split_description(od_error)
+    if description_parts is None:
+        return None
+
+    parts = [
+        (
+            json.dumps(part, ensure_ascii=False)
+            if isinstance(part, str)
+            else _render_print_expression(part)
+        )
+        for part in description_parts
+    ]
+
+    if all(isinstance(part, str) for part in description_parts):
+        # Descriptions without placeholders are not normalized (as in Erlang)
+        return parts[0] if parts else '""'
+
+    concatenation = f"\n{3 * INDENT}+ ".join(parts)
+    return f"normalize_trailing_period(\n{3 * INDENT}{concatenation}\n{2 * INDENT})"
+
+
+def _render_print_expression(arg: ErrorArgType) -> str:
+    value_expr = f"self.{get_attribute_name(arg)}"
+    print_expr = f"{get_py_arg_type(arg).print_function}({value_expr})"
+    if not arg.nullable:
+        return print_expr
+
+    if_null = json.dumps(arg.print_if_null or "null", ensure_ascii=False)
+    return f"({print_expr} if {value_expr} is not None else {if_null})"
+
+
+def _render_tuple(items: List[str]) -> str:
+    if len(items) == 1:
+        return f'("{items[0]}",)'
+
+    return "(" + ", ".join(f'"{item}"' for item in items) + ")"
@@ -0,0 +1,62 @@
+"""Generator of onedata errors for python."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import os
+from typing import List, Optional
+
+from ..common.cli import read_template, run_generator
+from ..erlang.error_definitions import OdErrorGroup
+from ..erlang.generators.utils import write_to_file
+from .constants import INDENT, OUTPUT_DIR, PACKAGE_DIR, TEMPLATES_DIR
+from .error_classes import get_class_name, render_error_class
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    run_generator(
+        prog="python -m generators.python.gen_py",
+        description=(
+            "Generates Python package with classes of onedata errors from their "
+            "definitions."
+        ),
+        output_dir=OUTPUT_DIR,
+        generate=lambda error_groups: generate_package(error_groups, PACKAGE_DIR),
+        argv=argv,
+    )
+
+
+def generate_package(error_groups: List[OdErrorGroup], package_dir: str) -> None:
+    """Generate package with class per error (in errors.py module) and runtime
+    base classes (in _base.py module)."""
+    od_errors = [
+        (group.name, od_error) for group in error_groups for od_error in group.errors
+    ]
+    class_names = [get_class_name(od_error) for _, od_error in od_errors]
+
+    errors_content = read_template(TEMPLATES_DIR, "errors.py.template").format(
+        exports=",\n".join(f'{INDENT}"{name}"' for name in [*class_names, "from_json"]),
+        error_classes="".join(
+            render_error_class(od_error, group_name) + "\n"
+            for group_name, od_error in od_errors
+        ),
+        from_json_functions=",\n".join(
+            f'{INDENT}"{od_error.id}": {class_name}._from_json'
+            for (_, od_error), class_name in zip(od_errors, class_names)
+        ),
+    )
+
+    write_to_file(
+        os.path.join(package_dir, "__init__.py"),
+        read_template(TEMPLATES_DIR, "__init__.py.template"),
+    )
+    write_to_file(
+        os.path.join(package_dir, "_base.py"),
+        read_template(TEMPLATES_DIR, "_base.py.template"),
+    )
+    write_to_file(os.path.join(package_dir, "errors.py"), errors_content)
+
+
+if __name__ == "__main__":
+    main()
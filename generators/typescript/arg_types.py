@@ -0,0 +1,64 @@
+"""
+TypeScript representation of error argument types.
+
+As in the Python target, values of arguments are kept in their JSON form, so
+for each type only its TypeScript type and the way its value is printed in
+error description have to be known.
+"""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+from typing import Dict, NamedTuple
+
+from ..erlang.error_args.base import ErrorArgType
+
+
+class TsArgType(NamedTuple):
+    """
+    Attributes:
+        print_function: Function of the print module converting JSON value of
+            the argument to text printed in error description
+        ts_type: TypeScript type of JSON value of the argument
+    """
+
+    print_function: str
+    ts_type: str
+
+
+TS_ARG_TYPES: Dict[str, TsArgType] = {
+    "AaiService": TsArgType("printJson", "JsonMap"),
+    "AaiSubject": TsArgType("printJson", "JsonMap"),
+    "AtmDataType": TsArgType("printValue", "string"),
+    "AtmDataTypes": TsArgType("printCsv", "string[]"),
+    "AtmStoreTypes": TsArgType("printCsv", "string[]"),
+    "AtmTaskArgumentValueBuilderType": TsArgType("printValue", "string"),
+    "AtmTaskArgumentValueBuilderTypes": TsArgType("printCsv", "string[]"),
+    "AtmWorkflowSchemaIds": TsArgType("printCsv", "string[]"),
+    "Atom": TsArgType("printValue", "string"),
+    "Binaries": TsArgType("printCsv", "string[]"),
+    "Binary": TsArgType("printValue", "string"),
+    "DnsServers": TsArgType("printCsv", "string[]"),
+    "GriEntityType": TsArgType("printValue", "string"),
+    "Integer": TsArgType("printValue", "number"),
+    "InviteTokenType": TsArgType("printValue", "string"),
+    "Json": TsArgType("printJson", "unknown"),
+    "MetricConfig": TsArgType("printJson", "JsonMap"),
+    "OnedataError": TsArgType("printError", "ErrorJson"),
+    "Path": TsArgType("printValue", "string"),
+    "ProviderSupportStage": TsArgType("printValue", "unknown"),
+    "StorageSupportStage": TsArgType("printValue", "unknown"),
+    "TokenType": TsArgType("printJson", "JsonMap"),
+    "TscLayout": TsArgType("printTscLayout", "Record<string, string[]>"),
+    "UnverifiedCaveat": TsArgType("printJson", "JsonMap"),
+}
+
+
+def get_ts_arg_type(arg: ErrorArgType) -> TsArgType:
+    """Returns TypeScript representation of type of given argument."""
+    type_name = arg.type_name()
+    if type_name not in TS_ARG_TYPES:
+        raise ValueError(f"No TypeScript representation of argument type: {type_name}")
+
+    return TS_ARG_TYPES[type_name]
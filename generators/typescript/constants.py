@@ -0,0 +1,18 @@
+"""Constants used in TypeScript code generation."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import os
+from typing import Final
+
+# Directory paths
+TEMPLATES_DIR: Final[str] = os.path.join(os.path.dirname(__file__), "templates")
+
+# Output paths
+OUTPUT_DIR: Final[str] = "generated/typescript"
+GROUPS_DIR_NAME: Final[str] = "groups"
+
+# Formatting
+INDENT: Final[str] = 2 * " "
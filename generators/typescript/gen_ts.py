@@ -0,0 +1,66 @@
+"""Generator of onedata errors for TypeScript (GUI)."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import os
+from typing import List, Optional
+
+from ..common.cli import read_template, run_generator
+from ..erlang.error_definitions import OdErrorGroup
+from ..erlang.generators.utils import write_to_file
+from .constants import INDENT, OUTPUT_DIR, TEMPLATES_DIR
+from .group_modules import get_group_module_path, render_group_module
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    run_generator(
+        prog="python -m generators.typescript.gen_ts",
+        description=(
+            "Generates TypeScript modules rendering descriptions of onedata errors "
+            "from their definitions."
+        ),
+        output_dir=OUTPUT_DIR,
+        generate=lambda error_groups: generate_modules(error_groups, OUTPUT_DIR),
+        argv=argv,
+    )
+
+
+def generate_modules(error_groups: List[OdErrorGroup], output_dir: str) -> None:
+    """Generate index module (mapping error ids to their groups), which is the
+    only one GUI has to load eagerly, and module per group of errors imported
+    by index lazily (so that every group lands in its own chunk)."""
+    groups = [group for group in error_groups if group.errors]
+
+    group_template = read_template(TEMPLATES_DIR, "group.ts.template")
+    for group in groups:
+        write_to_file(
+            os.path.join(output_dir, f"{get_group_module_path(group)}.ts"),
+            render_group_module(group_template, group),
+        )
+
+    index_content = read_template(TEMPLATES_DIR, "index.ts.template").format(
+        group_loaders="\n".join(
+            f"{INDENT}() => import("
+            f'/* webpackChunkName: "errors-{group.name.replace("/", "-")}" */ '
+            f'"./{get_group_module_path(group)}"),'
+            for group in groups
+        ),
+        error_groups="\n".join(
+            f'{INDENT}"{od_error.id}": {group_index},'
+            for group_index, group in enumerate(groups)
+            for od_error in group.errors
+        ),
+    )
+
+    write_to_file(os.path.join(output_dir, "index.ts"), index_content)
+    for module_name in ("print", "types"):
+        write_to_file(
+            os.path.join(output_dir, f"{module_name}.ts"),
+            read_template(TEMPLATES_DIR, f"{module_name}.ts.template"),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Rendering of TypeScript modules of error groups."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import json
+import posixpath
+from typing import NamedTuple, Optional, Set
+
+from ..common.descriptions import split_description
+from ..erlang.error_args.base import ErrorArgType
+from ..erlang.error_definitions import OdError, OdErrorGroup
+from .arg_types import get_ts_arg_type
+from .constants import GROUPS_DIR_NAME, INDENT
+
+
+class RenderedErrorSpec(NamedTuple):
+    """
+    Attributes:
+        details_interface: Declaration of interface of decoded details (None if
+            details are not decoded)
+        entry: Entry of the `errors` map of group module
+        print_functions: Functions of the print module used by the entry
+        types: Types of the types module used by the entry and interface
+    """
+
+    details_interface: Optional[str]
+    entry: str
+    print_functions: Set[str]
+    types: Set[str]
+
+
+def get_group_module_path(group: OdErrorGroup) -> str:
+    """Returns path of group module (e.g. 'groups/op_worker/atm') relative to
+    output directory and without extension."""
+    return posixpath.join(GROUPS_DIR_NAME, group.name)
+
+
+def get_interface_name(od_error: OdError) -> str:
+    """Returns name of the interface of error details (e.g. 'LimitReachedDetails')."""
+    return "".join(part.capitalize() for part in od_error.name.split("_")) + "Details"
+
+
+def has_raw_details(od_error: OdError) -> bool:
+    """Checks if details of error are decoded by custom Erlang code (and so
+    are not known to correspond to its args)."""
+    return od_error.from_json_impl is not None
+
+
+def render_group_module(template: str, group: OdErrorGroup) -> str:
+    specs = [_render_error_spec(od_error) for od_error in group.errors]
+
+    print_functions = sorted(set().union(*(spec.print_functions for spec in specs)))
+    types = sorted({"ErrorSpec"}.union(*(spec.types for spec in specs)))
+    module_dir = posixpath.dirname(get_group_module_path(group))
+
+    print_import = ""
+    if print_functions:
+        print_module = posixpath.relpath("print", module_dir)
+        print_import = (
+            f'import {{ {", ".join(print_functions)} }} from "{print_module}";\n'
+        )
+
+    return template.format(
+        group_name=group.name,
+        type_imports=", ".join(types),
+        types_module=posixpath.relpath("types", module_dir),
+        print_import=print_import,
+        details_interfaces="".join(
+            f"{spec.details_interface}\n\n" for spec in specs if spec.details_interface
+        ),
+        error_specs="\n".join(spec.entry for spec in specs),
+    )
+
+
+def _render_error_spec(od_error: OdError) -> RenderedErrorSpec:
+    print_functions: Set[str] = set()
+    types: Set[str] = set()
+
+    details_interface = None
+    members = []
+    if od_error.args and not has_raw_details(od_error):
+        details_interface = _render_details_interface(od_error, types)
+        members.append(
+            _render_decode_details_function(od_error, get_interface_name(od_error))
+        )
+
+    description_expr = _render_description_expression(od_error, print_functions, types)
+    if description_expr is not None:
+        params = "details: JsonMap" if print_functions else ""
+        members.append(
+            f"{2 * INDENT}renderDescription: ({params}): string =>\n"
+            f"{3 * INDENT}{description_expr},"
+        )
+
+    if members:
+        types.add("JsonMap")
+        entry = "\n".join([f'{INDENT}"{od_error.id}": {{', *members, f"{INDENT}}},"])
+    else:
+        entry = f'{INDENT}"{od_error.id}": {{}},'
+
+    return RenderedErrorSpec(details_interface, entry, print_functions, types)
+
+
+def _render_details_interface(od_error: OdError, types: Set[str]) -> str:
+    fields = []
+    for arg in od_error.args:
+        ts_type = _use_ts_type(arg, types)
+        if arg.nullable and ts_type != "unknown":
+            ts_type = f"{ts_type} | null"
+        fields.append(f"{INDENT}{arg.name}: {ts_type};")
+
+    return "\n".join(
+        [f"export interface {get_interface_name(od_error)} {{", *fields, "}"]
+    )
+
+
+def _render_decode_details_function(od_error: OdError, interface_name: str) -> str:
+    fields = []
+    for arg in od_error.args:
+        value_expr = f'details["{arg.name}"]'
+        if arg.nullable:
+            value_expr = f"{value_expr} ?? null"
+        fields.append(f"{4 * INDENT}{arg.name}: {value_expr},")
+
+    return "\n".join(
+        [
+            f"{2 * INDENT}decodeDetails: (details: JsonMap): {interface_name} =>",
+            f"{3 * INDENT}({{",
+            *fields,
+            f"{3 * INDENT}}}) as {interface_name},",
+        ]
+    )
+
+
+def _render_description_expression(
+    od_error: OdError, print_functions: Set[str], types: Set[str]
+) -> Optional[str]:
+    """Returns expression rendering description (None if it can not be
+    rendered outside of Erlang, e.g. it refers to Erlang macros)."""
+    description_parts = split_description(od_error)
+    if description_parts is None:
+        return None
+
+    used_print_functions: Set[str] = set()
+    used_types: Set[str] = set()
+    parts = [
+        (
+            json.dumps(part, ensure_ascii=False)
+            if isinstance(part, str)
+            else _render_print_expression(part, used_print_functions, used_types)
+        )
+        for part in description_parts
+    ]
+
+    if all(isinstance(part, str) for part in description_parts):
+        # Descriptions without placeholders are not normalized (as in Erlang)
+        return parts[0] if parts else '""'
+
+    print_functions.update(used_print_functions, {"normalizeTrailingPeriod"})
+    types.update(used_types)
+    concatenation = f" +\n{4 * INDENT}".join(parts)
+    return f"normalizeTrailingPeriod(\n{4 * INDENT}{concatenation},\n{3 * INDENT})"
+
+
+def _render_print_expression(
+    arg: ErrorArgType, print_functions: Set[str], types: Set[str]
+) -> str:
+    print_function = get_ts_arg_type(arg).print_function
+    print_functions.add(print_function)
+
+    value_expr = f'details["{arg.name}"]'
+    print_expr = f"{print_function}({value_expr} as {_use_ts_type(arg, types)})"
+    if not arg.nullable:
+        return print_expr
+
+    if_null = json.dumps(arg.print_if_null or "null", ensure_ascii=False)
+    return f"({value_expr} == null ? {if_null} : {print_expr})"
+
+
+def _use_ts_type(arg: ErrorArgType, types: Set[str]) -> str:
+    """Returns TypeScript type of argument noting it among used types if it
+    is defined in the types module."""
+    ts_type = get_ts_arg_type(arg).ts_type
+    if ts_type in ("ErrorJson", "JsonMap"):
+        types.add(ts_type)
+
+    return ts_type
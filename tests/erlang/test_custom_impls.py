@@ -0,0 +1,66 @@
+"""Tests of custom callback implementations in monolith mode."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+from generators.erlang.error_definitions import OdError, OdErrorCtx
+from generators.erlang.generators.error_types import (
+    render_custom_impl_helpers,
+    render_error_callbacks,
+)
+from generators.erlang.generators.options import GenerationOptions
+
+TO_ERRNO_IMPL: str = """\
+-spec to_errno(t()) -> {true, od_error:errno()}.
+to_errno(?ERR_CUSTOM(<<"a\\\\">>, $", "b\\"", $\\\\)) ->
+    {true, ?EINVAL};
+% Fallback
+to_errno(_) ->
+    false.
+"""
+
+
+def test_custom_clauses_are_called_only_for_their_error() -> None:
+    od_error = _build_od_error(to_errno_impl=TO_ERRNO_IMPL)
+
+    callbacks = render_error_callbacks(od_error, GenerationOptions(monolith=True))
+
+    assert callbacks.to_errno == (
+        "to_errno(Error = ?ERR(?ERR_CUSTOM_TYPE)) ->\n    to_errno_custom(Error)."
+    )
+
+
+def test_custom_clauses_are_copied_unchanged_apart_from_name() -> None:
+    od_error = _build_od_error(to_errno_impl=TO_ERRNO_IMPL)
+
+    assert render_custom_impl_helpers(od_error) == [
+        "%% @private\n"
+        + TO_ERRNO_IMPL.split("\n", 1)[1]
+        .replace("to_errno(", "to_errno_custom(")
+        .strip()
+    ]
+
+
+def test_custom_clauses_are_not_changed_outside_monolith() -> None:
+    od_error = _build_od_error(to_errno_impl=TO_ERRNO_IMPL)
+
+    callbacks = render_error_callbacks(od_error, GenerationOptions())
+
+    assert callbacks.to_errno == TO_ERRNO_IMPL.strip()
+
+
+def _build_od_error(to_errno_impl: str) -> OdError:
+    return OdError(
+        name="custom",
+        type="od_error_custom",
+        id="custom",
+        description="Custom error.",
+        http_code=400,
+        args=[],
+        ctx=OdErrorCtx(includes=[], macros=[]),
+        to_json_impl=None,
+        from_json_impl=None,
+        errno=None,
+        to_errno_impl=to_errno_impl,
+    )
@@ -0,0 +1,92 @@
+"""Tests of memoization of code snippets generated for error arguments."""
+
+__author__ = "Bartosz Walkowicz"
+__copyright__ = "Copyright (C) 2024 ACK CYFRONET AGH"
+__license__ = "This software is released under the MIT license cited in LICENSE.txt"
+
+import os
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from benchmarks.erlang.corpus import build_corpus
+from generators.erlang.constants import ERROR_DEFINITIONS_ROOT_DIR
+from generators.erlang.error_args.snippet_cache import snippet_cache
+from generators.erlang.error_definitions import OdError
+from generators.erlang.generators.error_types import render_error_type
+from generators.erlang.generators.options import GenerationOptions
+from generators.erlang.loaders.error_definitions_loader import load_error_definitions
+from generators.erlang.loaders.template_loader import load_templates
+
+REPO_ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+# Enough for synthetic errors to use every arg type in every variant
+SYNTHETIC_ERROR_COUNT: int = 500
+
+
+@pytest.fixture(name="od_errors", scope="module")
+def od_errors_fixture(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> List[Tuple[str, OdError]]:
+    cwd = os.getcwd()
+    try:
+        # Paths used by the generator are relative to the working directory
+        os.chdir(REPO_ROOT_DIR)
+        od_errors = _load_errors()
+
+        os.chdir(tmp_path_factory.mktemp("corpus"))
+        build_corpus(ERROR_DEFINITIONS_ROOT_DIR, SYNTHETIC_ERROR_COUNT)
+        od_errors.extend(_load_errors())
+    finally:
+        os.chdir(cwd)
+
+    return od_errors
+
+
+@pytest.fixture(autouse=True)
+def restore_snippet_cache() -> Iterator[None]:
+    yield
+    snippet_cache.enabled = True
+    snippet_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        GenerationOptions(),
+        GenerationOptions(peephole=False),
+        GenerationOptions(inline_descriptions=True, match_details_in_head=True),
+        GenerationOptions(monolith=True, output_profile="optimized"),
+    ],
+)
+def test_snippet_cache_does_not_change_generated_code(
+    od_errors: List[Tuple[str, OdError]], options: GenerationOptions
+) -> None:
+    template = load_templates().error
+
+    snippet_cache.enabled = False
+    uncached_modules = _render_all(od_errors, template, options)
+
+    snippet_cache.enabled = True
+    snippet_cache.clear()
+    cached_modules = _render_all(od_errors, template, options)
+
+    assert snippet_cache.get_stats().hits > 0
+    assert cached_modules == uncached_modules
+
+
+def _load_errors() -> List[Tuple[str, OdError]]:
+    return [
+        (group.name, od_error)
+        for group in load_error_definitions()
+        for od_error in group.errors
+    ]
+
+
+def _render_all(
+    od_errors: List[Tuple[str, OdError]], template: str, options: GenerationOptions
+) -> List[str]:
+    return [
+        render_error_type(od_error, group_name, template, options)
+        for group_name, od_error in od_errors
+    ]